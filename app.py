@@ -10,9 +10,9 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent))
 
 from src.config.settings import APP_TITLE, APP_ICON, PAGE_LAYOUT
-from src.utils.data_loader import load_fighters_data, load_events_data
-from src.utils.search import FighterSearch
-from src.pages import home, fighter_search, events, compare, rankings
+from src.components.figure_cache import FIGURE_CACHE
+from src.utils.data_store import DataStore
+from src import pages  # Each page module is imported when first routed to
 
 # Page configuration
 st.set_page_config(
@@ -62,12 +62,11 @@ st.markdown("""
 @st.cache_resource
 def initialize_app():
     """Initialize application and load data"""
-    fighters_df = load_fighters_data()
-    events_df = load_events_data()
-    search_engine = FighterSearch(fighters_df)
-    return fighters_df, events_df, search_engine
+    return DataStore()
 
-fighters_df, events_df, search_engine = initialize_app()
+# One snapshot per run, so every page sees the same data version
+data = initialize_app().current()
+fighters_df, events_df = data.fighters_df, data.events_df
 
 # Sidebar
 with st.sidebar:
@@ -85,12 +84,15 @@ with st.sidebar:
         - ⚔️ Head-to-head comparisons
         - 🏆 Comprehensive rankings
         - 📅 Event-level insights
+        - 📈 Trends over time
         - 🔍 Smart search with AI-powered matching
         
         **Data:**
         - **Fighters:** {len(fighters_df):,}
         - **Events:** {events_df['Event Name'].nunique():,}
         - **Total Fights:** {len(events_df):,}
+        - **Data Version:** {data.version}
+        - **Chart Cache:** {FIGURE_CACHE.hit_rate():.0%} hits
         
         **Search Capabilities:**
         - ✅ First name matching
@@ -124,11 +126,20 @@ with st.sidebar:
         - Side-by-side stats
         - Visual comparisons
         - Record analysis
+        - Head-to-head, common opponents and win chains
         
         **5. Rankings**
         - Most wins
         - Best win rates
         - Most active fighters
+        - Elo ratings from UFC results
+        - Career stat leaders
+        - Filter by weight class and stance
+        
+        **6. Trends**
+        - Finish and decision rates by year or quarter
+        - Rounds, knockdowns and card sizes over time
+        - Filter by weight class
         """)
     
     # How to Use
@@ -164,21 +175,24 @@ with st.sidebar:
     
     page = st.radio(
         "Select a page:",
-        ["🏠 Home", "🔍 Fighter Search", "📅 Events", "⚔️ Compare", "🏆 Rankings"],
+        ["🏠 Home", "🔍 Fighter Search", "📅 Events", "⚔️ Compare", "🏆 Rankings", "📈 Trends"],
         label_visibility="collapsed"
     )
 
 # Route to pages
 if page == "🏠 Home":
-    home.render(fighters_df, events_df)
+    pages.home.render(data.aggregates.home)
 elif page == "🔍 Fighter Search":
-    fighter_search.render(fighters_df, search_engine)
+    pages.fighter_search.render(fighters_df, data.search_engine, data.fighter_index, data.similarity,
+                               data.career_stats)
 elif page == "📅 Events":
-    events.render(events_df)
+    pages.events.render(data.event_index, data.aggregates)
 elif page == "⚔️ Compare":
-    compare.render(fighters_df)
+    pages.compare.render(fighters_df, data.fighter_index, data.fight_graph, data.similarity)
+elif page == "🏆 Rankings":
+    pages.rankings.render(fighters_df, data.elo_ratings, data.leaderboards, data.career_stats)
 else:
-    rankings.render(fighters_df)
+    pages.trends.render(data.trends, data.version)
 
 # Footer
 st.markdown("---")
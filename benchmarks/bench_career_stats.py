@@ -0,0 +1,73 @@
+"""
+Career stats: CareerStats build and incremental append vs per-fighter computation
+
+For each scale, times the one-groupby build over every bout, the append of
+a small batch of new bouts (as a DataStore refresh does) against a full
+rebuild, and a card's lookup of one fighter's row against recomputing
+that fighter's stats from their bout rows. The appended table is checked
+against the rebuild.
+
+Usage: python benchmarks/bench_career_stats.py [max_scale] [new_bouts]
+"""
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+from benchmarks.synthetic import write_synthetic_csvs
+from src.utils.career_stats import CareerStats, career_totals, fighter_id_sides
+from src.utils.data_loader import load_fighters_data, load_events_data
+from src.utils.fighter_index import FighterIndex
+
+N_LOOKUPS = 200
+
+
+def best_ms(fn, repeat=3):
+    """Best wall time of fn() in milliseconds, and its result"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000, result
+
+
+def per_fighter(fighter_index, fighter_id):
+    """One fighter's totals from their own bout rows, what a card would do without the store"""
+    rows = fighter_index.fight_rows(fighter_id)
+    sides = fighter_id_sides(fighter_index.events_df.iloc[rows], fighter_index.fighter1_ids[rows],
+                             fighter_index.fighter2_ids[rows])
+    return career_totals(sides).reindex([fighter_id], fill_value=0).iloc[0]
+
+
+def main(max_scale=10, new_bouts=100):
+    print(f"append of {new_bouts} bouts; lookups averaged over {N_LOOKUPS} fighters")
+    print(f"{'scale':>6}{'bouts':>10}{'build ms':>10}{'append ms':>11}{'lookup ms':>11}{'recompute ms':>14}")
+    for scale in [scale for scale in (1, 10, 100) if scale <= max_scale]:
+        with tempfile.TemporaryDirectory() as tmp:
+            fighters_csv, events_csv = write_synthetic_csvs(tmp, scale)
+            fighters_df = load_fighters_data(fighters_csv, use_cache=False)
+            events_df = load_events_data(events_csv, use_cache=False)
+        
+        fighter_index = FighterIndex(fighters_df, events_df)
+        build_ms, full = best_ms(lambda: CareerStats.build(fighter_index))
+        
+        head = FighterIndex(fighters_df, events_df.iloc[:-new_bouts])
+        before = CareerStats.build(head)
+        extended = head.appended(events_df)
+        append_ms, appended = best_ms(lambda: before.appended(extended))
+        pd.testing.assert_frame_equal(appended.table, CareerStats.build(extended).table)
+        
+        ids = np.random.default_rng(0).integers(len(fighters_df), size=N_LOOKUPS).tolist()
+        lookup_ms, _ = best_ms(lambda: [full.row(fighter_id) for fighter_id in ids])
+        recompute_ms, _ = best_ms(lambda: [per_fighter(fighter_index, fighter_id) for fighter_id in ids], repeat=1)
+        print(f"{scale:>6}{len(events_df):>10,}{build_ms:>10.1f}{append_ms:>11.1f}"
+              f"{lookup_ms / N_LOOKUPS:>11.3f}{recompute_ms / N_LOOKUPS:>14.3f}")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
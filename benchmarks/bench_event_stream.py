@@ -0,0 +1,74 @@
+"""
+Streaming vs in-memory events ingestion: time, peak memory and identical totals
+
+Each mode runs in a fresh interpreter so its peak RSS is its own.
+
+Usage: python benchmarks/bench_event_stream.py [scale] [chunksize]
+"""
+from pathlib import Path
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+from benchmarks.synthetic import write_synthetic_csvs
+from src.utils.data_loader import load_events_data
+from src.utils.event_stream import EventAggregates, stream_event_aggregates
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process; ru_maxrss would include a Linux parent's peak"""
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_mode(mode, events_csv, chunksize, out_dir):
+    """Aggregate one way, save the totals and print time / peak RSS as JSON"""
+    start = time.perf_counter()
+    if mode == 'stream':
+        aggregates = stream_event_aggregates(events_csv, chunksize)
+    else:
+        aggregates = EventAggregates.from_frame(load_events_data(events_csv, use_cache=False))
+    seconds = time.perf_counter() - start
+    aggregates.event_totals().to_pickle(Path(out_dir) / f'{mode}-events.pkl')
+    aggregates.fighter_totals().to_pickle(Path(out_dir) / f'{mode}-fighters.pkl')
+    print(json.dumps({'seconds': seconds, 'peak_mb': peak_rss_mb(),
+                      'rows': aggregates.n_rows, 'chunks': aggregates.n_chunks}))
+
+
+def main(scale=100, chunksize=50_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        _, events_csv = write_synthetic_csvs(tmp, scale)
+        size_mb = Path(events_csv).stat().st_size / 1e6
+        print(f"x{scale}: events CSV {size_mb:.0f} MB, chunks of {chunksize:,} rows")
+        for mode in ['memory', 'stream']:
+            completed = subprocess.run(
+                [sys.executable, __file__, '--mode', mode, str(events_csv), str(chunksize), tmp],
+                capture_output=True, text=True, check=True
+            )
+            stats = json.loads(completed.stdout.strip().splitlines()[-1])
+            print(f"{mode:7s} rows={stats['rows']:>10,}  chunks={stats['chunks']:>5}  "
+                  f"{stats['seconds']:7.2f} s  peak RSS {stats['peak_mb']:8.0f} MB")
+        for kind in ['events', 'fighters']:
+            pd.testing.assert_frame_equal(pd.read_pickle(Path(tmp) / f'stream-{kind}.pkl'),
+                                          pd.read_pickle(Path(tmp) / f'memory-{kind}.pkl'), check_exact=True)
+        print("Streaming totals identical to the in-memory path")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--mode':
+        run_mode(sys.argv[2], sys.argv[3], int(sys.argv[4]), sys.argv[5])
+    else:
+        args = [int(arg) for arg in sys.argv[1:3]]
+        main(*args)
@@ -0,0 +1,48 @@
+"""
+Fight graph benchmark: build time and per-query latency on a synthetic graph
+
+Usage: python benchmarks/bench_fight_graph.py [n_fights] [n_fighters]
+"""
+from pathlib import Path
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+from benchmarks.synthetic import synthetic_history
+from src.utils.fight_graph import FightGraph
+
+
+def query_times(query, pairs):
+    """Per-call wall times in milliseconds"""
+    timings = []
+    for a, b in pairs:
+        start = time.perf_counter()
+        query(a, b)
+        timings.append((time.perf_counter() - start) * 1000)
+    return np.array(timings)
+
+
+def main(n_fights=2_000_000, n_fighters=200_000):
+    side1, side2, score, _ = synthetic_history(n_fights, n_fighters)
+    start = time.perf_counter()
+    graph = FightGraph(side1, side2, score, n_fighters)
+    print(f"Build: {n_fights:,} fights, {n_fighters:,} fighters in {time.perf_counter() - start:.2f} s")
+    
+    rng = np.random.default_rng(2)
+    pairs = rng.integers(0, n_fighters, (200, 2)).tolist()
+    for label, query in [('head_to_head', graph.head_to_head),
+                         ('common_opponents', graph.common_opponents),
+                         ('win_path', graph.win_path)]:
+        timings = query_times(query, pairs)
+        print(f"{label:17s} median={np.median(timings):7.3f} ms  p95={np.percentile(timings, 95):7.3f} ms  "
+              f"max={timings.max():7.3f} ms")
+    
+    lengths = [len(path) - 1 for path in map(lambda pair: graph.win_path(*pair), pairs) if path]
+    print(f"Win chains found for {len(lengths)}/{len(pairs)} pairs, mean length {np.mean(lengths):.1f}")
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,75 @@
+"""
+Figure cache: fighter card and comparison charts built vs served from FIGURE_CACHE
+
+Replays a search session (every prefix of each query renders up to ten
+fighter cards, like the search page on each keystroke) and a run of
+comparisons, with and without the cache. Timings include the
+serialization st.plotly_chart does for either path.
+
+Usage: python benchmarks/bench_figure_cache.py [queries]
+"""
+from pathlib import Path
+import sys
+import time
+
+import numpy as np
+import plotly.io as pio
+
+sys.path.append(str(Path(__file__).parent.parent))
+from benchmarks.synthetic import search_queries
+from src.components.figure_cache import FigureCache
+from src.components.ui_components import record_chart
+from src.pages.compare import _comparison_chart
+from src.utils.data_loader import load_fighters_data
+from src.utils.search import FighterSearch
+
+
+def render(fig):
+    """What st.plotly_chart does with a figure before sending it"""
+    return pio.to_json(fig.to_dict(), validate=False)
+
+
+def main(n_queries=20):
+    fighters_df = load_fighters_data()
+    version = fighters_df.attrs.get('data_version')
+    search_engine = FighterSearch(fighters_df)
+    queries = search_queries(fighters_df, n_queries)['partial']
+    keystrokes = [query[:i] for query in queries for i in range(2, len(query) + 1)]
+    cards = [position for query in keystrokes
+             for position in fighters_df.index.get_indexer(search_engine.search(query).index).tolist()]
+    rng = np.random.default_rng(0)
+    pairs = [tuple(pair) for pair in rng.integers(len(fighters_df), size=(20, 2)).tolist()] * 5
+    
+    def timed(figures, items):
+        """Milliseconds per item of rendering each item's figure"""
+        start = time.perf_counter()
+        for item in items:
+            render(figures(item))
+        return (time.perf_counter() - start) / len(items) * 1000
+    
+    def card(position):
+        return record_chart(fighters_df.iloc[position])
+    
+    def comparison(pair):
+        f1, f2 = fighters_df.iloc[pair[0]], fighters_df.iloc[pair[1]]
+        return _comparison_chart(f1, f2, f1['Full Name'], f2['Full Name'])
+    
+    cache = FigureCache()
+    print(f"{len(keystrokes)} keystrokes rendering {len(cards)} fighter cards; {len(pairs)} comparisons")
+    print(f"{'figure':<14}{'uncached ms':>12}{'first pass':>12}{'hit rate':>10}{'warm ms':>10}")
+    for kind, build, items in [('fighter_card', card, cards), ('compare', comparison, pairs)]:
+        def cached(item):
+            return cache.figure(kind, item, version, lambda: build(item))
+        uncached_ms = timed(build, items)
+        before = cache.cache_info()
+        first_ms = timed(cached, items)
+        after = cache.cache_info()
+        warm_ms = timed(cached, items)
+        hit_rate = (after.hits - before.hits) / len(items)
+        print(f"{kind:<14}{uncached_ms:>12.2f}{first_ms:>12.2f}{hit_rate:>10.0%}{warm_ms:>10.2f}")
+    print(f"build times: {cache.build_times()}")
+    print(f"cache: {cache.cache_info()}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
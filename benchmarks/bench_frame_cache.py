@@ -0,0 +1,45 @@
+"""
+Cold-start benchmark: CSV parsing vs the on-disk frame cache
+
+Usage: python benchmarks/bench_frame_cache.py [scale]
+"""
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+sys.path.append(str(Path(__file__).parent.parent))
+from benchmarks.synthetic import write_synthetic_csvs
+from src.utils import data_loader
+from src.utils.frame_cache import HAS_ARROW
+
+
+def best_of(fn, repeat=3):
+    """Fastest wall time of fn over `repeat` runs"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(scale=100):
+    with tempfile.TemporaryDirectory() as tmp:
+        fighters_csv, events_csv = write_synthetic_csvs(tmp, scale)
+        data_loader.FRAME_CACHE_DIR = Path(tmp) / "cache"
+        load_fighters = data_loader.load_fighters_data
+        load_events = data_loader.load_events_data
+        
+        print(f"Scale x{scale}, cache format: {'feather' if HAS_ARROW else 'npy'}")
+        for label, load, csv_path in [('fighters', load_fighters, fighters_csv),
+                                      ('events', load_events, events_csv)]:
+            load(csv_path)  # Populate the cache
+            csv_time = best_of(lambda: load(csv_path, use_cache=False))
+            cache_time = best_of(lambda: load(csv_path))
+            print(f"{label:9s} rows={len(load(csv_path)):>9,}  csv={csv_time * 1000:8.1f} ms  "
+                  f"cache={cache_time * 1000:8.1f} ms  speedup={csv_time / cache_time:5.1f}x")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
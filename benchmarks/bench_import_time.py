@@ -0,0 +1,74 @@
+"""
+Import time of the data layer and the dashboard pages, measured with python -X importtime
+
+Each target is imported in a fresh interpreter; the reported time is the
+cumulative import time of its top-level modules (median of several runs).
+
+Usage: python benchmarks/bench_import_time.py [runs]
+"""
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).parent.parent
+
+TARGETS = {
+    'data layer': 'src.utils.data_loader',
+    'batch reports': 'src.utils.batch_report',
+    'pages package': 'src.pages',
+    'home page': 'src.pages.home',
+    'rankings page': 'src.pages.rankings',
+    'every page (eager)': 'src.pages.home, src.pages.fighter_search, src.pages.events, '
+                          'src.pages.compare, src.pages.rankings',
+    'streamlit': 'streamlit',
+    'plotly.express': 'plotly.express',
+}
+WATCHED = ('streamlit', 'plotly.express', 'plotly.graph_objects')
+
+
+def parse_importtime(stderr: str) -> List[Tuple[int, int, int, str]]:
+    """(depth, self us, cumulative us, module) per line of -X importtime output"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        entries.append((depth, int(self_us), int(cumulative_us), name.strip()))
+    return entries
+
+
+def measure(statement: str) -> Tuple[float, List[Tuple[int, int, int, str]]]:
+    """Milliseconds to run one import statement in a fresh interpreter, and its entries"""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {statement}'],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    entries = parse_importtime(completed.stderr)
+    return sum(cumulative for depth, _, cumulative, _ in entries if depth == 0) / 1000, entries
+
+
+def main(runs=5):
+    results: Dict[str, float] = {}
+    print(f"{'target':<22}{'median ms':>10}{'min ms':>9}{'modules':>9}  heavy imports")
+    for label, statement in TARGETS.items():
+        timings, entries = [], []
+        for _ in range(runs):
+            milliseconds, entries = measure(statement)
+            timings.append(milliseconds)
+        loaded = {name for _, _, _, name in entries}
+        watched = ', '.join(module for module in WATCHED if module in loaded) or '-'
+        results[label] = statistics.median(timings)
+        print(f"{label:<22}{results[label]:>10.1f}{min(timings):>9.1f}{len(entries):>9}  {watched}")
+    
+    heaviest = sorted(measure(TARGETS['home page'])[1], key=lambda entry: -entry[1])[:5]
+    print("\nslowest modules of the home page (self time):")
+    for _, self_us, _, name in heaviest:
+        print(f"  {self_us / 1000:>7.1f} ms  {name}")
+    return results
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
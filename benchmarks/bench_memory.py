@@ -0,0 +1,31 @@
+"""
+Memory footprint of the loaded frames: plain vs compact (categorical / downcast) layout
+
+Usage: python benchmarks/bench_memory.py [scale]
+"""
+from pathlib import Path
+import sys
+import tempfile
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+from benchmarks.synthetic import write_synthetic_csvs
+from src.utils.data_loader import _build_fighters, _build_events, memory_report
+
+
+def main(scale=1):
+    pd.set_option('display.width', 120)
+    with tempfile.TemporaryDirectory() as tmp:
+        fighters_csv, events_csv = write_synthetic_csvs(tmp, scale)
+        for label, build, csv_path in [('fighters', _build_fighters, fighters_csv),
+                                       ('events', _build_events, events_csv)]:
+            report = memory_report(build(csv_path, compact=False), build(csv_path))
+            total = report.loc['Total']
+            print(f"\n{label} x{scale}: {total['Bytes Before'] / 1e6:.2f} MB -> "
+                  f"{total['Bytes After'] / 1e6:.2f} MB ({total['Ratio']}x)")
+            print(report.to_string())
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1)
@@ -0,0 +1,35 @@
+"""
+Elo replay benchmark on a synthetic fight history
+
+Usage: python benchmarks/bench_ratings.py [n_fights] [n_fighters]
+"""
+from pathlib import Path
+import sys
+import time
+
+sys.path.append(str(Path(__file__).parent.parent))
+from benchmarks.synthetic import synthetic_history
+from src.utils.ratings import EloRatings
+
+
+def main(n_fights=1_000_000, n_fighters=50_000):
+    side1, side2, score, weight = synthetic_history(n_fights, n_fighters)
+    
+    engine = EloRatings()
+    engine.slots_for([str(i) for i in range(n_fighters)])
+    start = time.perf_counter()
+    engine.rate(side1, side2, score, weight)
+    full = time.perf_counter() - start
+    print(f"Full replay: {n_fights:,} fights, {n_fighters:,} fighters in {full:.2f} s "
+          f"({n_fights / full:,.0f} fights/s)")
+    
+    # One extra event on top of the replayed history
+    extra = synthetic_history(12, n_fighters, seed=1)
+    start = time.perf_counter()
+    engine.rate(*extra)
+    print(f"Incremental event (12 fights): {(time.perf_counter() - start) * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
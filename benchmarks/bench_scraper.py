@@ -0,0 +1,90 @@
+"""
+Scraper against a local stand-in of ufcstats.com: concurrency, conditional requests and resume
+
+The bundled CSVs are rendered as ufcstats.com pages (scraper_fixtures.py)
+and served with a simulated latency. Runs a cold scrape with one worker
+and with several, checks the CSVs come back unchanged, then reruns warm,
+after a new event and after an interrupted run, counting the requests each
+one sends.
+
+Usage: python benchmarks/bench_scraper.py [workers] [latency_ms]
+"""
+from pathlib import Path
+import sys
+import tempfile
+
+import pandas as pd
+import requests
+
+sys.path.append(str(Path(__file__).parent.parent))
+from benchmarks.scraper_fixtures import (
+    FixtureServer, render_site, write_site, page_file, event_path, render_event_card, render_events_list
+)
+from src.config.settings import FIGHTERS_CSV, EVENTS_CSV
+from src.utils.scraper import Scraper
+from src.utils.ufcstats import EVENTS_LIST_PATH
+
+
+def scrape(server, tmp, workers, label, **kwargs):
+    """One run into tmp/fighters.csv and tmp/events.csv, printing its summary"""
+    server.counts.update(requests=0, not_modified=0)
+    scraper = Scraper(server.base_url, Path(tmp) / 'state.json', workers)
+    summary = scraper.run(Path(tmp) / 'fighters.csv', Path(tmp) / 'events.csv', **kwargs)
+    print(f"{label:<28}{workers:>8}{summary['Seconds']:>9.2f}{summary['Requests']:>10}"
+          f"{summary['Not Modified']:>8}{summary['Skipped']:>9}{summary['Bouts Written']:>9}")
+    return summary
+
+
+def check_round_trip(tmp):
+    """Scraped CSVs hold the bundled rows: events in file order, fighters grouped by letter page"""
+    assert (Path(tmp) / 'events.csv').read_bytes() == Path(EVENTS_CSV).read_bytes()
+    scraped = pd.read_csv(Path(tmp) / 'fighters.csv', dtype=str, keep_default_na=False)
+    bundled = pd.read_csv(FIGHTERS_CSV, dtype=str, keep_default_na=False)
+    key = list(bundled.columns)
+    pd.testing.assert_frame_equal(scraped.sort_values(key, ignore_index=True),
+                                  bundled.sort_values(key, ignore_index=True))
+
+
+def main(workers=8, latency_ms=20):
+    with tempfile.TemporaryDirectory() as tmp:
+        site = Path(tmp) / 'site'
+        write_site(site, render_site(FIGHTERS_CSV, EVENTS_CSV))
+        
+        with FixtureServer(site, latency=latency_ms / 1000) as server:
+            print(f"{'run':<28}{'workers':>8}{'seconds':>9}{'requests':>10}{'304s':>8}{'skipped':>9}{'written':>9}")
+            cold = scrape(server, Path(tmp) / 'serial', 1, 'cold')
+            pooled = scrape(server, Path(tmp) / 'pool', workers, 'cold')
+            check_round_trip(Path(tmp) / 'pool')
+            warm = scrape(server, Path(tmp) / 'pool', workers, 'warm (nothing changed)')
+            assert warm['Requests'] == warm['Not Modified'] == server.counts['not_modified']
+            
+            # A new event at the top of the list: only the list and its card are downloaded
+            events = pd.read_csv(EVENTS_CSV, dtype=str, keep_default_na=False)
+            card = events[events['Event Name'] == events['Event Name'].iat[0]].copy()
+            card['Event Name'], card['Event Date'] = 'UFC 999: Stand-In', 'December 31, 2030'
+            page_file(site, event_path('UFC 999: Stand-In', 'December 31, 2030')).write_text(
+                render_event_card(card), encoding='utf-8')
+            page_file(site, EVENTS_LIST_PATH).write_text(
+                render_events_list(pd.concat([card, events]), server.base_url), encoding='utf-8')
+            added = scrape(server, Path(tmp) / 'pool', workers, 'new event')
+            assert added['Downloaded'] == 2 and added['Bouts Written'] == len(card)
+            
+            # Interrupted run: missing cards fail it, the rest are checkpointed and not fetched again
+            hidden = sorted(site.glob('%2Fevent-details%2F*.html'))[:5]
+            for path in hidden:
+                path.rename(path.with_suffix('.hidden'))
+            try:
+                scrape(server, Path(tmp) / 'resume', workers, 'interrupted')
+            except requests.HTTPError as error:
+                print(f"{'interrupted':<28}{workers:>8}  {error}")
+            for path in hidden:
+                path.with_suffix('.hidden').rename(path)
+            resumed = scrape(server, Path(tmp) / 'resume', workers, 'resumed')
+            assert resumed['Skipped'] and resumed['Bouts'] == len(events) + len(card)
+        
+        print(f"\n{workers} workers: {cold['Seconds'] / pooled['Seconds']:.1f}x faster cold; warm rerun sends "
+              f"{warm['Requests']} conditional requests instead of {pooled['Requests']}")
+
+
+if __name__ == '__main__':
+    main(*(float(arg) if i else int(arg) for i, arg in enumerate(sys.argv[1:])))
@@ -0,0 +1,76 @@
+"""
+Search page: render time as the result count grows, every card vs a lazy page
+
+Runs the search results block in Streamlit's AppTest for a query with
+hundreds of matches, capped at increasing result counts. "eager" renders a
+full fighter card, chart included, inside every expander (what the page
+did before pagination); "lazy" is the paginated page, where only the open
+card is rendered. Figure caches are cleared before each run, as for a
+fresh query.
+
+Usage: python benchmarks/bench_search_page.py [query] [runs]
+"""
+from pathlib import Path
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+CAPS = [10, 50, 100, 300]
+
+
+def results_block(query, cap, eager):
+    """App script: the results of one search, rendered eagerly or as the search page does"""
+    import streamlit as st
+    from src.components.figure_cache import FIGURE_CACHE
+    from src.components.ui_components import fighter_card, fighter_label
+    from src.pages.fighter_search import _show_results
+    from src.utils.data_loader import load_fighters_data, load_events_data
+    from src.utils.fighter_index import FighterIndex
+    from src.utils.search import FighterSearch
+    from src.utils.similarity import SimilarityIndex
+    from src.utils.career_stats import CareerStats
+    
+    @st.cache_resource
+    def load():
+        fighters_df = load_fighters_data()
+        fighter_index = FighterIndex(fighters_df, load_events_data())
+        return (fighters_df, FighterSearch(fighters_df), fighter_index,
+                SimilarityIndex.build(fighters_df, fighter_index), CareerStats.build(fighter_index))
+    
+    fighters_df, search_engine, fighter_index, similarity, career_stats = load()
+    FIGURE_CACHE.cache_clear()
+    results = search_engine.search(query, max_results=cap)
+    if eager:
+        version = fighters_df.attrs.get('data_version')
+        for rank, (idx, fighter) in enumerate(results.iterrows()):
+            with st.expander(fighter_label(fighter), expanded=(rank == 0)):
+                position = fighters_df.index.get_loc(idx)
+                fighter_card(fighter, fighter_index.history(position), figure_key=(position, version))
+    else:
+        _show_results(results, query, fighters_df, fighter_index, similarity, career_stats)
+
+
+def main(query='a', runs=5):
+    print(f"query {query!r}, best of {runs} runs")
+    print(f"{'results':>8}{'eager ms':>10}{'lazy ms':>10}{'charts eager':>14}{'charts lazy':>13}")
+    for cap in CAPS:
+        row = []
+        for eager in (True, False):
+            at = AppTest.from_function(results_block, args=(query, cap, eager), default_timeout=300)
+            at.run()  # Loads the data into the resource cache
+            times = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                at.run()
+                times.append(time.perf_counter() - start)
+            assert not at.exception, at.exception
+            row.append((min(times) * 1000, len(at.get('plotly_chart'))))
+        (eager_ms, eager_charts), (lazy_ms, lazy_charts) = row
+        print(f"{cap:>8}{eager_ms:>10.1f}{lazy_ms:>10.1f}{eager_charts:>14}{lazy_charts:>13}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else 'a', int(sys.argv[2]) if len(sys.argv) > 2 else 5)
@@ -0,0 +1,85 @@
+"""
+Similar fighters: SimilarityIndex build and top-k queries on a synthetic roster of up to 1M fighters
+
+The bundled roster's feature rows (heights, reaches, weights, records,
+finish rates, stances) are resampled with a little noise to each size.
+Blocked top-k queries are timed against a full distance sort per query and
+checked against exact float64 distances.
+
+Usage: python benchmarks/bench_similarity.py [max_fighters] [queries]
+"""
+from pathlib import Path
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils.data_loader import load_fighters_data, load_events_data
+from src.utils.fighter_index import FighterIndex
+from src.utils.similarity import NUMERIC_FEATURES, SimilarityIndex, fighter_features
+
+K = 5
+
+
+def synthetic_features(features: pd.DataFrame, n: int, seed: int = 0) -> pd.DataFrame:
+    """n feature rows drawn from the real ones, numeric values jittered by 2% of their spread"""
+    rng = np.random.default_rng(seed)
+    sample = features.iloc[rng.integers(len(features), size=n)].reset_index(drop=True)
+    numeric = [column for column in sample.columns if column in NUMERIC_FEATURES]
+    noise = rng.standard_normal((n, len(numeric))) * (0.02 * features[numeric].std().to_numpy())
+    sample[numeric] = sample[numeric].to_numpy() + noise
+    return sample
+
+
+def full_sort(index: SimilarityIndex, position: int):
+    """Reference query: every distance, then a full argsort"""
+    distances = np.linalg.norm(index.matrix.T - index.matrix[:, position], axis=1)
+    distances[position] = np.inf
+    order = np.argsort(distances)[:K]
+    return order, distances[order]
+
+
+def per_call_ms(fn, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return (time.perf_counter() - start) / len(items) * 1000
+
+
+def main(max_fighters=1_000_000, n_queries=50):
+    fighters_df = load_fighters_data()
+    features = fighter_features(fighters_df, FighterIndex(fighters_df, load_events_data()))
+    sizes = [len(features)] + [n for n in (10_000, 100_000, 1_000_000) if n <= max_fighters]
+    if max_fighters not in sizes:
+        sizes.append(max_fighters)
+    
+    print(f"{len(features.columns)} features, k={K}, {n_queries} queries per size")
+    print(f"{'fighters':>10}{'build ms':>10}{'MB':>7}{'query ms':>10}{'batch ms/q':>12}{'full sort ms':>14}")
+    for n in sizes:
+        frame = features if n == len(features) else synthetic_features(features, n)
+        start = time.perf_counter()
+        index = SimilarityIndex(frame)
+        build_ms = (time.perf_counter() - start) * 1000
+        
+        positions = np.random.default_rng(1).integers(n, size=n_queries)
+        query_ms = per_call_ms(index.similar, positions.tolist())
+        start = time.perf_counter()
+        batch_ids, batch_distances = index.nearest(positions, K)
+        batch_ms = (time.perf_counter() - start) / n_queries * 1000
+        sort_ms = per_call_ms(lambda position: full_sort(index, position), positions[:10].tolist())
+        
+        # Blocked float32 search returns the exact top-k distances
+        exact = index.matrix.T.astype(np.float64)
+        for row, position in enumerate(positions[:10].tolist()):
+            distances = np.sqrt(((exact - exact[position]) ** 2).sum(axis=1))
+            distances[position] = np.inf
+            assert np.allclose(np.sort(distances)[:K], batch_distances[row], atol=1e-4)
+        
+        print(f"{n:>10,}{build_ms:>10.1f}{index.matrix.nbytes / 1e6:>7.1f}{query_ms:>10.3f}"
+              f"{batch_ms:>12.3f}{sort_ms:>14.2f}")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
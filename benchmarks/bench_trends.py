@@ -0,0 +1,76 @@
+"""
+Trends: TrendIndex build and the full trend set vs a pandas groupby per filter
+
+For each scale, times binning the events frame, computing every
+(period, weight class) slice from cold, and a cached lookup. The
+reference computes each slice with its own filter and
+groupby / resample over the date column, as a page without the index
+would on every rerun; tests/test_trends.py checks that the two agree.
+
+Usage: python benchmarks/bench_trends.py [max_scale]
+"""
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+from benchmarks.synthetic import write_synthetic_csvs
+from src.utils.data_loader import load_events_data
+from src.utils.event_stream import method_families
+from src.utils.trends import PERIODS, TrendIndex
+
+
+def groupby_trends(events_df, period, weight_class):
+    """One slice's trends from a filter and a groupby on the period"""
+    rows = events_df if weight_class is None else events_df[events_df['Weight Class'] == weight_class]
+    families = pd.Series(np.asarray(method_families(rows['Method'])), index=rows.index)
+    frame = pd.DataFrame({
+        'finish': families.isin(['KO/TKO', 'Submission']) * 100.0,
+        'decision': (families == 'Decision') * 100.0,
+        'rounds': rows['Round'].astype(float),
+        'knockdowns': (rows['Fighter1 KD'] + rows['Fighter2 KD']).astype(float),
+        'event': rows['Event Name'].astype(str),
+    })
+    frame['period'] = rows['Event Date'].dt.to_period('Y' if period == 'Year' else 'Q')
+    return frame.groupby('period').agg(fights=('rounds', 'size'), events=('event', 'nunique'),
+                                       finish=('finish', 'mean'), decision=('decision', 'mean'),
+                                       rounds=('rounds', 'mean'), knockdowns=('knockdowns', 'mean'))
+
+
+def main(max_scale=100):
+    print(f"{'scale':>6}{'bouts':>10}{'slices':>8}{'build ms':>10}{'all slices ms':>15}"
+          f"{'cached ms':>11}{'groupby ms':>12}")
+    for scale in [scale for scale in (1, 10, 100) if scale <= max_scale]:
+        with tempfile.TemporaryDirectory() as tmp:
+            _, events_csv = write_synthetic_csvs(tmp, scale)
+            events_df = load_events_data(events_csv, use_cache=False)
+        
+        start = time.perf_counter()
+        trends = TrendIndex(events_df)
+        build_ms = (time.perf_counter() - start) * 1000
+        slices = [(period, weight_class) for period in PERIODS for weight_class in (None, *trends.weight_classes)]
+        
+        start = time.perf_counter()
+        for key in slices:
+            trends.trends(*key)
+        all_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        for key in slices:
+            trends.trends(*key)
+        cached_ms = (time.perf_counter() - start) / len(slices) * 1000
+        
+        start = time.perf_counter()
+        for key in slices:
+            groupby_trends(events_df, *key)
+        groupby_ms = (time.perf_counter() - start) * 1000
+        
+        print(f"{scale:>6}{len(events_df):>10,}{len(slices):>8}{build_ms:>10.1f}{all_ms:>15.1f}"
+              f"{cached_ms:>11.4f}{groupby_ms:>12.1f}")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,197 @@
+"""
+Recorded ufcstats.com pages and a local HTTP stand-in serving them
+
+render_site() turns fighters / events CSVs into the event list, fight card
+and roster pages in ufcstats.com markup, so scraping the stand-in should
+reproduce the CSVs. FixtureServer serves a directory of such pages with
+ETag / Last-Modified validators (answering 304 when they match), optional
+latency per response and request counters.
+"""
+from email.utils import formatdate
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from string import ascii_lowercase
+from typing import Dict
+from urllib.parse import quote
+import hashlib
+import threading
+import time
+
+import pandas as pd
+from src.utils.ufcstats import (
+    FIGHTER_COLUMNS, EVENTS_LIST_PATH, CARD_STAT_COLUMNS, NO_CONTEST_RESULT, fighters_list_path
+)
+
+# Method prefixes, longest first, so KO/TKO-Punches splits into KO/TKO + Punches and U-DEC stays whole
+METHODS = ['Overturned', 'KO/TKO', 'U-DEC', 'S-DEC', 'M-DEC', 'Other', 'CNC', 'SUB', 'DQ']
+
+
+def event_path(name: str, date: str) -> str:
+    return '/event-details/' + hashlib.sha1(f'{name}|{date}'.encode()).hexdigest()[:16]
+
+
+def _page(body: str) -> str:
+    return f'<!DOCTYPE html>\n<html><head><title>UFC Stats</title></head><body>\n{body}\n</body></html>\n'
+
+
+def _ps(*texts) -> str:
+    return ''.join(f'<p class="b-fight-details__table-text">{escape(str(text))}</p>' for text in texts)
+
+
+def render_events_list(events: pd.DataFrame, base_url: str = 'http://ufcstats.com') -> str:
+    """Completed events page: one row per (Event Name, Event Date), in frame order"""
+    rows = [
+        '<tr class="b-statistics__table-row"><td class="b-statistics__table-col">'
+        '<i class="b-statistics__table-content">'
+        f'<a href="{base_url}{event_path(name, date)}" class="b-link b-link_style_black">{escape(name)}</a>'
+        f'<span class="b-statistics__date">{escape(date)}</span></i></td>'
+        '<td class="b-statistics__table-col">Las Vegas, Nevada, USA</td></tr>'
+        for name, date in events[['Event Name', 'Event Date']].drop_duplicates().itertuples(index=False)
+    ]
+    return _page('<table class="b-statistics__table-events"><thead><tr><th>Name/date</th><th>Location</th>'
+                 '</tr></thead><tbody>' + '\n'.join(rows) + '</tbody></table>')
+
+
+def _split_stat(value: str):
+    return ('--', '--') if value == '-----' else value.split('-', 1)
+
+
+def _split_method(value: str):
+    for method in METHODS:
+        if value.startswith(method + '-'):
+            return method, value[len(method) + 1:].replace('-', ' ')
+    return value, ''
+
+
+def render_event_card(bouts: pd.DataFrame) -> str:
+    """Fight card page of one event's bouts"""
+    rows = []
+    for bout in bouts.itertuples(index=False):
+        bout = dict(zip(bouts.columns, bout))
+        if bout['Result'] == 'Draw':
+            flag = 'draw'
+        elif bout['Result'] == NO_CONTEST_RESULT:
+            flag = 'nc'
+        else:
+            flag = 'win'
+        stats = ''.join(f'<td class="b-fight-details__table-col">{_ps(*_split_stat(bout[column]))}</td>'
+                        for column in CARD_STAT_COLUMNS)
+        rows.append(
+            '<tr class="b-fight-details__table-row b-fight-details__table-row__hover js-fight-details-click">'
+            '<td class="b-fight-details__table-col"><p class="b-fight-details__table-text">'
+            f'<a class="b-flag"><i class="b-flag__inner"><i class="b-flag__text">{flag}</i></i></a></p></td>'
+            f'<td class="b-fight-details__table-col">{_ps(bout["Fighter1"], bout["Fighter2"])}</td>'
+            f'{stats}'
+            f'<td class="b-fight-details__table-col">{_ps(bout["Weight Class"])}</td>'
+            f'<td class="b-fight-details__table-col">{_ps(*_split_method(bout["Method"]))}</td>'
+            f'<td class="b-fight-details__table-col">{_ps(bout["Round"])}</td>'
+            f'<td class="b-fight-details__table-col">{_ps(bout["Time"])}</td></tr>'
+        )
+    return _page('<table class="b-fight-details__table"><tbody class="b-fight-details__table-body">'
+                 + '\n'.join(rows) + '</tbody></table>')
+
+
+def render_fighters_list(fighters: pd.DataFrame) -> str:
+    """Roster page of some fighters, with the spacer row ufcstats puts under the header"""
+    rows = ['<tr class="b-statistics__table-row"><td class="b-statistics__table-col_type_clear" colspan="11">'
+            '</td></tr>']
+    for fighter in fighters[FIGHTER_COLUMNS].itertuples(index=False):
+        cells = ''.join(f'<td class="b-statistics__table-col">{escape(str(value))}</td>' for value in fighter)
+        rows.append(f'<tr class="b-statistics__table-row">{cells}<td class="b-statistics__table-col"></td></tr>')
+    return _page('<table class="b-statistics__table"><thead><tr>'
+                 + ''.join(f'<th>{column}</th>' for column in FIGHTER_COLUMNS)
+                 + '<th>Belt</th></tr></thead><tbody>' + '\n'.join(rows) + '</tbody></table>')
+
+
+def render_site(fighters_csv, events_csv) -> Dict[str, str]:
+    """Every page a full scrape requests, by path"""
+    fighters = pd.read_csv(fighters_csv, dtype=str, keep_default_na=False)
+    events = pd.read_csv(events_csv, dtype=str, keep_default_na=False)
+    letters = fighters['Last Name'].str[:1].str.lower()
+    pages = {EVENTS_LIST_PATH: render_events_list(events)}
+    for letter in ascii_lowercase:
+        pages[fighters_list_path(letter)] = render_fighters_list(fighters[letters == letter])
+    for (name, date), bouts in events.groupby(['Event Name', 'Event Date'], sort=False):
+        pages[event_path(name, date)] = render_event_card(bouts)
+    return pages
+
+
+def page_file(directory, path: str) -> Path:
+    return Path(directory) / (quote(path, safe='') + '.html')
+
+
+def write_site(directory, pages: Dict[str, str]):
+    """Record pages as files FixtureServer serves"""
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    for path, html in pages.items():
+        page_file(directory, path).write_text(html, encoding='utf-8')
+
+
+class FixtureServer:
+    """
+    Local stand-in for ufcstats.com serving the recorded pages of a directory
+    
+    Pages are read on every request, so editing a file changes its ETag.
+    Use as a context manager; base_url is the address to scrape.
+    """
+    
+    def __init__(self, directory, latency: float = 0.0):
+        self.directory = Path(directory)
+        self.latency = latency
+        self.counts = {'requests': 0, 'not_modified': 0}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        self.base_url = f'http://127.0.0.1:{self._server.server_port}'
+    
+    def _count(self, key):
+        with self._lock:
+            self.counts[key] += 1
+    
+    def _handler(self):
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # Keep-alive, so pooled connections are reused
+            # Headers and body leave in one segment; separate writes stall keep-alive on delayed ACKs
+            wbufsize = 1 << 16
+            disable_nagle_algorithm = True
+            
+            def do_GET(self):
+                server._count('requests')
+                if server.latency:
+                    time.sleep(server.latency)
+                path = page_file(server.directory, self.path)
+                if not path.exists():
+                    self.send_error(404)
+                    return
+                body = path.read_bytes()
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                if self.headers.get('If-None-Match') == etag:
+                    server._count('not_modified')
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.send_header('Last-Modified', formatdate(path.stat().st_mtime, usegmt=True))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args):
+                pass
+        
+        return Handler
+    
+    def __enter__(self) -> 'FixtureServer':
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+    
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
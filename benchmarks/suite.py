@@ -0,0 +1,252 @@
+"""
+Benchmark suite: loaders, search strategies and page aggregations on synthetic data
+
+Each scale writes synthetic CSVs (benchmarks/synthetic.py), then times the
+loaders, the startup indexes, every FighterSearch strategy, suggestions and
+the aggregations behind each page. Results go to benchmarks/results/<commit>.json
+so two commits can be compared with --compare.
+
+Usage:
+    python benchmarks/suite.py [--scales 1 10 100] [--repeat 3] [--queries 50] [--out PATH]
+    python benchmarks/suite.py --compare OLD.json NEW.json [--threshold 1.25]
+
+Scale 1000 (1.9M fighters, 7M bouts) is supported but needs several GB of RAM.
+"""
+from datetime import datetime, timezone
+from pathlib import Path
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+from benchmarks.synthetic import write_synthetic_csvs, search_queries
+from src.utils import data_loader
+from src.utils.aggregates import DashboardAggregates
+from src.utils.career_stats import CareerStats
+from src.utils.event_index import EventIndex
+from src.utils.fight_graph import FightGraph
+from src.utils.fighter_index import FighterIndex
+from src.utils.leaderboards import Leaderboards, fighter_divisions
+from src.utils.ratings import EloRatings
+from src.utils.search import FighterSearch
+from src.utils.similarity import SimilarityIndex
+from src.utils.trends import PERIODS, TrendIndex
+from src.utils import summaries
+
+ROOT = Path(__file__).parent.parent
+RESULTS_DIR = ROOT / 'benchmarks' / 'results'
+
+
+class Timings:
+    """Median / best wall time per call of each named step"""
+    
+    def __init__(self, repeat: int):
+        self.repeat = repeat
+        self.results = {}
+    
+    def time(self, name: str, fn, items=None, repeat: int = None):
+        """Time fn() (or fn(item) for every item) and return the last result"""
+        seconds = []
+        for _ in range(repeat or self.repeat):
+            start = time.perf_counter()
+            result = fn() if items is None else [fn(item) for item in items]
+            seconds.append(time.perf_counter() - start)
+        calls = 1 if items is None else max(len(items), 1)
+        self.results[name] = {
+            'ms': round(statistics.median(seconds) / calls * 1000, 4),
+            'min_ms': round(min(seconds) / calls * 1000, 4),
+            'calls': calls,
+        }
+        print(f"  {name:<36}{self.results[name]['ms']:>12.3f} ms")
+        return result
+
+
+def run_scale(scale: int, repeat: int, n_queries: int, seed: int = 0) -> dict:
+    """Every benchmark at one scale"""
+    timings = Timings(repeat)
+    rng = np.random.default_rng(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        fighters_csv, events_csv = write_synthetic_csvs(tmp, scale, seed=seed)
+        data_loader.FRAME_CACHE_DIR = Path(tmp) / 'cache'
+        
+        # Loaders: CSV parse, then the on-disk frame cache (first call populates it)
+        timings.time('load.fighters_csv', lambda: data_loader.load_fighters_data(fighters_csv, use_cache=False))
+        timings.time('load.events_csv', lambda: data_loader.load_events_data(events_csv, use_cache=False))
+        data_loader.load_fighters_data(fighters_csv)
+        data_loader.load_events_data(events_csv)
+        fighters_df = timings.time('load.fighters_cached', lambda: data_loader.load_fighters_data(fighters_csv))
+        events_df = timings.time('load.events_cached', lambda: data_loader.load_events_data(events_csv))
+    
+    # Startup indexes built by initialize_app
+    def build_search():
+        engine = FighterSearch(fighters_df)
+        engine._ensure_current()
+        return engine
+    search_engine = timings.time('startup.search_index', build_search)
+    event_index = timings.time('startup.event_index', lambda: EventIndex(events_df))
+    fighter_index = timings.time('startup.fighter_index', lambda: FighterIndex(fighters_df, events_df))
+    fight_graph = timings.time('startup.fight_graph', lambda: FightGraph.from_fighter_index(fighter_index))
+    
+    def replay_elo():
+        engine = EloRatings()
+        engine.update_from_events(events_df, fighter_index)
+        return engine.for_fighters(fighter_index)
+    elo_ratings = timings.time('startup.elo_replay', replay_elo)
+    leaderboards = timings.time('startup.leaderboards', lambda: Leaderboards(
+        fighters_df, fighter_divisions(fighters_df, fighter_index)))
+    aggregates = timings.time('startup.dashboard_aggregates', lambda: DashboardAggregates.build(
+        1, fighters_df, events_df, event_index))
+    similarity = timings.time('startup.similarity_index', lambda: SimilarityIndex.build(fighters_df, fighter_index))
+    career_stats = timings.time('startup.career_stats', lambda: CareerStats.build(fighter_index))
+    trends = timings.time('startup.trend_index', lambda: TrendIndex(events_df))
+    
+    # Search strategies, each on queries that reach it, then the full cascade uncached
+    queries = search_queries(fighters_df, n_queries, seed)
+    timings.time('search.exact', search_engine._exact_match, queries['exact'])
+    timings.time('search.partial', search_engine._partial_match, queries['partial'])
+    timings.time('search.fuzzy', lambda query: search_engine._fuzzy_match(query, 0.6, 10), queries['fuzzy'])
+    timings.time('search.token', search_engine._token_match, queries['token'])
+    timings.time('search.loose', lambda query: search_engine._fuzzy_match(query, 0.4, 10), queries['miss'])
+    for kind in ['exact', 'partial', 'fuzzy', 'token', 'miss']:
+        def uncached_search(query):
+            search_engine.cache_clear()
+            return search_engine.search(query)
+        timings.time(f'search.cascade_{kind}', uncached_search, queries[kind])
+    timings.time('search.autocomplete', search_engine.autocomplete, queries['prefix'])
+    timings.time('search.suggestions_prefix', search_engine.get_suggestions, queries['prefix'])
+    timings.time('search.suggestions_typo', search_engine.get_suggestions, queries['fuzzy'])
+    
+    # Page aggregations
+    positions = rng.integers(len(fighters_df), size=n_queries).tolist()
+    pairs = rng.integers(len(fighters_df), size=(n_queries, 2)).tolist()
+    event_names = [event_index.names[i] for i in rng.integers(len(event_index), size=n_queries)]
+    slices = [(None, None)] + [(weight_class, None) for weight_class in leaderboards.weight_classes] + \
+        [(None, stance) for stance in leaderboards.stance_names]
+    
+    timings.time('home.overview', lambda: summaries.overview(fighters_df, events_df))
+    timings.time('home.weight_distribution', lambda: summaries.weight_distribution(fighters_df))
+    timings.time('home.stance_distribution', lambda: summaries.stance_distribution(fighters_df))
+    timings.time('events.events_between', lambda: event_index.events_between(
+        event_index.event_date(event_index.names[0]), event_index.event_date(event_index.names[-1]),
+        newest_first=True))
+    timings.time('events.event_summary', lambda name: summaries.event_summary(event_index.fights(name)), event_names)
+    timings.time('events.event_breakdown', aggregates.events.__getitem__, event_names)
+    timings.time('fighter_search.dropdown_position',
+                 lambda position: fighters_df['Full Name'].tolist().index(fighters_df['Full Name'].iat[position]),
+                 positions[:5])
+    timings.time('fighter_search.fighter_profile', lambda position: summaries.fighter_profile(
+        fighters_df.iloc[position], fighter_index.history(position)), positions)
+    timings.time('fighter_search.career_stats', career_stats.row, positions)
+    timings.time('compare.name_list', lambda: sorted(fighters_df['Full Name'].tolist()))
+    timings.time('compare.physical_advantages', lambda pair: summaries.physical_advantages(
+        fighters_df.iloc[pair[0]], fighters_df.iloc[pair[1]]), pairs)
+    timings.time('compare.similar_fighters', similarity.similar, positions)
+    timings.time('compare.head_to_head', lambda pair: fight_graph.head_to_head(*pair), pairs)
+    timings.time('compare.common_opponents', lambda pair: fight_graph.common_opponents(*pair), pairs)
+    timings.time('compare.win_path', lambda pair: fight_graph.win_path(*pair), pairs)
+    timings.time('rankings.ranking_tables', lambda key: summaries.ranking_tables(leaderboards, *key), slices)
+    timings.time('rankings.elo_table', lambda key: summaries.elo_table(
+        fighters_df, elo_ratings, leaderboards.members(*key)), slices)
+    timings.time('rankings.career_table', lambda key: summaries.career_table(
+        fighters_df, career_stats, 'Strikes per Min', leaderboards.members(*key)), slices)
+    trend_slices = [(period, weight_class) for period in PERIODS for weight_class in (None, *trends.weight_classes)]
+    
+    def all_trend_slices():
+        index = TrendIndex(events_df)
+        return [index.trends(*key) for key in trend_slices]
+    timings.time('trends.all_slices', all_trend_slices)
+    timings.time('trends.cached_slice', lambda key: trends.trends(*key), trend_slices)
+    
+    return {
+        'rows': {'fighters': len(fighters_df), 'events': len(events_df)},
+        'timings': timings.results,
+    }
+
+
+def git_revision() -> tuple:
+    """Short commit hash and whether the tree has uncommitted changes"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown', False
+    return commit, dirty
+
+
+def run(scales, repeat: int, n_queries: int, out=None) -> Path:
+    """Run every scale and write the JSON results file, returning its path"""
+    commit, dirty = git_revision()
+    document = {
+        'meta': {
+            'commit': commit,
+            'dirty': dirty,
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'repeat': repeat,
+            'queries': n_queries,
+        },
+        'scales': {},
+    }
+    for scale in scales:
+        print(f"x{scale}")
+        document['scales'][str(scale)] = run_scale(scale, repeat, n_queries)
+    
+    out = Path(out) if out else RESULTS_DIR / f"{commit}{'-dirty' if dirty else ''}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(document, indent=2))
+    print(f"Results written to {out}")
+    return out
+
+
+def compare(old_path, new_path, threshold: float = 1.25) -> int:
+    """Print new/old time ratios per step; returns how many steps got slower than threshold"""
+    old = json.loads(Path(old_path).read_text())
+    new = json.loads(Path(new_path).read_text())
+    print(f"{old['meta']['commit']} -> {new['meta']['commit']}")
+    regressions = 0
+    for scale, new_scale in new['scales'].items():
+        old_timings = old['scales'].get(scale, {}).get('timings', {})
+        print(f"x{scale}")
+        for name, timing in new_scale['timings'].items():
+            if name not in old_timings:
+                print(f"  {name:<36}{'new':>12}{timing['ms']:>12.3f} ms")
+                continue
+            ratio = timing['ms'] / max(old_timings[name]['ms'], 1e-9)
+            flag = '  REGRESSION' if ratio >= threshold else ''
+            regressions += bool(flag)
+            print(f"  {name:<36}{old_timings[name]['ms']:>12.3f}{timing['ms']:>12.3f} ms{ratio:>8.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100], help='CSV scale factors')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per step (the median is reported)')
+    parser.add_argument('--queries', type=int, default=50, help='queries / fighters / pairs sampled per step')
+    parser.add_argument('--out', help='results path (default: benchmarks/results/<commit>.json)')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help='compare two results files')
+    parser.add_argument('--threshold', type=float, default=1.25, help='slowdown ratio reported as a regression')
+    args = parser.parse_args()
+    
+    if args.compare:
+        sys.exit(1 if compare(*args.compare, args.threshold) else 0)
+    run(args.scales, args.repeat, args.queries, args.out)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""
+Synthetic scaled copies of the bundled CSVs for benchmarking
+"""
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.config.settings import FIGHTERS_CSV, EVENTS_CSV
+
+
+def scale_frame(df, scale, suffix_columns):
+    """Repeat df `scale` times, tagging suffix_columns so copies stay distinct"""
+    copies = []
+    for i in range(scale):
+        copy = df.copy()
+        if i:
+            for column in suffix_columns:
+                copy[column] = copy[column].where(copy[column].isna(), copy[column] + f" {i}")
+        copies.append(copy)
+    return pd.concat(copies, ignore_index=True)
+
+
+def typo(text, rng):
+    """One random keyboard slip: swapped, dropped, doubled or replaced letter"""
+    letters = [i for i, char in enumerate(text) if char.isalpha()]
+    if len(letters) < 2:
+        return text
+    i = letters[rng.integers(len(letters) - 1)]
+    kind = rng.integers(4)
+    if kind == 0:
+        return text[:i] + text[i + 1] + text[i] + text[i + 2:]
+    if kind == 1:
+        return text[:i] + text[i + 1:]
+    if kind == 2:
+        return text[:i] + text[i] + text[i:]
+    return text[:i] + 'abcdefghijklmnopqrstuvwxyz'[rng.integers(26)] + text[i + 1:]
+
+
+def synthetic_frames(scale, typo_rate=0.005, seed=0):
+    """
+    Fighters and events frames `scale` times the bundled CSVs
+    
+    Copy 0 is the real data. Every further copy draws first names, last names
+    and nicknames independently from the real roster, so common names
+    ("Chris", "Silva") stay common and duplicates occur as they do in
+    practice. Event copies replay the real cards between the copy's fighters
+    (roster fighters map to the copy's roster row, event-only fighters to new
+    names) and misspell `typo_rate` of the fighter names, as scraped cards do.
+    """
+    rng = np.random.default_rng(seed)
+    fighters = pd.read_csv(FIGHTERS_CSV)
+    events = pd.read_csv(EVENTS_CSV)
+    n_fighters, n_fights = len(fighters), len(events)
+    
+    first = fighters['First Name'].to_numpy(dtype=object)
+    last = fighters['Last Name'].to_numpy(dtype=object)
+    nickname = fighters['Nickname'].to_numpy(dtype=object)
+    n_new = (scale - 1) * n_fighters
+    synthetic = fighters.iloc[np.tile(np.arange(n_fighters), scale)].reset_index(drop=True)
+    synthetic.loc[n_fighters:, 'First Name'] = first[rng.integers(n_fighters, size=n_new)]
+    synthetic.loc[n_fighters:, 'Last Name'] = last[rng.integers(n_fighters, size=n_new)]
+    synthetic.loc[n_fighters:, 'Nickname'] = nickname[rng.integers(n_fighters, size=n_new)]
+    full_names = (synthetic['First Name'].fillna('') + ' ' + synthetic['Last Name'].fillna('')).str.strip()
+    full_names = full_names.to_numpy(dtype=object).reshape(scale, n_fighters)
+    
+    # Every distinct bout name gets one name per copy: its roster row's, or a fresh one
+    codes, names = pd.factorize(pd.concat([events['Fighter1'], events['Fighter2'], events['Result']]))
+    roster_position = pd.Series(np.arange(n_fighters), index=full_names[0]).groupby(level=0).first()
+    position = roster_position.reindex(names).to_numpy()
+    in_roster = ~np.isnan(position)
+    renamed = np.empty((scale, len(names)), dtype=object)
+    renamed[0] = names
+    known_first, known_last = first[pd.notna(first)], last[pd.notna(last)]
+    for i in range(1, scale):
+        renamed[i, in_roster] = full_names[i, position[in_roster].astype(int)]
+        fresh = ~in_roster
+        renamed[i, fresh] = known_first[rng.integers(len(known_first), size=fresh.sum())] + ' ' + \
+            known_last[rng.integers(len(known_last), size=fresh.sum())]
+    # Results that are not fighter names stay as they are
+    keep = np.isin(names, ['Draw', 'Unknown'])
+    renamed[:, keep] = names[keep]
+    
+    copy = np.repeat(np.arange(scale), n_fights)
+    synthetic_events = events.iloc[np.tile(np.arange(n_fights), scale)].reset_index(drop=True)
+    codes = codes.reshape(3, n_fights)
+    fighter1, fighter2, result = (renamed[copy, np.tile(column_codes, scale)] for column_codes in codes)
+    
+    # Misspelt names in the copies, kept consistent with the bout's Result
+    for row in np.flatnonzero((copy > 0) & (rng.random(len(copy)) < typo_rate)).tolist():
+        side = fighter1 if rng.random() < 0.5 else fighter2
+        misspelt = typo(side[row], rng)
+        if result[row] == side[row]:
+            result[row] = misspelt
+        side[row] = misspelt
+    
+    synthetic_events['Fighter1'], synthetic_events['Fighter2'], synthetic_events['Result'] = fighter1, fighter2, result
+    event_suffix = np.char.add(' #', copy.astype(str)).astype(object)
+    event_suffix[copy == 0] = ''
+    synthetic_events['Event Name'] = synthetic_events['Event Name'].to_numpy(dtype=object) + event_suffix
+    return synthetic, synthetic_events
+
+
+def search_queries(fighters_df, n=50, seed=0):
+    """
+    Queries per search strategy, drawn from a loaded fighters frame
+    
+    exact: last names; partial: inner slices of full names; fuzzy: full names
+    with a typo; token: a last name plus an unknown word; miss: random letters
+    (falls through to the loose fuzzy pass); prefix: 2-4 letter name starts.
+    """
+    rng = np.random.default_rng(seed)
+    rows = fighters_df.iloc[rng.integers(len(fighters_df), size=n)]
+    last = rows['Last Name'].fillna('Silva').astype(str).tolist()
+    full = rows['Full Name'].astype(str).tolist()
+    letters = np.array(list('abcdefghijklmnopqrstuvwxyz'))
+    junk = [''.join(rng.choice(letters, 7)) for _ in range(2 * n)]
+    return {
+        'exact': last,
+        'partial': [name[len(name) // 3:len(name) // 3 + 4] for name in full],
+        'fuzzy': [typo(name, rng) for name in full],
+        'token': [f"{name} {word}" for name, word in zip(last, junk)],
+        'miss': junk[n:],
+        'prefix': [name[:int(rng.integers(2, 5))] for name in full],
+    }
+
+
+def write_synthetic_csvs(out_dir, scale, typo_rate=0.005, seed=0):
+    """Write fighters and events CSVs scaled by `scale`, returning their paths"""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    fighters_path = out_dir / f"ufc_fighters_x{scale}.csv"
+    events_path = out_dir / f"ufc_event_data_x{scale}.csv"
+    
+    fighters, events = synthetic_frames(scale, typo_rate, seed)
+    fighters.to_csv(fighters_path, index=False)
+    events.to_csv(events_path, index=False)
+    return fighters_path, events_path
+
+
+def synthetic_history(n_fights, n_fighters, seed=0):
+    """Random pairings with a skill-driven winner, 2% draws and 2% no contests"""
+    rng = np.random.default_rng(seed)
+    side1 = rng.integers(0, n_fighters, n_fights)
+    side2 = (side1 + rng.integers(1, n_fighters, n_fights)) % n_fighters
+    skill = rng.normal(0, 1, n_fighters)
+    p_win = 1 / (1 + np.exp(skill[side2] - skill[side1]))
+    score = (rng.random(n_fights) < p_win).astype(float)
+    outcome = rng.random(n_fights)
+    score[outcome < 0.04] = 0.5
+    score[outcome < 0.02] = np.nan
+    weight = rng.choice([1.25, 1.0, 0.75], n_fights)
+    return side1, side2, score, weight
@@ -0,0 +1,38 @@
+"""
+UFC Analytics - headless batch report generator
+
+Computes every event summary, the rankings and every fighter profile
+without Streamlit, for nightly precomputation.
+
+Usage: python report.py [--out reports] [--format json html csv] [--workers N]
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent))
+
+from src.config.settings import FIGHTERS_CSV, EVENTS_CSV
+from src.utils.batch_report import REPORT_FORMATS, generate_reports
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write UFC event, ranking and fighter reports")
+    parser.add_argument('--out', default='reports', help="output directory (default: reports)")
+    parser.add_argument('--format', nargs='+', choices=REPORT_FORMATS, default=list(REPORT_FORMATS),
+                        dest='formats', help="report formats (default: all)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument('--fighters-csv', default=FIGHTERS_CSV, help="fighters CSV path")
+    parser.add_argument('--events-csv', default=EVENTS_CSV, help="events CSV path")
+    args = parser.parse_args(argv)
+    
+    manifest = generate_reports(args.out, args.formats, args.workers, args.fighters_csv, args.events_csv)
+    print(f"Wrote reports for {manifest['Events']:,} events and {manifest['Fighters']:,} fighters "
+          f"to {args.out} in {manifest['Seconds']} s ({args.workers} workers)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+UFC Analytics - scraper refreshing the bundled CSVs from ufcstats.com
+
+Only pages that changed since the last run are downloaded (see
+src/utils/scraper.py); new events are appended to the events CSV.
+
+Usage: python scrape.py [--workers N] [--rewrite] [--base-url URL]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent))
+
+from src.config.settings import FIGHTERS_CSV, EVENTS_CSV, SCRAPER_BASE_URL, SCRAPER_STATE_PATH, SCRAPER_WORKERS
+from src.utils.scraper import Scraper
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Refresh the fighters and events CSVs from ufcstats.com")
+    parser.add_argument('--workers', type=int, default=SCRAPER_WORKERS,
+                        help=f"concurrent requests (default: {SCRAPER_WORKERS})")
+    parser.add_argument('--rewrite', action='store_true',
+                        help="rewrite the events CSV instead of appending new events")
+    parser.add_argument('--base-url', default=SCRAPER_BASE_URL, help="site to scrape, e.g. a local stand-in")
+    parser.add_argument('--state', default=SCRAPER_STATE_PATH, help="checkpoint path")
+    parser.add_argument('--fighters-csv', default=FIGHTERS_CSV, help="fighters CSV path")
+    parser.add_argument('--events-csv', default=EVENTS_CSV, help="events CSV path")
+    args = parser.parse_args(argv)
+    
+    scraper = Scraper(args.base_url, args.state, args.workers, progress=True)
+    summary = scraper.run(args.fighters_csv, args.events_csv, args.rewrite)
+    print(f"{summary['Fighters']:,} fighters and {summary['Bouts']:,} bouts scraped in {summary['Seconds']} s: "
+          f"{summary['Requests']:,} requests, {summary['Not Modified']:,} not modified, "
+          f"{summary['Skipped']:,} cards skipped; wrote {summary['Fighters Written']:,} fighter rows and "
+          f"{summary['Bouts Written']:,} bout rows")
+
+
+if __name__ == '__main__':
+    main()
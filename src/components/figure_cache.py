@@ -0,0 +1,88 @@
+"""
+Bounded cache of serialized Plotly figures shared by every session
+"""
+from collections import OrderedDict, namedtuple
+from typing import Callable, Dict, Hashable
+import json
+import threading
+import time
+from src.config.settings import FIGURE_CACHE_SIZE
+
+FigureCacheInfo = namedtuple('FigureCacheInfo', ['hits', 'misses', 'evictions', 'size', 'capacity'])
+
+
+class FigureCache:
+    """
+    LRU of figure JSON keyed by (kind, key, data version)
+    
+    A miss builds the figure and stores fig.to_json(); a hit rebuilds the
+    Figure from that JSON without re-running Plotly's property validation,
+    which is most of what building one costs. Counters and build times are
+    kept per kind (e.g. 'fighter_card', 'compare').
+    """
+    
+    def __init__(self, capacity: int = FIGURE_CACHE_SIZE):
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._figures: OrderedDict = OrderedDict()
+        self._hits = self._misses = self._evictions = 0
+        self._builds: Dict[str, list] = {}  # kind -> [count, total seconds, max seconds]
+    
+    def figure(self, kind: str, key: Hashable, version: Hashable, build: Callable):
+        """The figure of (kind, key) at a data version, calling build() only on a miss"""
+        cache_key = (kind, key, version)
+        with self._lock:
+            spec = self._figures.get(cache_key)
+            if spec is not None:
+                self._figures.move_to_end(cache_key)
+                self._hits += 1
+        if spec is not None:
+            import plotly.graph_objects as go  # Deferred like every other Plotly import
+            # The JSON came from a validated figure; _validate=False skips checking it again
+            return go.Figure(json.loads(spec), _validate=False)
+        
+        start = time.perf_counter()
+        fig = build()
+        spec = fig.to_json()
+        seconds = time.perf_counter() - start
+        with self._lock:
+            self._misses += 1
+            builds = self._builds.setdefault(kind, [0, 0.0, 0.0])
+            builds[0] += 1
+            builds[1] += seconds
+            builds[2] = max(builds[2], seconds)
+            self._figures[cache_key] = spec
+            self._figures.move_to_end(cache_key)
+            while len(self._figures) > self.capacity:
+                self._figures.popitem(last=False)
+                self._evictions += 1
+        return fig
+    
+    def cache_info(self) -> FigureCacheInfo:
+        """Hit, miss and eviction counters"""
+        with self._lock:
+            return FigureCacheInfo(self._hits, self._misses, self._evictions, len(self._figures), self.capacity)
+    
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache (0 before the first one)"""
+        info = self.cache_info()
+        return info.hits / max(info.hits + info.misses, 1)
+    
+    def build_times(self) -> Dict[str, dict]:
+        """Builds, mean and max milliseconds per figure kind"""
+        with self._lock:
+            return {
+                kind: {'Builds': count, 'Mean ms': round(total / count * 1000, 3), 'Max ms': round(peak * 1000, 3)}
+                for kind, (count, total, peak) in self._builds.items()
+            }
+    
+    def cache_clear(self):
+        """Drop every figure and reset the counters"""
+        with self._lock:
+            self._figures.clear()
+            self._hits = self._misses = self._evictions = 0
+            self._builds.clear()
+
+
+# One cache per server process, so sessions share figures
+FIGURE_CACHE = FigureCache()
@@ -1,9 +1,11 @@
 """
 Reusable UI components for the dashboard
 """
+import pandas as pd
 import streamlit as st
-import plotly.graph_objects as go
+from src.components.figure_cache import FIGURE_CACHE
 from src.config.settings import GRADIENT_COLORS, CHART_COLORS
+from src.utils.summaries import fighter_profile, similar_table, HISTORY_COLUMNS
 
 
 def metric_card(value, label, gradient='purple'):
@@ -27,8 +29,26 @@ def info_box(title, content):
     """, unsafe_allow_html=True)
 
 
-def fighter_card(fighter):
-    """Display fighter information card"""
+def record_chart(fighter):
+    """Wins / losses / draws bar chart of one fighter"""
+    import plotly.graph_objects as go  # Deferred: only fighter cards draw charts here
+    fig = go.Figure(data=[
+        go.Bar(name='Wins', x=['Record'], y=[fighter['Wins']], marker_color=CHART_COLORS['wins']),
+        go.Bar(name='Losses', x=['Record'], y=[fighter['Losses']], marker_color=CHART_COLORS['losses']),
+        go.Bar(name='Draws', x=['Record'], y=[fighter['Draws']], marker_color=CHART_COLORS['draws'])
+    ])
+    fig.update_layout(height=250, showlegend=True, margin=dict(l=0, r=0, t=20, b=0))
+    return fig
+
+
+def fighter_card(fighter, history=None, figure_key=None, career=None):
+    """
+    Display fighter information card, with their bouts if a history frame is given
+    
+    figure_key, a (fighter ID, data version) pair, serves the record chart
+    from FIGURE_CACHE instead of building it on every rerun; career, a
+    CareerStats row, adds their UFC career stats.
+    """
     col1, col2, col3 = st.columns(3)
     
     with col1:
@@ -40,22 +60,93 @@ def fighter_card(fighter):
     
     with col2:
         st.markdown("**🏆 Fight Record**")
-        total_fights = fighter['Wins'] + fighter['Losses'] + fighter['Draws']
-        win_rate = (fighter['Wins'] / total_fights * 100) if total_fights > 0 else 0
-        st.write(f"✅ Wins: **{fighter['Wins']}**")
-        st.write(f"❌ Losses: **{fighter['Losses']}**")
-        st.write(f"🤝 Draws: **{fighter['Draws']}**")
-        st.write(f"📈 Win Rate: **{win_rate:.1f}%**")
+        profile = fighter_profile(fighter)
+        st.write(f"✅ Wins: **{profile['Wins']}**")
+        st.write(f"❌ Losses: **{profile['Losses']}**")
+        st.write(f"🤝 Draws: **{profile['Draws']}**")
+        st.write(f"📈 Win Rate: **{profile['Win Rate']:.1f}%**")
     
     with col3:
         st.markdown("**📉 Performance Chart**")
-        fig = go.Figure(data=[
-            go.Bar(name='Wins', x=['Record'], y=[fighter['Wins']], marker_color=CHART_COLORS['wins']),
-            go.Bar(name='Losses', x=['Record'], y=[fighter['Losses']], marker_color=CHART_COLORS['losses']),
-            go.Bar(name='Draws', x=['Record'], y=[fighter['Draws']], marker_color=CHART_COLORS['draws'])
-        ])
-        fig.update_layout(height=250, showlegend=True, margin=dict(l=0, r=0, t=20, b=0))
-        st.plotly_chart(fig, use_container_width=True)
+        if figure_key is None:
+            st.plotly_chart(record_chart(fighter), use_container_width=True)
+        else:
+            fig = FIGURE_CACHE.figure('fighter_card', *figure_key, lambda: record_chart(fighter))
+            # Fighters with the same record draw identical charts, which need distinct element keys
+            st.plotly_chart(fig, use_container_width=True, key=f"record_chart_{figure_key[0]}")
+    
+    if career is not None and career['Bouts'] > 0:
+        career_metrics(career)
+    
+    if history is not None and len(history) > 0:
+        fight_history_table(history)
+
+
+def career_metrics(career):
+    """Display striking, grappling and finishing rates from a CareerStats row"""
+    st.markdown(f"**📊 UFC Career Stats ({int(career['Bouts'])} bouts)**")
+    
+    def rate(column, fmt):
+        return "N/A" if pd.isna(career[column]) else fmt.format(career[column])
+    
+    cols = st.columns(5)
+    cols[0].metric("Strikes / Min", rate('Strikes per Min', "{:.2f}"))
+    cols[1].metric("Takedowns / 15 Min", rate('Takedowns per 15 Min', "{:.2f}"))
+    cols[2].metric("Finish Rate", rate('Finish %', "{:.0f}%"))
+    cols[3].metric("KO/TKO · Sub · Dec", "N/A" if pd.isna(career['Finish %']) else
+                   f"{career['KO/TKO %']:.0f} · {career['Submission %']:.0f} · {career['Decision %']:.0f}%")
+    minutes = career['Avg Fight Minutes']
+    cols[4].metric("Avg Fight Time", "N/A" if pd.isna(minutes) else f"{int(minutes)}:{int(minutes % 1 * 60):02d}")
+
+
+def fighter_label(fighter):
+    """One-line header of a collapsed fighter card: name, nickname and record"""
+    nickname = f" - '{fighter['Nickname']}'" if isinstance(fighter['Nickname'], str) and fighter['Nickname'] else ''
+    return (f"🥊 {fighter['First Name']} {fighter['Last Name']}{nickname} "
+            f"({fighter['Wins']}-{fighter['Losses']}-{fighter['Draws']})")
+
+
+def _turn_page(key, page):
+    st.session_state[key] = page
+
+
+def pager(total, page_size, key):
+    """
+    Previous / next controls over total items, kept in st.session_state[key]
+    
+    Returns the (start, stop) slice of the current page; the controls are
+    only drawn when there is more than one page.
+    """
+    pages = max(-(-total // page_size), 1)
+    page = min(st.session_state.get(key, 0), pages - 1)
+    start, stop = page * page_size, min((page + 1) * page_size, total)
+    if pages > 1:
+        prev_col, info_col, next_col = st.columns([1, 4, 1])
+        prev_col.button("◀ Previous", key=f"{key}_prev", disabled=page == 0,
+                        on_click=_turn_page, args=(key, page - 1))
+        info_col.caption(f"Showing {start + 1}-{stop} of {total} (page {page + 1} of {pages})")
+        next_col.button("Next ▶", key=f"{key}_next", disabled=page == pages - 1,
+                        on_click=_turn_page, args=(key, page + 1))
+    return start, stop
+
+
+def fight_history_table(history):
+    """Display a fighter's bouts from FighterIndex.history"""
+    st.markdown(f"**🗓️ UFC Fight History ({len(history)} bouts)**")
+    st.dataframe(
+        history[HISTORY_COLUMNS],
+        use_container_width=True,
+        hide_index=True,
+        column_config={'Event Date': st.column_config.DateColumn(format="MMM D, YYYY")}
+    )
+
+
+def similar_fighters(fighters_df, similarity, position):
+    """Display the fighters closest to one fighter in build, record and finishing"""
+    st.markdown(f"**🧬 Fighters Like {fighters_df['Full Name'].iat[position]}**")
+    neighbors, distances = similarity.similar(position)
+    st.dataframe(similar_table(fighters_df, neighbors, distances), use_container_width=True,
+                 hide_index=True, key=f"similar_{position}")
 
 
 def page_header(title, subtitle):
@@ -7,11 +7,33 @@ from pathlib import Path
 BASE_DIR = Path(__file__).parent.parent.parent
 DATA_DIR = BASE_DIR / "src" / "data"
 ASSETS_DIR = BASE_DIR / "assets"
+FRAME_CACHE_DIR = BASE_DIR / ".cache" / "frames"
+ELO_STATE_PATH = BASE_DIR / ".cache" / "elo_ratings.npz"
+SCRAPER_STATE_PATH = BASE_DIR / ".cache" / "scraper_state.json"
 
 # Data files
 FIGHTERS_CSV = DATA_DIR / "ufc_fighters.csv"
 EVENTS_CSV = DATA_DIR / "ufc_event_data.csv"
 
+# Fight format
+ROUND_SECONDS = 300
+
+# Upper weight limit (lbs) of each event weight class
+WEIGHT_CLASS_LBS = {
+    "Women's Strawweight": 115,
+    'Flyweight': 125,
+    "Women's Flyweight": 125,
+    'Bantamweight': 135,
+    "Women's Bantamweight": 135,
+    'Featherweight': 145,
+    "Women's Featherweight": 145,
+    'Lightweight': 155,
+    'Welterweight': 170,
+    'Middleweight': 185,
+    'Light Heavyweight': 205,
+    'Heavyweight': 265,
+}
+
 # App settings
 APP_TITLE = "UFC Analytics Dashboard"
 APP_ICON = "🥊"
@@ -19,8 +41,55 @@ PAGE_LAYOUT = "wide"
 
 # Search settings
 FUZZY_MATCH_THRESHOLD = 0.4
-MAX_SEARCH_RESULTS = 10
+MAX_SEARCH_RESULTS = 300
+SEARCH_PAGE_SIZE = 10
 MIN_FIGHTS_FOR_WINRATE = 10
+AUTOCOMPLETE_DEPTH = 10
+SEARCH_CACHE_SIZE = 256
+
+# Similar fighters: neighbors shown, and query x fighter distances computed per block
+SIMILAR_FIGHTERS = 5
+SIMILARITY_BLOCK_ELEMENTS = 1 << 22
+
+# Serialized Plotly figures kept by the figure cache
+FIGURE_CACHE_SIZE = 512
+
+# Bins of the home page win / loss histograms
+HISTOGRAM_BINS = 30
+
+# Seconds between checks of the data files for appended rows
+DATA_REFRESH_SECONDS = 30
+
+# Streaming ingestion: rows per events CSV chunk
+EVENT_CHUNK_ROWS = 50_000
+
+# Scraper settings
+SCRAPER_BASE_URL = "http://ufcstats.com"
+SCRAPER_WORKERS = 8
+SCRAPER_TIMEOUT = 20  # Seconds per request
+SCRAPER_RETRIES = 3  # Retries of connection errors and 429 / 5xx responses, with backoff
+SCRAPER_CHECKPOINT_EVERY = 25  # Pages fetched between checkpoint writes
+SCRAPER_USER_AGENT = "ufc-analytics-dashboard/1.0"
+# Days after its event date a fight card is complete; cards run past midnight in other time zones
+SCRAPER_CARD_FINAL_DAYS = 1
+
+# Leaderboard settings
+LEADERBOARD_SIZE = 20
+CAREER_MIN_BOUTS = 5  # UFC bouts needed to rank on a career stat
+
+# Rating settings
+ELO_INITIAL_RATING = 1500.0
+ELO_K_FACTOR = 32.0
+ELO_MIN_BOUTS = 5
+# K multiplier by method prefix: finishes move ratings more than split decisions
+ELO_METHOD_WEIGHTS = {
+    'KO/TKO': 1.25,
+    'SUB': 1.25,
+    'U-DEC': 1.0,
+    'M-DEC': 0.9,
+    'S-DEC': 0.75,
+    'DQ': 0.5,
+}
 
 # Color schemes
 GRADIENT_COLORS = {
@@ -1,4 +1,14 @@
-"""UFC Analytics Dashboard - Pages Package"""
-from . import home, fighter_search, events, compare, rankings
+"""UFC Analytics Dashboard - Pages Package
 
-__all__ = ['home', 'fighter_search', 'events', 'compare', 'rankings']
+Page modules are imported on first attribute access (``pages.home``), so the
+app only pays for the page being shown and the plotting libraries it uses.
+"""
+import importlib
+
+__all__ = ['home', 'fighter_search', 'events', 'compare', 'rankings', 'trends']
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
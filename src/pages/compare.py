@@ -1,12 +1,42 @@
 """
 Fighter Comparison Page
 """
+import pandas as pd
 import streamlit as st
-import plotly.graph_objects as go
-from src.components.ui_components import page_header
+from src.components.figure_cache import FIGURE_CACHE
+from src.components.ui_components import page_header, fight_history_table, similar_fighters
+from src.utils.summaries import physical_advantages
 
 
-def render(fighters_df):
+def _win_chain(fighter_index, fight_graph, winner_id, loser_id):
+    """Render the shortest chain of wins from one fighter to another"""
+    path = fight_graph.win_path(winner_id, loser_id)
+    if path is None:
+        st.info(f"No chain of wins links {fighter_index.names[winner_id]} to {fighter_index.names[loser_id]}.")
+        return
+    
+    steps = []
+    for winner, loser in zip(path[:-1], path[1:]):
+        fight = fighter_index.events_df.iloc[fight_graph.win_row(winner, loser)]
+        steps.append(f"**{fighter_index.names[winner]}** beat **{fighter_index.names[loser]}** "
+                     f"({fight['Method']}, {fight['Event Name']})")
+    st.markdown(f"{len(steps)} step(s):")
+    st.markdown("\n".join(f"{i}. {step}" for i, step in enumerate(steps, 1)))
+
+
+def _comparison_chart(f1, f2, fighter1_name, fighter2_name):
+    """Grouped wins / losses / draws bars of two fighters"""
+    import plotly.graph_objects as go  # Deferred until a comparison is drawn
+    categories = ['Wins', 'Losses', 'Draws']
+    fig = go.Figure(data=[
+        go.Bar(name=fighter1_name, x=categories, y=[f1['Wins'], f1['Losses'], f1['Draws']], marker_color='#e74c3c'),
+        go.Bar(name=fighter2_name, x=categories, y=[f2['Wins'], f2['Losses'], f2['Draws']], marker_color='#3498db')
+    ])
+    fig.update_layout(barmode='group', height=400)
+    return fig
+
+
+def render(fighters_df, fighter_index, fight_graph, similarity):
     """Render fighter comparison page"""
     page_header("⚔️ FIGHTER COMPARISON", "Compare two fighters side-by-side")
     
@@ -27,8 +57,11 @@ def render(fighters_df):
         fighter2_name = st.selectbox("🥊 Fighter 2", fighter_names, index=min(1, len(fighter_names)-1))
     
     if st.button("⚔️ Compare Fighters", type="primary", use_container_width=True):
-        f1 = fighters_df[fighters_df['Full Name'] == fighter1_name].iloc[0]
-        f2 = fighters_df[fighters_df['Full Name'] == fighter2_name].iloc[0]
+        full_names = fighters_df['Full Name'].tolist()
+        f1_id = full_names.index(fighter1_name)
+        f2_id = full_names.index(fighter2_name)
+        f1 = fighters_df.iloc[f1_id]
+        f2 = fighters_df.iloc[f2_id]
         
         st.markdown("---")
         st.markdown("### 🥊 Fighter Profiles")
@@ -58,13 +91,71 @@ def render(fighters_df):
             st.write(f"**Stance:** {f2['Stance']}")
             st.write(f"**Win Rate:** {f2['Win Rate']:.1f}%")
         
+        # Physical advantages
+        st.markdown("### 📏 Physical Advantages")
+        st.caption(f"Differences from {fighter1_name}'s side")
+        
+        cols = st.columns(3)
+        for col, (label, (advantage, unit)) in zip(cols, physical_advantages(f1, f2).items()):
+            with col:
+                st.metric(f"{label} Advantage", "N/A" if advantage is None else f"{advantage:+.1f} {unit}")
+        
+        # Nearest neighbors of each fighter in the similarity index
+        st.markdown("### 🧬 Similar Fighters")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            similar_fighters(fighters_df, similarity, f1_id)
+        
+        with col2:
+            similar_fighters(fighters_df, similarity, f2_id)
+        
         # Comparison chart
         st.markdown("### 📈 Statistical Comparison")
         
-        categories = ['Wins', 'Losses', 'Draws']
-        fig = go.Figure(data=[
-            go.Bar(name=fighter1_name, x=categories, y=[f1['Wins'], f1['Losses'], f1['Draws']], marker_color='#e74c3c'),
-            go.Bar(name=fighter2_name, x=categories, y=[f2['Wins'], f2['Losses'], f2['Draws']], marker_color='#3498db')
-        ])
-        fig.update_layout(barmode='group', height=400)
+        fig = FIGURE_CACHE.figure('compare', (f1_id, f2_id), fighters_df.attrs.get('data_version'),
+                                  lambda: _comparison_chart(f1, f2, fighter1_name, fighter2_name))
         st.plotly_chart(fig, use_container_width=True)
+        
+        # Head-to-head
+        st.markdown("### 🥊 Head-to-Head")
+        
+        direct_rows = fight_graph.head_to_head(f1_id, f2_id)
+        if len(direct_rows):
+            st.markdown(f"#### Direct Bouts (from {fighter1_name}'s corner)")
+            fight_history_table(fighter_index.history(f1_id).loc[direct_rows[::-1]])
+        else:
+            st.info("These fighters have never met in the UFC.")
+        
+        st.markdown("#### Common Opponents")
+        common = fight_graph.common_opponents(f1_id, f2_id)
+        if len(common):
+            records = {}
+            for suffix, name in [('1', fighter1_name), ('2', fighter2_name)]:
+                records[name] = (
+                    common[f'Wins {suffix}'].astype(str) + '-' + common[f'Losses {suffix}'].astype(str)
+                    + '-' + common[f'Draws {suffix}'].astype(str)
+                )
+            common_table = pd.DataFrame({'Opponent': fighter_index.names[common['Opponent ID']], **records})
+            st.dataframe(common_table, use_container_width=True, hide_index=True)
+        else:
+            st.info("No common opponents.")
+        
+        st.markdown("#### MMA Math")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            _win_chain(fighter_index, fight_graph, f1_id, f2_id)
+        
+        with col2:
+            _win_chain(fighter_index, fight_graph, f2_id, f1_id)
+        
+        # Fight histories
+        st.markdown("### 🗓️ Fight Histories")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fight_history_table(fighter_index.history(f1_id))
+        
+        with col2:
+            fight_history_table(fighter_index.history(f2_id))
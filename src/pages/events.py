@@ -4,10 +4,11 @@ Events Analysis Page
 import streamlit as st
 import plotly.express as px
 from src.components.ui_components import page_header, metric_card
+from src.utils.summaries import EVENT_FIGHT_COLUMNS
 
 
-def render(events_df):
-    """Render events analysis page"""
+def render(event_index, aggregates):
+    """Render events analysis page; aggregates is the snapshot's DashboardAggregates"""
     page_header("📅 EVENT ANALYSIS", "Explore UFC events and fight statistics")
     
     st.markdown("""
@@ -16,30 +17,55 @@ def render(events_df):
     </div>
     """, unsafe_allow_html=True)
     
-    events = sorted(events_df['Event Name'].unique(), reverse=True)
-    selected_event = st.selectbox("🎯 Select Event", events, label_visibility="collapsed")
+    col1, col2 = st.columns([2, 1])
     
-    event_data = events_df[events_df['Event Name'] == selected_event]
+    with col1:
+        first_date = event_index.event_date(event_index.names[0]).date()
+        last_date = event_index.event_date(event_index.names[-1]).date()
+        date_range = st.date_input(
+            "📆 Event dates",
+            value=(first_date, last_date),
+            min_value=first_date,
+            max_value=last_date
+        )
+    
+    with col2:
+        order = st.radio("Order", ["Newest first", "Oldest first"], horizontal=True)
+    
+    # The range picker returns a single date while the user is still choosing the end
+    start, end = (date_range[0], date_range[-1]) if date_range else (None, None)
+    events = event_index.events_between(start, end, newest_first=(order == "Newest first"))
+    if not events:
+        st.warning("⚠️ No events in the selected date range")
+        return
+    
+    selected_event = st.selectbox(
+        "🎯 Select Event",
+        events,
+        format_func=lambda name: f"{name} ({event_index.event_date(name):%B %d, %Y})",
+        label_visibility="collapsed"
+    )
+    
+    summary = aggregates.events[selected_event]
     
     st.markdown("### 📊 Event Overview")
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        metric_card(f"{len(event_data)}", "🥊 Total Fights", 'purple')
+        metric_card(f"{summary.total_fights}", "🥊 Total Fights", 'purple')
     
     with col2:
-        metric_card(f"{event_data['Event Date'].iloc[0]}", "📅 Event Date", 'pink')
+        metric_card(f"{summary.date:%B %d, %Y}", "📅 Event Date", 'pink')
     
     with col3:
-        knockdowns = event_data['KD'].str.split('-', expand=True).astype(float).sum().sum()
-        metric_card(f"{int(knockdowns)}", "💥 Total Knockdowns", 'blue')
+        metric_card(f"{summary.total_knockdowns}", "💥 Total Knockdowns", 'blue')
     
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Fight results
     st.markdown("### 🥊 Fight Results")
     st.dataframe(
-        event_data[['Fighter1', 'Fighter2', 'Result', 'Weight Class', 'Method', 'Round', 'Time']], 
+        event_index.fights(selected_event)[EVENT_FIGHT_COLUMNS], 
         use_container_width=True,
         hide_index=True
     )
@@ -50,14 +76,15 @@ def render(events_df):
     
     with col1:
         st.markdown("**Finish Methods**")
-        methods = event_data['Method'].value_counts()
-        fig = px.pie(values=methods.values, names=methods.index, hole=0.3)
+        methods = summary.methods
+        fig = px.pie(values=list(methods.values), names=list(methods.labels), hole=0.3)
         fig.update_traces(textposition='inside', textinfo='percent+label')
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.markdown("**Weight Class Distribution**")
-        weight_class = event_data['Weight Class'].value_counts()
-        fig = px.bar(x=weight_class.index, y=weight_class.values, color=weight_class.values, color_continuous_scale='Reds')
+        weight_class = summary.weight_classes
+        fig = px.bar(x=list(weight_class.labels), y=list(weight_class.values), color=list(weight_class.values),
+                     color_continuous_scale='Reds')
         fig.update_layout(showlegend=False)
         st.plotly_chart(fig, use_container_width=True)
@@ -1,11 +1,65 @@
 """
 Fighter Search Page with Advanced Search Engine
 """
+import pandas as pd
 import streamlit as st
-from src.components.ui_components import page_header, fighter_card, suggestion_box
+from src.components.ui_components import (
+    page_header, fighter_card, fighter_label, pager, similar_fighters, suggestion_box
+)
+from src.config.settings import MAX_SEARCH_RESULTS, SEARCH_PAGE_SIZE
 
 
-def render(fighters_df, search_engine):
+def _use_suggestion(suggestion):
+    """Put a suggested name into the search box before the next rerun"""
+    st.session_state.smart_search = suggestion
+
+
+def _physical_filter(fighters_df):
+    """Range sliders over the numeric measurements; returns the matching rows mask"""
+    mask = pd.Series(True, index=fighters_df.index)
+    with st.expander("📏 Filter by height, reach and weight", expanded=False):
+        for label, column, unit in [('Height', 'Height (in)', 'in'),
+                                    ('Reach', 'Reach (in)', 'in'),
+                                    ('Weight', 'Weight (lbs)', 'lbs')]:
+            values = fighters_df[column]
+            low, high = float(values.min()), float(values.max())
+            selected = st.slider(f"{label} ({unit})", low, high, (low, high), step=1.0)
+            # Untouched sliders keep fighters whose measurement is unknown
+            if selected != (low, high):
+                mask &= values.between(*selected)
+    return mask
+
+
+def _show_results(results, query, fighters_df, fighter_index, similarity, career_stats):
+    """
+    One page of search results as lazily rendered fighter cards
+    
+    A collapsed card sends only its header row; its details, bouts and chart
+    are built on the rerun that expanding it triggers, so the cost of a page
+    does not grow with the number of results.
+    """
+    # A new query starts again from the first page
+    if st.session_state.get('search_results_query') != query:
+        st.session_state.search_results_query = query
+        st.session_state.search_results_page = 0
+    
+    st.success(f"✅ Found {len(results)} fighter(s) matching '{query}'")
+    start, stop = pager(len(results), SEARCH_PAGE_SIZE, 'search_results_page')
+    page = results.iloc[start:stop]
+    positions = fighters_df.index.get_indexer(page.index)
+    version = fighters_df.attrs.get('data_version')
+    
+    for rank, (position, (_, fighter)) in enumerate(zip(positions.tolist(), page.iterrows()), start):
+        expander = st.expander(fighter_label(fighter), expanded=(rank == 0),
+                               key=f"search_result_{position}", on_change="rerun")
+        if expander.open:
+            with expander:
+                fighter_card(fighter, fighter_index.history(position), figure_key=(position, version),
+                             career=career_stats.row(position))
+                similar_fighters(fighters_df, similarity, position)
+
+
+def render(fighters_df, search_engine, fighter_index, similarity, career_stats):
     """Render fighter search page"""
     page_header("🔍 FIGHTER SEARCH", "Advanced search with multi-strategy matching")
     
@@ -35,19 +89,20 @@ def render(fighters_df, search_engine):
                 key="smart_search"
             )
             
+            # Type-ahead completions from the prefix index
+            completions = [c for c in search_engine.autocomplete(query, n=5) if c != query.strip().lower()]
+            if completions:
+                completion_cols = st.columns(len(completions))
+                for col, completion in zip(completion_cols, completions):
+                    col.button(completion.title(), key=f"complete_{completion}",
+                               on_click=_use_suggestion, args=(completion,))
+            
             if query:
                 with st.spinner("Searching..."):
-                    results = search_engine.search(query, max_results=10)
+                    results = search_engine.search(query, max_results=MAX_SEARCH_RESULTS)
                 
                 if len(results) > 0:
-                    st.success(f"✅ Found {len(results)} fighter(s) matching '{query}'")
-                    
-                    for idx, fighter in results.iterrows():
-                        with st.expander(
-                            f"🥊 {fighter['First Name']} {fighter['Last Name']} - '{fighter['Nickname']}'",
-                            expanded=(idx == results.index[0])
-                        ):
-                            fighter_card(fighter)
+                    _show_results(results, query, fighters_df, fighter_index, similarity, career_stats)
                 else:
                     st.warning(f"⚠️ No fighters found for '{query}'")
                     
@@ -61,9 +116,8 @@ def render(fighters_df, search_engine):
                         """, unsafe_allow_html=True)
                         
                         for suggestion in suggestions:
-                            if st.button(f"👉 {suggestion.title()}", key=f"suggest_{suggestion}"):
-                                st.session_state.smart_search = suggestion
-                                st.rerun()
+                            st.button(f"👉 {suggestion.title()}", key=f"suggest_{suggestion}",
+                                      on_click=_use_suggestion, args=(suggestion,))
                     
                     # Tips
                     st.info("""
@@ -78,7 +132,8 @@ def render(fighters_df, search_engine):
         
         else:
             # Dropdown search
-            fighter_names = [''] + sorted(fighters_df['Full Name'].tolist())
+            in_range = _physical_filter(fighters_df)
+            fighter_names = [''] + sorted(fighters_df.loc[in_range, 'Full Name'].tolist())
             selected = st.selectbox(
                 "Select fighter from list",
                 options=fighter_names,
@@ -86,14 +141,18 @@ def render(fighters_df, search_engine):
             )
             
             if selected and selected != '':
-                fighter = fighters_df[fighters_df['Full Name'] == selected].iloc[0]
+                position = fighters_df['Full Name'].tolist().index(selected)
+                fighter = fighters_df.iloc[position]
                 
                 st.markdown(f"### 🥊 {fighter['First Name']} {fighter['Last Name']}")
                 if fighter['Nickname']:
                     st.markdown(f"**Nickname:** *'{fighter['Nickname']}'*")
                 
                 st.markdown("---")
-                fighter_card(fighter)
+                fighter_card(fighter, fighter_index.history(position),
+                             figure_key=(position, fighters_df.attrs.get('data_version')),
+                             career=career_stats.row(position))
+                similar_fighters(fighters_df, similarity, position)
             else:
                 st.info("👆 Select a fighter from the dropdown")
     
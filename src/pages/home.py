@@ -6,8 +6,8 @@ import plotly.express as px
 from src.components.ui_components import page_header, metric_card
 
 
-def render(fighters_df, events_df):
-    """Render home dashboard"""
+def render(home):
+    """Render home dashboard from its HomeAggregates"""
     page_header("🥊 UFC ANALYTICS DASHBOARD", "Comprehensive UFC Fighter & Event Statistics")
     
     # Welcome message
@@ -24,17 +24,16 @@ def render(fighters_df, events_df):
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        metric_card(f"{len(fighters_df):,}", "🥊 Total Fighters", 'purple')
+        metric_card(f"{home.total_fighters:,}", "🥊 Total Fighters", 'purple')
     
     with col2:
-        metric_card(f"{events_df['Event Name'].nunique():,}", "📅 Total Events", 'pink')
+        metric_card(f"{home.total_events:,}", "📅 Total Events", 'pink')
     
     with col3:
-        metric_card(f"{len(events_df):,}", "🥊 Total Fights", 'blue')
+        metric_card(f"{home.total_fights:,}", "🥊 Total Fights", 'blue')
     
     with col4:
-        avg_wins = fighters_df['Wins'].mean()
-        metric_card(f"{avg_wins:.1f}", "🏆 Avg Wins/Fighter", 'green')
+        metric_card(f"{home.avg_wins:.1f}", "🏆 Avg Wins/Fighter", 'green')
     
     st.markdown("<br>", unsafe_allow_html=True)
     
@@ -43,14 +42,14 @@ def render(fighters_df, events_df):
     
     with col1:
         st.markdown("### 📊 Top 10 Weight Classes")
-        weight_counts = fighters_df['Weight'].value_counts().head(10)
+        weight_counts = home.weight_counts
         fig = px.bar(
-            x=weight_counts.index, 
-            y=weight_counts.values,
+            x=list(weight_counts.labels), 
+            y=list(weight_counts.values),
             labels={'x': 'Weight Class', 'y': 'Number of Fighters'},
-            color=weight_counts.values,
+            color=list(weight_counts.values),
             color_continuous_scale='Reds',
-            text=weight_counts.values
+            text=list(weight_counts.values)
         )
         fig.update_traces(textposition='outside')
         fig.update_layout(showlegend=False, height=400)
@@ -58,10 +57,10 @@ def render(fighters_df, events_df):
     
     with col2:
         st.markdown("### 🥋 Fighting Stance Distribution")
-        stance_counts = fighters_df['Stance'].value_counts()
+        stance_counts = home.stance_counts
         fig = px.pie(
-            values=stance_counts.values,
-            names=stance_counts.index,
+            values=list(stance_counts.values),
+            names=list(stance_counts.labels),
             color_discrete_sequence=px.colors.sequential.RdBu,
             hole=0.4
         )
@@ -77,24 +76,24 @@ def render(fighters_df, events_df):
     
     with col1:
         st.markdown("**Wins Distribution**")
-        fig = px.histogram(
-            fighters_df, 
-            x='Wins', 
-            nbins=30,
-            labels={'Wins': 'Number of Wins', 'count': 'Number of Fighters'},
+        fig = px.bar(
+            x=list(home.wins.centers), 
+            y=list(home.wins.counts), 
+            labels={'x': 'Number of Wins', 'y': 'Number of Fighters'},
             color_discrete_sequence=['#2ecc71']
         )
-        fig.update_layout(showlegend=False, height=350)
+        fig.update_traces(width=home.wins.width)
+        fig.update_layout(showlegend=False, height=350, bargap=0)
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.markdown("**Losses Distribution**")
-        fig = px.histogram(
-            fighters_df,
-            x='Losses',
-            nbins=30,
-            labels={'Losses': 'Number of Losses', 'count': 'Number of Fighters'},
+        fig = px.bar(
+            x=list(home.losses.centers),
+            y=list(home.losses.counts),
+            labels={'x': 'Number of Losses', 'y': 'Number of Fighters'},
             color_discrete_sequence=['#e74c3c']
         )
-        fig.update_layout(showlegend=False, height=350)
+        fig.update_traces(width=home.losses.width)
+        fig.update_layout(showlegend=False, height=350, bargap=0)
         st.plotly_chart(fig, use_container_width=True)
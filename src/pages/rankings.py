@@ -3,38 +3,56 @@ Rankings Page
 """
 import streamlit as st
 from src.components.ui_components import page_header
-from src.config.settings import MIN_FIGHTS_FOR_WINRATE
+from src.config.settings import MIN_FIGHTS_FOR_WINRATE, ELO_MIN_BOUTS, LEADERBOARD_SIZE, CAREER_MIN_BOUTS
+from src.utils.career_stats import RATE_COLUMNS
+from src.utils.summaries import ranking_tables, elo_table, career_table
 
 
-def render(fighters_df):
+def render(fighters_df, elo_ratings, leaderboards, career_stats):
     """Render rankings page"""
     page_header("🏆 RECORDS & RANKINGS", "Top fighters across different categories")
     
     st.markdown("""
     <div class='info-box'>
-        <p>🏆 <strong>Explore rankings</strong> based on wins, win rate, and activity level.</p>
+        <p>🏆 <strong>Explore rankings</strong> based on wins, win rate, activity level, and Elo rating.</p>
     </div>
     """, unsafe_allow_html=True)
     
-    tab1, tab2, tab3 = st.tabs(["🥇 Most Wins", "📈 Best Win Rate", "🔥 Most Active"])
+    col1, col2 = st.columns(2)
+    with col1:
+        weight_class = st.selectbox("🏋️ Weight Class", ["All Divisions"] + leaderboards.weight_classes)
+    with col2:
+        stance = st.selectbox("🥋 Stance", ["All Stances"] + leaderboards.stance_names)
+    weight_class = None if weight_class == "All Divisions" else weight_class
+    stance = None if stance == "All Stances" else stance
+    
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(
+        ["🥇 Most Wins", "📈 Best Win Rate", "🔥 Most Active", "⭐ Elo Rating", "📊 Career Stats"]
+    )
+    
+    tables = ranking_tables(leaderboards, weight_class, stance)
     
     with tab1:
-        st.markdown("### 🥇 Top 20 Fighters with Most Wins")
-        top_wins = fighters_df.nlargest(20, 'Wins')[
-            ['First Name', 'Last Name', 'Nickname', 'Wins', 'Losses', 'Draws', 'Weight', 'Win Rate']
-        ]
-        top_wins['Record'] = top_wins['Wins'].astype(str) + '-' + top_wins['Losses'].astype(str) + '-' + top_wins['Draws'].astype(str)
-        st.dataframe(top_wins, use_container_width=True, hide_index=True)
+        st.markdown(f"### 🥇 Top {LEADERBOARD_SIZE} Fighters with Most Wins")
+        st.dataframe(tables['Wins'], use_container_width=True, hide_index=True)
     
     with tab2:
-        st.markdown(f"### 📈 Top 20 Fighters by Win Rate (Minimum {MIN_FIGHTS_FOR_WINRATE} fights)")
-        qualified = fighters_df[fighters_df['Total Fights'] >= MIN_FIGHTS_FOR_WINRATE].nlargest(20, 'Win Rate')
-        qualified = qualified[['First Name', 'Last Name', 'Nickname', 'Wins', 'Losses', 'Win Rate', 'Total Fights', 'Weight']]
-        st.dataframe(qualified, use_container_width=True, hide_index=True)
+        st.markdown(f"### 📈 Top {LEADERBOARD_SIZE} Fighters by Win Rate (Minimum {MIN_FIGHTS_FOR_WINRATE} fights)")
+        st.dataframe(tables['Win Rate'], use_container_width=True, hide_index=True)
     
     with tab3:
-        st.markdown("### 🔥 Top 20 Most Active Fighters")
-        most_active = fighters_df.nlargest(20, 'Total Fights')[
-            ['First Name', 'Last Name', 'Nickname', 'Total Fights', 'Wins', 'Losses', 'Win Rate', 'Weight']
-        ]
-        st.dataframe(most_active, use_container_width=True, hide_index=True)
+        st.markdown(f"### 🔥 Top {LEADERBOARD_SIZE} Most Active Fighters")
+        st.dataframe(tables['Total Fights'], use_container_width=True, hide_index=True)
+    
+    with tab4:
+        st.markdown(f"### ⭐ Top {LEADERBOARD_SIZE} Fighters by Elo Rating (Minimum {ELO_MIN_BOUTS} UFC bouts)")
+        st.caption("Replayed chronologically from every UFC result; finishes move ratings more than split decisions.")
+        top_elo = elo_table(fighters_df, elo_ratings, leaderboards.members(weight_class, stance))
+        st.dataframe(top_elo, use_container_width=True, hide_index=True)
+    
+    with tab5:
+        metric = st.selectbox("📊 Career Stat", RATE_COLUMNS)
+        st.markdown(f"### 📊 Top {LEADERBOARD_SIZE} Fighters by {metric} (Minimum {CAREER_MIN_BOUTS} UFC bouts)")
+        st.caption("Computed from every UFC bout; per-minute rates count only bouts with recorded stats.")
+        top_career = career_table(fighters_df, career_stats, metric, leaderboards.members(weight_class, stance))
+        st.dataframe(top_career, use_container_width=True, hide_index=True)
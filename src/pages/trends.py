@@ -0,0 +1,56 @@
+"""
+Trends Page
+"""
+import streamlit as st
+import plotly.express as px
+from src.components.figure_cache import FIGURE_CACHE
+from src.components.ui_components import page_header
+from src.utils.trends import PERIODS
+
+# Chart title -> (trend columns, y axis label)
+TREND_CHARTS = {
+    "🏁 How Fights End": (['Finish Rate', 'Decision Rate'], "% of fights"),
+    "⏱️ Average Rounds": (['Avg Rounds'], "Rounds"),
+    "💥 Knockdowns per Fight": (['Knockdowns per Fight'], "Knockdowns"),
+    "🥊 Fights per Event": (['Fights per Event'], "Fights"),
+}
+
+
+def _trend_chart(table, columns, y_label):
+    """Line chart of some trend columns over the table's periods"""
+    fig = px.line(table, y=columns, markers=len(table) <= 40, labels={'value': y_label, 'variable': ''})
+    fig.update_layout(height=350, hovermode='x unified', showlegend=len(columns) > 1,
+                      legend=dict(orientation='h', y=1.1))
+    return fig
+
+
+def render(trends, version):
+    """Render trends page from the snapshot's TrendIndex"""
+    page_header("📈 TRENDS", "How UFC fights have changed over time")
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        period = st.radio("Group by", PERIODS, horizontal=True)
+    
+    with col2:
+        weight_class = st.selectbox("🏋️ Weight Class", ["All Divisions"] + list(trends.weight_classes))
+    weight_class = None if weight_class == "All Divisions" else weight_class
+    
+    table = trends.trends(period, weight_class)
+    if not table['Fights'].sum():
+        st.warning("⚠️ No fights for the selected filters")
+        return
+    
+    charts = list(TREND_CHARTS.items())
+    for row in range(0, len(charts), 2):
+        cols = st.columns(2)
+        for col, (title, (columns, y_label)) in zip(cols, charts[row:row + 2]):
+            with col:
+                st.markdown(f"### {title}")
+                fig = FIGURE_CACHE.figure('trends', (period, weight_class, title), version,
+                                          lambda: _trend_chart(table, columns, y_label))
+                st.plotly_chart(fig, use_container_width=True, key=f"trend_{title}")
+    
+    with st.expander("📋 Trend Data", expanded=False):
+        st.dataframe(table.round(2), use_container_width=True)
@@ -0,0 +1,162 @@
+"""
+Materialized dashboard aggregates, computed once per data version
+
+The home page's headline counts, distributions and histograms and every
+event's method / weight class breakdown are built in one pass when a
+DataSnapshot is made, so rendering a page only looks them up.
+"""
+from typing import Dict, List, NamedTuple, Tuple
+
+import numpy as np
+import pandas as pd
+from src.config.settings import HISTOGRAM_BINS
+from src.utils.event_index import EventIndex
+from src.utils.summaries import overview, weight_distribution, stance_distribution
+
+
+class Counts(NamedTuple):
+    """Category labels and their counts, most common first"""
+    labels: Tuple[str, ...]
+    values: Tuple[int, ...]
+    
+    @classmethod
+    def from_series(cls, counts: pd.Series) -> 'Counts':
+        return cls(tuple(str(label) for label in counts.index), tuple(int(count) for count in counts))
+
+
+class Histogram(NamedTuple):
+    """Equal-width bins: bin i counts the values in [edges[i], edges[i + 1])"""
+    edges: Tuple[float, ...]
+    counts: Tuple[int, ...]
+    
+    @property
+    def width(self) -> float:
+        return self.edges[1] - self.edges[0] if len(self.edges) > 1 else 1.0
+    
+    @property
+    def centers(self) -> Tuple[float, ...]:
+        return tuple(edge + self.width / 2 for edge in self.edges[:-1])
+
+
+class HomeAggregates(NamedTuple):
+    """Everything the home page shows"""
+    total_fighters: int
+    total_events: int
+    total_fights: int
+    avg_wins: float
+    weight_counts: Counts
+    stance_counts: Counts
+    wins: Histogram
+    losses: Histogram
+
+
+class EventBreakdown(NamedTuple):
+    """Totals and method / weight class counts of one event"""
+    name: str
+    date: pd.Timestamp
+    total_fights: int
+    total_knockdowns: int
+    methods: Counts
+    weight_classes: Counts
+
+
+def histogram(values, nbins: int = HISTOGRAM_BINS) -> Histogram:
+    """At most nbins bins of a whole-number width, starting at the floor of the smallest value"""
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return Histogram((), ())
+    low, high = np.floor(values.min()), np.floor(values.max())
+    width = max(np.ceil((high - low + 1) / nbins), 1.0)
+    n_bins = int((high - low) // width) + 1
+    counts = np.bincount(((values - low) // width).astype(np.int64), minlength=n_bins)
+    edges = low + width * np.arange(n_bins + 1)
+    return Histogram(tuple(edges.tolist()), tuple(counts.tolist()))
+
+
+def _counts_by_event(column: pd.Series, row_events: np.ndarray, n_events: int) -> List[Counts]:
+    """Per-event counts of a column's values, most common first (ties in category order)"""
+    column = column if isinstance(column.dtype, pd.CategoricalDtype) else column.astype('category')
+    labels = np.asarray(column.cat.categories.astype(str), dtype=object)
+    codes = column.cat.codes.to_numpy().astype(np.int64)
+    present = codes >= 0
+    keys, counts = np.unique(row_events[present] * len(labels) + codes[present], return_counts=True)
+    events, codes = np.divmod(keys, len(labels))
+    order = np.lexsort((codes, -counts, events))
+    events, codes, counts = events[order], codes[order], counts[order]
+    bounds = np.searchsorted(events, np.arange(n_events + 1))
+    return [
+        Counts(tuple(labels[codes[lo:hi]].tolist()), tuple(counts[lo:hi].tolist()))
+        for lo, hi in zip(bounds[:-1], bounds[1:])
+    ]
+
+
+def event_breakdowns(events_df: pd.DataFrame, event_index: EventIndex,
+                     first_event: int = 0) -> Dict[str, EventBreakdown]:
+    """Breakdown of every event from position first_event of event_index on, in one pass over their rows"""
+    starts, stops = event_index.row_ranges()
+    starts, stops = starts[first_event:], stops[first_event:]
+    if not len(starts):
+        return {}
+    rows = events_df.iloc[int(starts[0]):]
+    sizes = stops - starts
+    row_events = np.repeat(np.arange(len(starts)), sizes)
+    knockdowns = rows['Fighter1 KD'].to_numpy(dtype=np.int64) + rows['Fighter2 KD'].to_numpy(dtype=np.int64)
+    knockdowns = np.add.reduceat(knockdowns, starts - starts[0])
+    methods = _counts_by_event(rows['Method'], row_events, len(starts))
+    weight_classes = _counts_by_event(rows['Weight Class'], row_events, len(starts))
+    
+    names = event_index.names[first_event:].tolist()
+    dates = event_index.dates[first_event:]
+    return {
+        name: EventBreakdown(name, pd.Timestamp(date), int(size), int(kd), method_counts, weight_class_counts)
+        for name, date, size, kd, method_counts, weight_class_counts
+        in zip(names, dates, sizes.tolist(), knockdowns.tolist(), methods, weight_classes)
+    }
+
+
+def home_aggregates(fighters_df: pd.DataFrame, events_df: pd.DataFrame) -> HomeAggregates:
+    """Headline counts, top weights, stances and win / loss histograms"""
+    totals = overview(fighters_df, events_df)
+    return HomeAggregates(
+        total_fighters=totals['Total Fighters'],
+        total_events=totals['Total Events'],
+        total_fights=totals['Total Fights'],
+        avg_wins=totals['Avg Wins/Fighter'],
+        weight_counts=Counts.from_series(weight_distribution(fighters_df, 10)),
+        stance_counts=Counts.from_series(stance_distribution(fighters_df)),
+        wins=histogram(fighters_df['Wins']),
+        losses=histogram(fighters_df['Losses']),
+    )
+
+
+class DashboardAggregates:
+    """
+    Home and events page aggregates of one data version
+    
+    Never modified once built: appended() returns the aggregates of the next
+    version, recomputing only the events that changed.
+    """
+    
+    def __init__(self, version: int, home: HomeAggregates, events: Dict[str, EventBreakdown]):
+        self.version = version
+        self.home = home
+        self.events = events
+    
+    @classmethod
+    def build(cls, version: int, fighters_df: pd.DataFrame, events_df: pd.DataFrame,
+              event_index: EventIndex) -> 'DashboardAggregates':
+        return cls(version, home_aggregates(fighters_df, events_df), event_breakdowns(events_df, event_index))
+    
+    def appended(self, version: int, events_df: pd.DataFrame, event_index: EventIndex) -> 'DashboardAggregates':
+        """
+        Aggregates after rows were appended to the events frame (the roster unchanged)
+        
+        Only the last known event (which the new rows may continue) and the
+        new events are recomputed.
+        """
+        first_event = max(len(self.events) - 1, 0)
+        events = dict(self.events)
+        events.update(event_breakdowns(events_df, event_index, first_event))
+        home = self.home._replace(total_events=len(event_index), total_fights=len(events_df))
+        return DashboardAggregates(version, home, events)
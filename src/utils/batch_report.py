@@ -0,0 +1,255 @@
+"""
+Headless batch reports: event summaries, rankings and fighter profiles as JSON / HTML / CSV
+
+Only pandas/NumPy modules are imported, never Streamlit, so this runs from
+cron or CI. Entry point: report.py at the repository root.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from html import escape
+from pathlib import Path
+from typing import Dict, List, Sequence
+import json
+import math
+import re
+import time
+
+import numpy as np
+import pandas as pd
+from src.config.settings import FIGHTERS_CSV, EVENTS_CSV
+from src.utils.data_loader import load_fighters_data, load_events_data
+from src.utils.event_index import EventIndex
+from src.utils.fighter_index import FighterIndex
+from src.utils.leaderboards import Leaderboards, METRICS, fighter_divisions
+from src.utils.ratings import EloRatings
+from src.utils import summaries
+
+REPORT_FORMATS = ('json', 'html', 'csv')
+
+
+def generate_reports(out_dir, formats: Sequence[str] = REPORT_FORMATS, workers: int = 1,
+                     fighters_csv=FIGHTERS_CSV, events_csv=EVENTS_CSV) -> dict:
+    """
+    Write every report under out_dir and return the run manifest
+    
+    Layout: overview.*, rankings.*, events.csv/json (one row per event),
+    fighters.csv/json (one row per fighter), events/<n>-<slug>.* and
+    fighters/<id>-<slug>.*. Events and fighters are split into chunks and
+    fanned out over a process pool when workers > 1.
+    """
+    start = time.perf_counter()
+    out_dir = Path(out_dir)
+    (out_dir / 'events').mkdir(parents=True, exist_ok=True)
+    (out_dir / 'fighters').mkdir(parents=True, exist_ok=True)
+    
+    fighters_df = load_fighters_data(fighters_csv)
+    events_df = load_events_data(events_csv)
+    fighter_index = FighterIndex(fighters_df, events_df)
+    event_index = EventIndex(events_df)
+    # Replayed rather than loaded from ELO_STATE_PATH: the batch may run on other CSVs
+    ratings = EloRatings()
+    ratings.update_from_events(events_df, fighter_index)
+    elo_ratings = ratings.for_fighters(fighter_index)
+    
+    write_report(out_dir / 'overview', 'UFC Overview', {
+        **summaries.overview(fighters_df, events_df),
+        'Weight Distribution': summaries.weight_distribution(fighters_df),
+        'Stance Distribution': summaries.stance_distribution(fighters_df),
+    }, formats)
+    _write_rankings(out_dir, fighters_df, fighter_index, elo_ratings, formats)
+    
+    jobs = [('events', chunk) for chunk in _chunks(list(range(len(event_index))), workers)]
+    jobs += [('fighters', chunk) for chunk in _chunks(list(range(len(fighters_df))), workers)]
+    kinds, tasks = zip(*jobs)
+    state = (fighters_df, events_df, elo_ratings, str(out_dir), tuple(formats))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=state) as pool:
+            chunk_rows = list(pool.map(_report_chunk, kinds, tasks))
+    else:
+        _init_worker(*state)
+        chunk_rows = [_report_chunk(kind, chunk) for kind, chunk in zip(kinds, tasks)]
+    
+    for kind in ['events', 'fighters']:
+        rows = [row for chunk_kind, chunk in zip(kinds, chunk_rows) if chunk_kind == kind for row in chunk]
+        write_report(out_dir / kind, f"UFC {kind.title()}", {kind.title(): pd.DataFrame(rows)}, formats)
+    
+    manifest = {
+        'Generated At': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'Fighters Data Version': fighters_df.attrs.get('data_version'),
+        'Events Data Version': events_df.attrs.get('data_version'),
+        'Events': len(event_index),
+        'Fighters': len(fighters_df),
+        'Formats': list(formats),
+        'Workers': workers,
+        'Seconds': round(time.perf_counter() - start, 2),
+    }
+    (out_dir / 'manifest.json').write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def _chunks(items: List[int], workers: int) -> List[List[int]]:
+    """About four chunks per worker so uneven chunks still balance"""
+    size = max(1, math.ceil(len(items) / (workers * 4)))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _write_rankings(out_dir: Path, fighters_df, fighter_index, elo_ratings, formats):
+    """Every leaderboard slice plus the Elo board, as one report"""
+    leaderboards = Leaderboards(fighters_df, fighter_divisions(fighters_df, fighter_index))
+    slices = [(None, None)] + [(weight_class, None) for weight_class in leaderboards.weight_classes] + \
+        [(None, stance) for stance in leaderboards.stance_names]
+    
+    boards = []
+    for weight_class, stance in slices:
+        tables = summaries.ranking_tables(leaderboards, weight_class, stance)
+        tables['Elo'] = summaries.elo_table(fighters_df, elo_ratings, leaderboards.members(weight_class, stance))
+        for metric in METRICS + ['Elo']:
+            board = tables[metric].copy()
+            board.insert(0, 'Rank', np.arange(1, len(board) + 1))
+            board.insert(0, 'Metric', metric)
+            board.insert(1, 'Stance', stance or 'All')
+            board.insert(1, 'Weight Class', weight_class or 'All')
+            boards.append(board)
+    # Boards have different columns; nullable dtypes keep integer columns integral across the gaps
+    rankings = pd.concat(boards, ignore_index=True).convert_dtypes(convert_string=False)
+    write_report(out_dir / 'rankings', 'UFC Rankings', {'Rankings': rankings}, formats)
+
+
+def _init_worker(fighters_df, events_df, elo_ratings, out_dir, formats):
+    """Process pool initializer: indexes are rebuilt per worker from the shipped frames"""
+    global _worker_state
+    _worker_state = {
+        'fighters_df': fighters_df,
+        'fighter_index': FighterIndex(fighters_df, events_df),
+        'event_index': EventIndex(events_df),
+        'elo_ratings': elo_ratings,
+        'out_dir': Path(out_dir),
+        'formats': formats,
+    }
+
+
+def _report_chunk(kind: str, positions: List[int]) -> List[dict]:
+    """Process pool task writing the reports of some events or fighters; returns their index rows"""
+    state = _worker_state
+    rows = []
+    for position in positions:
+        if kind == 'events':
+            name = state['event_index'].names[position]
+            summary = summaries.event_summary(state['event_index'].fights(name))
+            path = state['out_dir'] / 'events' / f"{position:04d}-{slugify(name)}"
+            write_report(path, name, summary, state['formats'])
+            rows.append({key: value for key, value in summary.items()
+                         if not isinstance(value, (pd.DataFrame, pd.Series))})
+        else:
+            fighter = state['fighters_df'].iloc[position]
+            profile = summaries.fighter_profile(fighter, state['fighter_index'].history(position),
+                                                state['elo_ratings'].iloc[position])
+            path = state['out_dir'] / 'fighters' / f"{position:04d}-{slugify(profile['Name'])}"
+            write_report(path, profile['Name'], profile, state['formats'])
+            rows.append({'Fighter ID': position,
+                         **{key: value for key, value in profile.items() if not isinstance(value, pd.DataFrame)}})
+        rows[-1]['File'] = str(path.relative_to(state['out_dir']))
+    return rows
+
+
+def slugify(text: str) -> str:
+    """File-name-safe lowercase form of a name"""
+    return re.sub(r'[^a-z0-9]+', '-', str(text).lower()).strip('-') or 'unnamed'
+
+
+def write_report(path: Path, title: str, payload: Dict, formats: Sequence[str]):
+    """
+    Write one report as path.json / path.html / path.csv
+    
+    payload mixes scalars, Series and DataFrames. JSON holds everything,
+    HTML renders scalars as a table followed by each Series/DataFrame, and
+    CSV holds the first DataFrame (or the scalars if there is none).
+    """
+    tables = {key: value for key, value in payload.items() if isinstance(value, (pd.DataFrame, pd.Series))}
+    scalars = {key: value for key, value in payload.items() if key not in tables}
+    # Frames converted to plain column lists once, shared by JSON and HTML
+    columns = {key: _json_columns(table) for key, table in tables.items() if isinstance(table, pd.DataFrame)}
+    
+    if 'json' in formats:
+        document = {key: _json_value(value) for key, value in scalars.items()}
+        for key, table in tables.items():
+            if key in columns:
+                document[key] = [dict(zip(columns[key], row)) for row in zip(*columns[key].values())]
+            else:
+                document[key] = {str(label): _json_value(value) for label, value in table.items()}
+        path.with_suffix('.json').write_text(json.dumps(document, indent=2, ensure_ascii=False), encoding='utf-8')
+    
+    if 'csv' in formats:
+        frames = [table for table in tables.values() if isinstance(table, pd.DataFrame)]
+        frame = frames[0] if frames else pd.DataFrame([{key: _json_value(value) for key, value in scalars.items()}])
+        frame.to_csv(path.with_suffix('.csv'), index=False)
+    
+    if 'html' in formats:
+        sections = [f"<h1>{escape(title)}</h1>"]
+        if scalars:
+            sections.append(_html_table(None, [[key, _json_value(value)] for key, value in scalars.items()]))
+        for key, table in tables.items():
+            sections.append(f"<h2>{escape(key)}</h2>")
+            if isinstance(table, pd.Series):
+                sections.append(_html_table([table.index.name or '', 'Count'], list(map(list, table.items()))))
+            else:
+                sections.append(_html_table(list(table.columns), zip(*columns[key].values())))
+        path.with_suffix('.html').write_text(_HTML_PAGE.format(title=escape(title), body='\n'.join(sections)),
+                                             encoding='utf-8')
+
+
+def _json_value(value):
+    """Plain JSON value of a pandas / NumPy scalar"""
+    if isinstance(value, pd.Timestamp):
+        return value.date().isoformat()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def _json_columns(frame: pd.DataFrame) -> Dict[str, list]:
+    """Each column as a list of plain values: ISO dates, None for missing"""
+    columns = {}
+    for column in frame.columns:
+        values = frame[column]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            values = values.dt.strftime('%Y-%m-%d')
+        missing = values.isna().to_numpy()
+        plain = values.tolist()
+        if missing.any():
+            plain = [None if is_missing else value for value, is_missing in zip(plain, missing)]
+        columns[column] = plain
+    return columns
+
+
+def _html_table(header, rows) -> str:
+    """Escaped HTML table; pandas' to_html costs more than the rest of a report"""
+    cell = lambda value: '' if value is None else escape(str(value))  # noqa: E731
+    lines = ['<table>']
+    if header:
+        lines.append('<tr>' + ''.join(f'<th>{cell(name)}</th>' for name in header) + '</tr>')
+    lines.extend('<tr>' + ''.join(f'<td>{cell(value)}</td>' for value in row) + '</tr>' for row in rows)
+    lines.append('</table>')
+    return '\n'.join(lines)
+
+
+_HTML_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2rem; }}
+table {{ border-collapse: collapse; margin-bottom: 1.5rem; }}
+th, td {{ border: 1px solid #ddd; padding: 0.3rem 0.6rem; text-align: left; }}
+h1 {{ color: #d62728; }}
+</style>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
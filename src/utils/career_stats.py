@@ -0,0 +1,115 @@
+"""
+Per-fighter UFC career stats: one columnar table of totals and rates, keyed by fighter ID
+"""
+import numpy as np
+import pandas as pd
+from src.utils.event_stream import FAMILY_NAMES, STAT_TOTALS, method_families
+from src.utils.ratings import fight_outcomes, side_outcomes
+
+# Summed over a fighter's bouts; Stat Seconds only counts bouts with recorded stats
+TOTAL_COLUMNS = ['Bouts', 'Wins', 'Losses', 'Draws', 'No Contests', *STAT_TOTALS.values(),
+                 'Fight Seconds', 'Stat Seconds', 'KO/TKO Wins', 'Submission Wins', 'Decision Wins']
+# Derived from the totals of one fighter; NaN when there is nothing to divide by
+RATE_COLUMNS = ['Strikes per Min', 'Takedowns per 15 Min', 'Knockdowns per 15 Min',
+                'Submission Attempts per 15 Min', 'Finish %', 'KO/TKO %', 'Submission %', 'Decision %',
+                'Avg Fight Minutes']
+WIN_FAMILIES = {'KO/TKO Wins': 'KO/TKO', 'Submission Wins': 'Submission', 'Decision Wins': 'Decision'}
+
+
+def fighter_id_sides(events_df: pd.DataFrame, fighter1_ids: np.ndarray, fighter2_ids: np.ndarray) -> pd.DataFrame:
+    """
+    Two rows per bout, one from each fighter's side: Fighter ID and their TOTAL_COLUMNS counts
+    
+    Outcomes come from fight_outcomes / side_outcomes, so wins, losses and
+    draws agree with the Elo replay, the fight graph and the name-keyed
+    event_stream.fighter_sides.
+    """
+    score, _ = fight_outcomes(events_df)
+    families = method_families(events_df['Method']).codes
+    seconds = events_df['Fight Seconds'].to_numpy(dtype=np.int64)
+    stat_seconds = np.where(events_df['Stats Available'].to_numpy(dtype=bool), seconds, 0)
+    sides = []
+    for own, ids in [('Fighter1', fighter1_ids), ('Fighter2', fighter2_ids)]:
+        outcomes = side_outcomes(score, own)
+        won = outcomes['Wins']
+        side = {'Fighter ID': ids, 'Bouts': np.ones(len(ids), dtype=np.int64), **outcomes}
+        for column, total in STAT_TOTALS.items():
+            side[total] = events_df[f'{own} {column}'].to_numpy(dtype=np.int64)
+        side['Fight Seconds'] = seconds
+        side['Stat Seconds'] = stat_seconds
+        for column, family in WIN_FAMILIES.items():
+            side[column] = won & (families == FAMILY_NAMES.index(family))
+        sides.append(pd.DataFrame(side))
+    return pd.concat(sides, ignore_index=True)
+
+
+def career_totals(sides: pd.DataFrame) -> pd.DataFrame:
+    """TOTAL_COLUMNS per fighter ID of the side rows, in one groupby"""
+    return sides.groupby('Fighter ID', sort=True)[TOTAL_COLUMNS].sum().astype(np.int64)
+
+
+def career_rates(totals: pd.DataFrame) -> pd.DataFrame:
+    """RATE_COLUMNS of some fighters' totals"""
+    def ratio(numerator, denominator, scale=1.0):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(denominator > 0, totals[numerator] * scale / denominator, np.nan)
+    
+    stat_seconds, wins = totals['Stat Seconds'].to_numpy(), totals['Wins'].to_numpy()
+    finishes = totals['KO/TKO Wins'] + totals['Submission Wins']
+    rates = pd.DataFrame({
+        'Strikes per Min': ratio('Strikes', stat_seconds, 60),
+        'Takedowns per 15 Min': ratio('Takedowns', stat_seconds, 900),
+        'Knockdowns per 15 Min': ratio('Knockdowns', stat_seconds, 900),
+        'Submission Attempts per 15 Min': ratio('Submission Attempts', stat_seconds, 900),
+        'Finish %': np.where(wins > 0, finishes * 100 / np.maximum(wins, 1), np.nan),
+        'KO/TKO %': ratio('KO/TKO Wins', wins, 100),
+        'Submission %': ratio('Submission Wins', wins, 100),
+        'Decision %': ratio('Decision Wins', wins, 100),
+        'Avg Fight Minutes': ratio('Fight Seconds', totals['Bouts'].to_numpy(), 1 / 60),
+    }, index=totals.index)
+    return rates.astype(np.float32)
+
+
+class CareerStats:
+    """
+    Career totals and rates of every fighter over their UFC bouts
+    
+    table has one row per FighterIndex ID (roster positions first), with
+    TOTAL_COLUMNS then RATE_COLUMNS. Never modified once built: appended()
+    returns the stats of a longer events frame, recomputing only the
+    fighters in the new bouts.
+    """
+    
+    def __init__(self, table: pd.DataFrame, n_rows: int):
+        self.table = table
+        self.n_rows = n_rows
+    
+    @classmethod
+    def build(cls, fighter_index) -> 'CareerStats':
+        """Stats of every bout indexed by fighter_index"""
+        sides = fighter_id_sides(fighter_index.events_df, fighter_index.fighter1_ids, fighter_index.fighter2_ids)
+        totals = career_totals(sides).reindex(pd.RangeIndex(fighter_index.n_fighters), fill_value=0)
+        return cls(totals.join(career_rates(totals)), len(fighter_index.events_df))
+    
+    def appended(self, fighter_index) -> 'CareerStats':
+        """Stats after fighter_index.appended(): the new bouts' fighters are updated, every other row kept"""
+        new = slice(self.n_rows, len(fighter_index.events_df))
+        sides = fighter_id_sides(fighter_index.events_df.iloc[new], fighter_index.fighter1_ids[new],
+                                 fighter_index.fighter2_ids[new])
+        partial = career_totals(sides)
+        ids = partial.index.to_numpy()
+        totals = self.table[TOTAL_COLUMNS].reindex(partial.index, fill_value=0) + partial
+        changed = totals.join(career_rates(totals))
+        
+        # Every column is copied once and only the new bouts' fighters are written
+        columns = {}
+        for column in self.table.columns:
+            values = np.zeros(fighter_index.n_fighters, dtype=self.table[column].dtype)
+            values[:len(self.table)] = self.table[column].to_numpy()
+            values[ids] = changed[column].to_numpy()
+            columns[column] = values
+        return CareerStats(pd.DataFrame(columns), len(fighter_index.events_df))
+    
+    def row(self, fighter_id: int) -> pd.Series:
+        """Totals and rates of one fighter"""
+        return self.table.iloc[fighter_id]
@@ -0,0 +1,43 @@
+"""
+Compressed sparse row (CSR) adjacency arrays shared by the fighter index and the fight graph
+"""
+import numpy as np
+from typing import List, Tuple
+
+
+def build_csr(sources: np.ndarray, columns: List[np.ndarray], n_nodes: int) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """Offsets plus each column reordered so node v's entries are [offsets[v]:offsets[v + 1]]"""
+    order = np.argsort(sources, kind='stable')
+    offsets = np.r_[0, np.cumsum(np.bincount(sources, minlength=n_nodes))].astype(np.int64)
+    return offsets, [column[order] for column in columns]
+
+
+def append_csr(offsets: np.ndarray, columns: List[np.ndarray], sources: np.ndarray,
+               new_columns: List[np.ndarray], n_nodes: int) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    New CSR arrays with entries added after each node's existing ones
+    
+    The inputs are left untouched. n_nodes may exceed the old node count;
+    new nodes start empty. Linear in the total size plus a sort of the
+    added entries, instead of re-sorting everything.
+    """
+    old_counts = np.diff(offsets)
+    old_counts = np.r_[old_counts, np.zeros(n_nodes - len(old_counts), dtype=old_counts.dtype)]
+    added_counts = np.bincount(sources, minlength=n_nodes)
+    new_offsets = np.r_[0, np.cumsum(old_counts + added_counts)].astype(np.int64)
+    
+    # Existing entries shift right by the entries added to every earlier node
+    shift = new_offsets[:-1] - np.r_[0, np.cumsum(old_counts)[:-1]]
+    old_targets = np.arange(int(offsets[-1])) + np.repeat(shift, old_counts)
+    order = np.argsort(sources, kind='stable')
+    sorted_sources = sources[order]
+    rank = np.arange(len(sources)) - (np.cumsum(added_counts) - added_counts)[sorted_sources]
+    new_targets = new_offsets[sorted_sources] + old_counts[sorted_sources] + rank
+    
+    merged = []
+    for column, new_column in zip(columns, new_columns):
+        out = np.empty(len(old_targets) + len(new_targets), dtype=np.result_type(column, new_column))
+        out[old_targets] = column
+        out[new_targets] = new_column[order]
+        merged.append(out)
+    return new_offsets, merged
@@ -1,20 +1,64 @@
 """
 Data loading and preprocessing utilities
 """
+import io
+import re
+import numpy as np
 import pandas as pd
-import streamlit as st
+from pandas.api.types import union_categoricals
 from pathlib import Path
 import sys
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.config.settings import FIGHTERS_CSV, EVENTS_CSV
+from src.config.settings import FIGHTERS_CSV, EVENTS_CSV, FRAME_CACHE_DIR, ROUND_SECONDS
+from src.utils.frame_cache import content_hash, load_cached_frame
 
+# Preprocessing changes must invalidate cached frames, so the cache key includes this file
+LOADER_HASH = content_hash(__file__)
 
-@st.cache_data
-def load_fighters_data():
-    """Load and preprocess fighters data"""
-    df = pd.read_csv(FIGHTERS_CSV)
+# Raw measurement column -> numeric float32 column ("--" placeholders become NaN)
+MEASUREMENT_COLUMNS = {'Height': 'Height (in)', 'Reach': 'Reach (in)', 'Weight': 'Weight (lbs)'}
+
+# "x-y" fight stat columns and the integer type of each fighter's share
+STAT_COLUMNS = {'KD': 'int16', 'Strikes': 'int32', 'TD': 'int16', 'Sub': 'int16'}
+
+# Compact storage: repeated strings as categoricals, counts in the smallest safe integer type
+FIGHTER_CATEGORIES = ['Height', 'Weight', 'Reach', 'Stance']
+FIGHTER_INT_COLUMNS = {'Wins': 'int16', 'Losses': 'int16', 'Draws': 'int16', 'Total Fights': 'int16'}
+EVENT_CATEGORIES = ['Event Name', 'Result', 'Fighter1', 'Fighter2', 'Weight Class', 'Method', 'Time']
+EVENT_INT_COLUMNS = {'Round': 'int8'}
+
+
+def _loader_version():
+    """Cache code_version of preprocessed frames: this file and the settings its preprocessing reads"""
+    return f"{LOADER_HASH}-round{ROUND_SECONDS}"
+
+
+def file_version(path):
+    """Version tag of a data file from its size and modification time"""
+    stat = Path(path).stat()
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def load_fighters_data(csv_path=FIGHTERS_CSV, use_cache=True):
+    """
+    Load and preprocess fighters data
+    
+    Streamlit-free so batch jobs can use it; the app keeps one copy per
+    process through initialize_app's st.cache_resource.
+    """
+    if use_cache:
+        df = load_cached_frame('fighters', csv_path, _build_fighters, FRAME_CACHE_DIR, _loader_version())
+    else:
+        df = _build_fighters(csv_path)
+    df.attrs['data_version'] = file_version(csv_path)
+    return df
+
+
+def _build_fighters(csv_path, compact=True):
+    """Parse the fighters CSV and derive search and record columns"""
+    df = pd.read_csv(csv_path)
     
     # Create full name column
     df['Full Name'] = (df['First Name'].fillna('') + ' ' + df['Last Name'].fillna('')).str.strip()
@@ -30,24 +74,127 @@ def load_fighters_data():
     df['Total Fights'] = df['Wins'] + df['Losses'] + df['Draws']
     df['Win Rate'] = (df['Wins'] / df['Total Fights'] * 100).fillna(0).round(1)
     
-    return df
+    # Physical measurements as numbers: 5' 11" -> 71, 74.0" -> 74, 155 lbs. -> 155
+    height = df['Height'].astype(str).str.extract(r"^(\d+)'\s*(\d+(?:\.\d+)?)\"").astype('float32')
+    df[MEASUREMENT_COLUMNS['Height']] = height[0] * 12 + height[1]
+    df[MEASUREMENT_COLUMNS['Reach']] = df['Reach'].astype(str).str.extract(r'^(\d+(?:\.\d+)?)"')[0].astype('float32')
+    df[MEASUREMENT_COLUMNS['Weight']] = (
+        df['Weight'].astype(str).str.extract(r'^(\d+(?:\.\d+)?)\s*lbs')[0].astype('float32')
+    )
+    
+    return compact_frame(df, FIGHTER_CATEGORIES, FIGHTER_INT_COLUMNS) if compact else df
 
 
-@st.cache_data
-def load_events_data():
+def load_events_data(csv_path=EVENTS_CSV, use_cache=True):
     """Load events data"""
-    df = pd.read_csv(EVENTS_CSV)
+    if use_cache:
+        df = load_cached_frame('events', csv_path, _build_events, FRAME_CACHE_DIR, _loader_version())
+    else:
+        df = _build_events(csv_path)
+    df.attrs['data_version'] = file_version(csv_path)
     return df
 
 
-def get_fighter_by_name(fighters_df, name):
-    """Get fighter by exact full name match"""
-    result = fighters_df[fighters_df['Full Name'] == name]
-    if len(result) > 0:
-        return result.iloc[0]
-    return None
+def parse_events_data(lines: bytes):
+    """Events frame of raw CSV bytes (header and complete lines), built as load_events_data builds a file"""
+    return _build_events(io.BytesIO(lines))
+
+
+def _build_events(csv_path, compact=True):
+    """Parse the events CSV, type the per-fight stat columns and sort chronologically"""
+    df = prepare_events(pd.read_csv(csv_path))
+    
+    # Oldest event first; a stable sort keeps each card in its listed bout order
+    df = df.sort_values(['Event Date', 'Event Name'], kind='stable', ignore_index=True)
+    
+    # The raw "x-y" strings are fully represented by the typed stat columns
+    return compact_frame(df, EVENT_CATEGORIES, EVENT_INT_COLUMNS, drop=STAT_COLUMNS) if compact else df
+
+
+def prepare_events(df):
+    """
+    Row-wise preprocessing of raw events rows, in place
+    
+    Shared by the in-memory loader and the chunked reader of event_stream,
+    so both see identical values.
+    """
+    df['Event Date'] = pd.to_datetime(df['Event Date'], format='%B %d, %Y')
+    
+    # "x-y" stats become paired Fighter1/Fighter2 integer columns ("-----" = not recorded)
+    df['Stats Available'] = df['KD'].str.fullmatch(r'\d+-\d+').fillna(False).astype(bool)
+    for column, dtype in STAT_COLUMNS.items():
+        pairs = df[column].str.extract(r'^(\d+)-(\d+)$')
+        df[f'Fighter1 {column}'] = pd.to_numeric(pairs[0]).fillna(0).astype(dtype)
+        df[f'Fighter2 {column}'] = pd.to_numeric(pairs[1]).fillna(0).astype(dtype)
+    
+    # Elapsed fight time: completed rounds plus the clock in the final round
+    clock = df['Time'].str.extract(r'^(\d+):(\d+)$').apply(pd.to_numeric).fillna(0)
+    df['Fight Seconds'] = (
+        (df['Round'] - 1) * ROUND_SECONDS + clock[0] * 60 + clock[1]
+    ).astype('int32')
+    return df
+
+
+def append_events(events_df, new_rows):
+    """
+    events_df extended with raw CSV rows, or None if a full reload is needed
+    
+    The new rows get the loader's preprocessing and compact layout, so the
+    result equals reloading the whole file as long as no new row sorts
+    before the last loaded bout (back-dated rows return None).
+    """
+    tail = prepare_events(new_rows).sort_values(['Event Date', 'Event Name'], kind='stable', ignore_index=True)
+    if len(events_df) and len(tail):
+        last = (events_df['Event Date'].iat[-1], str(events_df['Event Name'].iat[-1]))
+        if (tail['Event Date'].iat[0], str(tail['Event Name'].iat[0])) < last:
+            return None
+    tail = compact_frame(tail, EVENT_CATEGORIES, EVENT_INT_COLUMNS, drop=STAT_COLUMNS)
+    
+    # Categoricals are merged on their codes; sorted categories match a fresh astype('category')
+    plain = [column for column in events_df.columns if column not in EVENT_CATEGORIES]
+    df = pd.concat([events_df[plain], tail[plain]], ignore_index=True)
+    for column in EVENT_CATEGORIES:
+        df[column] = union_categoricals([events_df[column], tail[column]], sort_categories=True)
+    return df[events_df.columns]
+
+
+def method_lookup(methods, prefixes, default, dtype=float):
+    """
+    Value of each bout's method: prefixes[p] for the first key p it starts with, else default
+    
+    Each distinct method is matched once and bouts look theirs up by category
+    code, so compact (categorical) frames never match per row. Missing
+    methods get the default.
+    """
+    pattern = '^(' + '|'.join(map(re.escape, prefixes)) + ')'
+    methods = methods if isinstance(methods.dtype, pd.CategoricalDtype) else methods.astype('category')
+    values = (methods.cat.categories.astype(str).str.extract(pattern)[0]
+              .map(prefixes).fillna(default).to_numpy(dtype=dtype))
+    codes = methods.cat.codes.to_numpy()
+    return np.where(codes >= 0, values[codes], default).astype(dtype)
+
+
+def compact_frame(df, categories, int_columns, drop=()):
+    """Convert columns to categoricals, downcast integer columns and drop redundant ones"""
+    for column in categories:
+        df[column] = df[column].astype('category')
+    for column, dtype in int_columns.items():
+        df[column] = df[column].astype(dtype)
+    return df.drop(columns=list(drop))
 
 
-def get_top_fighters(fighters_df, n=10, by='Wins'):
-    """Get top N fighters by specified metric"""
-    return fighters_df.nlargest(n, by)
+def memory_report(before, after):
+    """Per-column dtype and deep byte count of two versions of a frame, with a total row"""
+    columns = before.columns.union(after.columns, sort=False)
+    report = pd.DataFrame({
+        'Dtype Before': before.dtypes.astype(str),
+        'Bytes Before': before.memory_usage(deep=True, index=False),
+        'Dtype After': after.dtypes.astype(str),
+        'Bytes After': after.memory_usage(deep=True, index=False),
+    }, index=columns)
+    report['Dtype Before'] = report['Dtype Before'].fillna('(new)')
+    report['Dtype After'] = report['Dtype After'].fillna('(dropped)')
+    report[['Bytes Before', 'Bytes After']] = report[['Bytes Before', 'Bytes After']].fillna(0).astype('int64')
+    report.loc['Total'] = ['', report['Bytes Before'].sum(), '', report['Bytes After'].sum()]
+    report['Ratio'] = (report['Bytes Before'] / report['Bytes After'].where(report['Bytes After'] > 0)).round(2)
+    return report
@@ -0,0 +1,312 @@
+"""
+Versioned data snapshots, refreshed incrementally from rows appended to the CSV files
+"""
+import io
+import os
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from src.config.settings import FIGHTERS_CSV, EVENTS_CSV, ELO_STATE_PATH, DATA_REFRESH_SECONDS
+from src.utils.aggregates import DashboardAggregates
+from src.utils.career_stats import CareerStats
+from src.utils.data_loader import (load_fighters_data, load_events_data, parse_events_data, append_events,
+                                   file_version)
+from src.utils.event_index import EventIndex
+from src.utils.fight_graph import FightGraph
+from src.utils.fighter_index import FighterIndex
+from src.utils.leaderboards import Leaderboards, fighter_divisions
+from src.utils.ratings import EloRatings, fight_outcomes, load_ratings
+from src.utils.search import FighterSearch
+from src.utils.similarity import SimilarityIndex
+from src.utils.trends import TrendIndex
+
+# Bytes before the read offset compared on every refresh to tell an append from a rewrite
+ANCHOR_BYTES = 64
+# Bytes read at a time when looking back from the end of a file for its last complete line
+READ_BLOCK_BYTES = 1 << 16
+
+
+class CsvTail:
+    """
+    Read position in a CSV file that only grows at the end
+    
+    offset is the byte after the last line consumed; anchor holds the bytes
+    just before it, so an edit or truncation of consumed lines is noticed.
+    """
+    
+    def __init__(self, path, offset: int, mtime_ns: int, header: bytes, anchor: bytes):
+        self.path = Path(path)
+        self.offset = offset
+        self.mtime_ns = mtime_ns
+        self.header = header
+        self.anchor = anchor
+    
+    @property
+    def version(self) -> str:
+        """file_version() of the file while it still ends at this position"""
+        return f"{self.offset}-{self.mtime_ns}"
+    
+    @classmethod
+    def at_end(cls, path) -> 'CsvTail':
+        """Position after the last complete line, from one stat of the file"""
+        with open(path, 'rb') as handle:
+            header = handle.readline()
+            stat = os.fstat(handle.fileno())
+            # A writer may be mid-line: the position stays before its partial line
+            offset = stat.st_size
+            while offset > len(header):
+                start = max(offset - READ_BLOCK_BYTES, len(header))
+                handle.seek(start)
+                newline = handle.read(offset - start).rfind(b'\n')
+                if newline >= 0:
+                    offset = start + newline + 1
+                    break
+                offset = start
+            offset = max(offset, len(header))
+            handle.seek(max(offset - ANCHOR_BYTES, 0))
+            anchor = handle.read(offset - max(offset - ANCHOR_BYTES, 0))
+        return cls(path, offset, stat.st_mtime_ns, header, anchor)
+    
+    @classmethod
+    def read_whole(cls, path) -> Tuple[bytes, 'CsvTail']:
+        """The file's header and complete lines, read once, and the position after them"""
+        with open(path, 'rb') as handle:
+            data = handle.read()
+            stat = os.fstat(handle.fileno())
+        header = data[:data.find(b'\n') + 1]
+        offset = max(data.rfind(b'\n') + 1, len(header))
+        anchor = data[max(offset - ANCHOR_BYTES, 0):offset]
+        return data[:offset], cls(path, offset, stat.st_mtime_ns, header, anchor)
+    
+    def read_new(self) -> Tuple[Optional[bytes], 'CsvTail']:
+        """
+        Complete lines added since this position, and the position after them
+        
+        Returns b'' when nothing was appended (or only part of a line) and
+        None when the consumed part of the file changed.
+        """
+        stat = self.path.stat()
+        if (stat.st_size, stat.st_mtime_ns) == (self.offset, self.mtime_ns):
+            return b'', self
+        if stat.st_size < self.offset:
+            return None, self
+        with open(self.path, 'rb') as handle:
+            handle.seek(self.offset - len(self.anchor))
+            if handle.read(len(self.anchor)) != self.anchor:
+                return None, self
+            data = handle.read(stat.st_size - self.offset)
+        
+        # A writer may be mid-line: keep the partial line for the next refresh
+        end = data.rfind(b'\n') + 1
+        if not end:
+            return b'', self
+        anchor = (self.anchor + data[:end])[-ANCHOR_BYTES:]
+        mtime_ns = stat.st_mtime_ns if end == len(data) else self.mtime_ns
+        return data[:end], CsvTail(self.path, self.offset + end, mtime_ns, self.header, anchor)
+    
+    def parse(self, lines: bytes) -> pd.DataFrame:
+        """Raw rows of lines read from this file"""
+        return pd.read_csv(io.BytesIO(self.header + lines))
+
+
+class DataSnapshot:
+    """
+    The frames and every structure derived from them at one data version
+    
+    Never modified once published: a refresh builds a new snapshot that
+    shares whatever did not change (the roster, search indexes, arrays) with
+    the previous one.
+    """
+    
+    def __init__(self, version: int, fighters_df: pd.DataFrame, events_df: pd.DataFrame,
+                 search_engine: FighterSearch, event_index: EventIndex, fighter_index: FighterIndex,
+                 fight_graph: FightGraph, elo_ratings: pd.DataFrame, leaderboards: Leaderboards,
+                 aggregates: DashboardAggregates, similarity: SimilarityIndex, career_stats: CareerStats,
+                 trends: TrendIndex):
+        self.version = version
+        self.fighters_df = fighters_df
+        self.events_df = events_df
+        self.search_engine = search_engine
+        self.event_index = event_index
+        self.fighter_index = fighter_index
+        self.fight_graph = fight_graph
+        self.elo_ratings = elo_ratings
+        self.leaderboards = leaderboards
+        self.aggregates = aggregates
+        self.similarity = similarity
+        self.career_stats = career_stats
+        self.trends = trends
+
+
+class Build(NamedTuple):
+    """A new snapshot and the refresh state it extends, published together or not at all"""
+    snapshot: DataSnapshot
+    events_tail: CsvTail
+    fighters_version: str
+    elo: EloRatings
+
+
+class DataStore:
+    """
+    The current DataSnapshot, kept up to date with the CSV files
+    
+    Event rows appended to the events file are parsed alone and folded into
+    the next snapshot; a changed fighters file, an edited events file or
+    back-dated bouts rebuild everything on a background thread. Either way
+    the new snapshot is published with one attribute assignment, so a
+    session that reads store.snapshot once per run always sees one version,
+    and nobody waits for a refresh another session is running.
+    """
+    
+    def __init__(self, fighters_csv=FIGHTERS_CSV, events_csv=EVENTS_CSV, elo_state_path=ELO_STATE_PATH,
+                 refresh_seconds: float = DATA_REFRESH_SECONDS):
+        self.fighters_csv = Path(fighters_csv)
+        self.events_csv = Path(events_csv)
+        self.elo_state_path = elo_state_path
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._last_check = time.monotonic()
+        self._publish(self._load(version=1))
+    
+    def current(self) -> DataSnapshot:
+        """The latest snapshot, looking for file changes if refresh_seconds have passed"""
+        if time.monotonic() - self._last_check >= self.refresh_seconds:
+            self.refresh(background=True)
+        return self.snapshot
+    
+    def refresh(self, background: bool = False) -> bool:
+        """
+        Apply changes to the data files, returning whether a new snapshot was published
+        
+        With background=True a full rebuild runs on its own thread (and this
+        returns False); appended rows are always applied before returning.
+        """
+        if not self._lock.acquire(blocking=False):
+            return False  # Another session is refreshing; keep serving the current snapshot
+        handed_off = False
+        try:
+            self._last_check = time.monotonic()
+            lines, tail = self._events_tail.read_new()
+            if file_version(self.fighters_csv) == self._fighters_version and lines is not None:
+                if not lines.strip():
+                    self._events_tail = tail
+                    return False
+                build = self._apply(tail.parse(lines), tail)
+                if build is not None:
+                    self._publish(build)
+                    try:
+                        build.elo.save(self.elo_state_path)
+                    except OSError:
+                        pass  # Read-only deployments replay on every start
+                    return True
+            if background:
+                # The rebuild thread releases the lock when it is done
+                threading.Thread(target=self._reload, daemon=True).start()
+                handed_off = True
+                return False
+            self._publish(self._load(self.snapshot.version + 1))
+            return True
+        finally:
+            if not handed_off:
+                self._lock.release()
+    
+    def _reload(self):
+        """Background full rebuild; owns the refresh lock until it is done"""
+        try:
+            self._publish(self._load(self.snapshot.version + 1))
+        finally:
+            self._lock.release()
+    
+    def _publish(self, build: Build):
+        """
+        Make a build current: its refresh state, then the snapshot sessions read
+        
+        Nothing is changed while a build is made, so one that raises leaves
+        the store exactly as it was.
+        """
+        self._events_tail = build.events_tail
+        self._fighters_version = build.fighters_version
+        self._elo = build.elo
+        self.snapshot = build.snapshot
+    
+    def _load(self, version: int) -> Build:
+        """Build a snapshot from scratch"""
+        # The tail is taken before parsing, so rows appended during the load are read by the next refresh
+        events_tail = CsvTail.at_end(self.events_csv)
+        events_df = None
+        if file_version(self.events_csv) == events_tail.version:
+            events_df = load_events_data(self.events_csv)
+        if events_df is None or file_version(self.events_csv) != events_tail.version:
+            # The file ends mid-line or changed while it was parsed: parse exactly the lines before a tail
+            lines, events_tail = CsvTail.read_whole(self.events_csv)
+            events_df = parse_events_data(lines)
+            events_df.attrs['data_version'] = events_tail.version
+        fighters_version = file_version(self.fighters_csv)
+        fighters_df = load_fighters_data(self.fighters_csv)
+        
+        fighter_index = FighterIndex(fighters_df, events_df)
+        event_index = EventIndex(events_df)
+        elo = load_ratings(events_df, fighter_index, self.elo_state_path)
+        snapshot = DataSnapshot(
+            version, fighters_df, events_df,
+            search_engine=FighterSearch(fighters_df),
+            event_index=event_index,
+            fighter_index=fighter_index,
+            fight_graph=FightGraph.from_fighter_index(fighter_index),
+            elo_ratings=elo.for_fighters(fighter_index),
+            leaderboards=Leaderboards(fighters_df, fighter_divisions(fighters_df, fighter_index)),
+            aggregates=DashboardAggregates.build(version, fighters_df, events_df, event_index),
+            similarity=SimilarityIndex.build(fighters_df, fighter_index),
+            career_stats=CareerStats.build(fighter_index),
+            trends=TrendIndex(events_df),
+        )
+        return Build(snapshot, events_tail, fighters_version, elo)
+    
+    def _apply(self, new_rows: pd.DataFrame, events_tail: CsvTail) -> Optional[Build]:
+        """
+        Next snapshot with appended event rows (read up to events_tail), or None if they need a full rebuild
+        
+        Ratings are updated on a copy of the current engine, which only
+        becomes current if the build is published.
+        """
+        old = self.snapshot
+        events_df = append_events(old.events_df, new_rows)
+        if events_df is None:
+            return None
+        events_df.attrs['data_version'] = events_tail.version
+        n_old = len(old.events_df)
+        
+        fighter_index = old.fighter_index.appended(events_df)
+        score, _ = fight_outcomes(events_df.iloc[n_old:])
+        fight_graph = old.fight_graph.appended(fighter_index.fighter1_ids[n_old:], fighter_index.fighter2_ids[n_old:],
+                                               score, fighter_index.n_fighters)
+        elo = self._elo.copy()
+        elo.update_from_events(events_df, fighter_index)
+        
+        # Divisions follow each fighter's latest bout; boards are only rebuilt if one moved
+        divisions = fighter_divisions(old.fighters_df, fighter_index)
+        leaderboards = old.leaderboards
+        if not np.array_equal(divisions, leaderboards.divisions):
+            leaderboards = Leaderboards(old.fighters_df, divisions)
+        
+        event_index = old.event_index.appended(events_df)
+        snapshot = DataSnapshot(
+            old.version + 1, old.fighters_df, events_df,
+            search_engine=old.search_engine,  # Built from the roster only, which is unchanged
+            event_index=event_index,
+            fighter_index=fighter_index,
+            fight_graph=fight_graph,
+            elo_ratings=elo.for_fighters(fighter_index),
+            leaderboards=leaderboards,
+            aggregates=old.aggregates.appended(old.version + 1, events_df, event_index),
+            # Finish rates move with every bout and rescale every row; a rebuild is a few vector passes
+            similarity=SimilarityIndex.build(old.fighters_df, fighter_index),
+            career_stats=old.career_stats.appended(fighter_index),
+            # Trend slices are cached per snapshot, so a new version starts from fresh bins
+            trends=TrendIndex(events_df),
+        )
+        return Build(snapshot, events_tail, self._fighters_version, elo)
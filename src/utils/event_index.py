@@ -0,0 +1,77 @@
+"""
+Event lookup over the date-sorted events frame
+"""
+import copy
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Tuple
+
+
+class EventIndex:
+    """Row range of every event in an events frame sorted by date and event"""
+    
+    def __init__(self, events_df: pd.DataFrame):
+        self.events_df = events_df
+        self.names = np.empty(0, dtype=object)
+        self.dates = events_df['Event Date'].to_numpy()[:0]
+        self._starts = np.empty(0, dtype=np.int64)
+        self._positions: Dict[str, int] = {}
+        self._add_rows(0)
+    
+    def appended(self, events_df: pd.DataFrame) -> 'EventIndex':
+        """
+        Index of events_df, which extends this index's events_df with new rows
+        
+        Only rows from the last indexed event on are scanned (it may continue
+        in the new rows); this index is left unchanged.
+        """
+        index = copy.copy(self)
+        index.events_df = events_df
+        index._positions = dict(self._positions)
+        first_event = len(self.names) - 1 if len(self.names) else 0
+        index.names, index.dates, index._starts = (
+            self.names[:first_event], self.dates[:first_event], self._starts[:first_event]
+        )
+        for name in self.names[first_event:].tolist():
+            del index._positions[name]
+        index._add_rows(int(self._starts[first_event]) if len(self._starts) else 0)
+        return index
+    
+    def _add_rows(self, first_row: int):
+        """Index the events starting at or after first_row"""
+        names = self.events_df['Event Name'].iloc[first_row:].to_numpy()
+        # First row of each run of equal event names
+        starts = np.flatnonzero(np.r_[True, names[1:] != names[:-1]]) if len(names) else np.array([], dtype=np.int64)
+        for offset, name in enumerate(names[starts].tolist()):
+            self._positions[name] = len(self.names) + offset
+        self.names = np.concatenate([self.names, names[starts]])
+        self.dates = np.concatenate([self.dates, self.events_df['Event Date'].iloc[first_row:].to_numpy()[starts]])
+        self._starts = np.concatenate([self._starts, starts + first_row])
+        self._stops = np.r_[self._starts[1:], len(self.events_df)]
+        
+        if len(self._positions) != len(self.names):
+            raise ValueError("events_df must be sorted so each event's fights are contiguous")
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def fights(self, event_name: str) -> pd.DataFrame:
+        """All fights of one event, as a slice of the events frame"""
+        i = self._positions[event_name]
+        return self.events_df.iloc[self._starts[i]:self._stops[i]]
+    
+    def row_ranges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """First row and stop row of every event, in names order"""
+        return self._starts, self._stops
+    
+    def event_date(self, event_name: str) -> pd.Timestamp:
+        """Date of one event"""
+        return pd.Timestamp(self.dates[self._positions[event_name]])
+    
+    def events_between(self, start=None, end=None, newest_first: bool = True) -> List[str]:
+        """Event names dated within [start, end] (inclusive), by date"""
+        lo = 0 if start is None else np.searchsorted(self.dates, np.datetime64(pd.Timestamp(start)), side='left')
+        hi = len(self.dates) if end is None else np.searchsorted(self.dates, np.datetime64(pd.Timestamp(end)), side='right')
+        names = self.names[lo:hi].tolist()
+        return names[::-1] if newest_first else names
@@ -0,0 +1,166 @@
+"""
+Streaming ingestion of the events CSV with running per-event and per-fighter totals
+"""
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+from src.config.settings import EVENTS_CSV, EVENT_CHUNK_ROWS
+from src.utils.data_loader import method_lookup, prepare_events
+from src.utils.ratings import fight_outcomes, side_outcomes
+
+# Method prefix -> family counted in the totals; anything else is "Other"
+METHOD_FAMILIES = {
+    'KO/TKO': 'KO/TKO',
+    'SUB': 'Submission',
+    'U-DEC': 'Decision',
+    'S-DEC': 'Decision',
+    'M-DEC': 'Decision',
+}
+FAMILY_NAMES = ['KO/TKO', 'Submission', 'Decision', 'Other']
+STAT_TOTALS = {'KD': 'Knockdowns', 'Strikes': 'Strikes', 'TD': 'Takedowns', 'Sub': 'Submission Attempts'}
+
+
+def read_event_chunks(csv_path=EVENTS_CSV, chunksize: int = EVENT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """Preprocessed events rows in file order, chunksize rows at a time"""
+    with pd.read_csv(csv_path, chunksize=chunksize) as reader:
+        for chunk in reader:
+            yield prepare_events(chunk)
+
+
+def method_families(methods: pd.Series) -> pd.Categorical:
+    """Family (FAMILY_NAMES) of each bout's method; unmatched and missing methods are 'Other'"""
+    family_codes = {prefix: FAMILY_NAMES.index(family) for prefix, family in METHOD_FAMILIES.items()}
+    codes = method_lookup(methods, family_codes, FAMILY_NAMES.index('Other'), dtype=np.int8)
+    return pd.Categorical.from_codes(codes, categories=FAMILY_NAMES)
+
+
+def fighter_sides(events: pd.DataFrame) -> pd.DataFrame:
+    """
+    Two rows per bout, one from each fighter's side
+    
+    Columns: Fighter, Wins/Losses/Draws/No Contests (0 or 1), the fighter's
+    own stat counts, Fight Seconds and the method family. Outcomes are
+    side_outcomes of fight_outcomes, as in career_stats.fighter_id_sides.
+    """
+    families = method_families(events['Method'])
+    score, _ = fight_outcomes(events)
+    sides = []
+    for own in ['Fighter1', 'Fighter2']:
+        side = {'Fighter': events[own].astype(str).to_numpy()}
+        side.update((column, flags.astype(np.int64)) for column, flags in side_outcomes(score, own).items())
+        for column, total in STAT_TOTALS.items():
+            side[total] = events[f'{own} {column}'].to_numpy(dtype=np.int64)
+        side['Fight Seconds'] = events['Fight Seconds'].to_numpy(dtype=np.int64)
+        side['Method'] = families
+        sides.append(pd.DataFrame(side))
+    return pd.concat(sides, ignore_index=True)
+
+
+def _family_counts(frame: pd.DataFrame, families) -> pd.DataFrame:
+    """One int64 count column per method family"""
+    counts = pd.get_dummies(pd.Series(families, index=frame.index), dtype=np.int64)
+    return counts.reindex(columns=FAMILY_NAMES, fill_value=0)
+
+
+def _event_partials(events: pd.DataFrame) -> pd.DataFrame:
+    """Per-event totals of some bouts"""
+    frame = pd.DataFrame({'Event Name': events['Event Name'].astype(str).to_numpy(),
+                          'Event Date': events['Event Date'].to_numpy(),
+                          'Fights': np.ones(len(events), dtype=np.int64)})
+    for column, total in STAT_TOTALS.items():
+        frame[total] = (events[f'Fighter1 {column}'].to_numpy(dtype=np.int64)
+                        + events[f'Fighter2 {column}'].to_numpy(dtype=np.int64))
+    frame['Fight Seconds'] = events['Fight Seconds'].to_numpy(dtype=np.int64)
+    frame = frame.join(_family_counts(frame, method_families(events['Method'])))
+    return frame.groupby('Event Name', sort=False).agg(
+        {column: 'min' if column == 'Event Date' else 'sum' for column in frame.columns[1:]}
+    )
+
+
+def _fighter_partials(events: pd.DataFrame) -> pd.DataFrame:
+    """Per-fighter totals of some bouts"""
+    sides = fighter_sides(events)
+    families = sides.pop('Method')
+    sides.insert(1, 'Fights', np.ones(len(sides), dtype=np.int64))
+    sides = sides.join(_family_counts(sides, families))
+    return sides.groupby('Fighter', sort=False).sum()
+
+
+def _merge(running: Optional[pd.DataFrame], partial: pd.DataFrame) -> pd.DataFrame:
+    """Fold one chunk's totals into the running totals (sums, and the earliest date)"""
+    if running is None:
+        return partial
+    combined = pd.concat([running, partial])
+    return combined.groupby(level=0, sort=False).agg(
+        {column: 'min' if column == 'Event Date' else 'sum' for column in combined.columns}
+    )
+
+
+class EventAggregates:
+    """
+    Running per-event and per-fighter totals of bouts fed in chunks
+    
+    Memory holds one chunk plus one row per event and per fighter seen, never
+    the whole history. Sums are exact integers, so any chunking of the rows
+    gives the same totals as aggregating the full frame at once (from_frame).
+    """
+    
+    def __init__(self):
+        self.n_rows = 0
+        self.n_chunks = 0
+        self._events: Optional[pd.DataFrame] = None
+        self._fighters: Optional[pd.DataFrame] = None
+    
+    @classmethod
+    def from_frame(cls, events_df: pd.DataFrame) -> 'EventAggregates':
+        """Totals of an already loaded events frame (the in-memory path)"""
+        aggregates = cls()
+        aggregates.update(events_df)
+        return aggregates
+    
+    def update(self, events: pd.DataFrame):
+        """Add one chunk of preprocessed bouts"""
+        if not len(events):
+            return
+        self._events = _merge(self._events, _event_partials(events))
+        self._fighters = _merge(self._fighters, _fighter_partials(events))
+        self.n_rows += len(events)
+        self.n_chunks += 1
+    
+    def consume(self, chunks: Iterable[pd.DataFrame]) -> 'EventAggregates':
+        """Add every chunk of an iterable, e.g. read_event_chunks()"""
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+    
+    def event_totals(self) -> pd.DataFrame:
+        """
+        One row per event, oldest first
+        
+        Columns: Event Name, Event Date, Fights, Knockdowns, Strikes,
+        Takedowns, Submission Attempts, Fight Seconds and a bout count per
+        method family.
+        """
+        if self._events is None:
+            return pd.DataFrame()
+        totals = self._events.rename_axis('Event Name').reset_index()
+        return totals.sort_values(['Event Date', 'Event Name'], ignore_index=True)
+    
+    def fighter_totals(self) -> pd.DataFrame:
+        """
+        One row per fighter name as written in the bouts, by name
+        
+        Columns: Fighter, Fights, Wins, Losses, Draws, No Contests, the
+        fighter's own Knockdowns / Strikes / Takedowns / Submission Attempts,
+        Fight Seconds and a bout count per method family.
+        """
+        if self._fighters is None:
+            return pd.DataFrame()
+        totals = self._fighters.rename_axis('Fighter').reset_index()
+        return totals.sort_values('Fighter', ignore_index=True)
+
+
+def stream_event_aggregates(csv_path=EVENTS_CSV, chunksize: int = EVENT_CHUNK_ROWS) -> EventAggregates:
+    """Totals of an events CSV of any size, read chunksize rows at a time"""
+    return EventAggregates().consume(read_event_chunks(csv_path, chunksize))
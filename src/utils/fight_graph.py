@@ -0,0 +1,188 @@
+"""
+Winner → loser fight graph for head-to-head, common opponent and win chain queries
+"""
+import copy
+
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Tuple
+from src.utils.csr import append_csr, build_csr
+from src.utils.ratings import fight_outcomes
+
+# Bout result from one fighter's side
+WIN, LOSS, DRAW, NO_CONTEST = 0, 1, 2, 3
+
+
+def _expand(offsets: np.ndarray, targets: np.ndarray, frontier: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """All (target, source) CSR entries of the frontier nodes in one gather"""
+    starts = offsets[frontier]
+    counts = offsets[frontier + 1] - starts
+    total = int(counts.sum())
+    if not total:
+        return np.empty(0, dtype=targets.dtype), np.empty(0, dtype=frontier.dtype)
+    shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return targets[shift + np.arange(total)], np.repeat(frontier, counts)
+
+
+def _bout_edges(fighter1_ids, fighter2_ids, score, first_row: int):
+    """
+    Edge lists of some bouts numbered from first_row
+    
+    Returns (source, opponent, result, row) for both corners of every bout
+    and (winner, loser, row) for decided bouts.
+    """
+    fighter1_ids = np.asarray(fighter1_ids, dtype=np.int32)
+    fighter2_ids = np.asarray(fighter2_ids, dtype=np.int32)
+    bout_rows = np.arange(first_row, first_row + len(fighter1_ids), dtype=np.int32)
+    
+    code1 = np.select([score == 1, score == 0, score == 0.5], [WIN, LOSS, DRAW], default=NO_CONTEST).astype(np.int8)
+    code2 = np.select([code1 == WIN, code1 == LOSS], [LOSS, WIN], default=code1).astype(np.int8)
+    opponents = (np.r_[fighter1_ids, fighter2_ids], np.r_[fighter2_ids, fighter1_ids],
+                 np.r_[code1, code2], np.r_[bout_rows, bout_rows])
+    
+    decided = (code1 == WIN) | (code1 == LOSS)
+    winners = np.where(code1 == WIN, fighter1_ids, fighter2_ids)[decided]
+    losers = np.where(code1 == WIN, fighter2_ids, fighter1_ids)[decided]
+    return opponents, (winners, losers, bout_rows[decided])
+
+
+class FightGraph:
+    """
+    Bouts as a graph over fighter IDs, stored as NumPy CSR arrays
+    
+    Three adjacencies are kept: every opponent with the bout result and bout
+    row (head-to-head and common opponents), winner → loser edges and the
+    reverse loser → winner edges (bidirectional search for win chains).
+    """
+    
+    def __init__(self, fighter1_ids: np.ndarray, fighter2_ids: np.ndarray, score: np.ndarray, n_fighters: int):
+        """score is Fighter1's result per bout: 1 win, 0 loss, 0.5 draw, NaN no contest"""
+        self.n_fighters = n_fighters
+        self.n_fights = len(fighter1_ids)
+        opponents, wins = _bout_edges(fighter1_ids, fighter2_ids, score, first_row=0)
+        self.opponent_offsets, (self.opponents, self.opponent_results, self.opponent_rows) = build_csr(
+            opponents[0], opponents[1:], n_fighters
+        )
+        self.win_offsets, (self.beaten, self.win_rows) = build_csr(wins[0], [wins[1], wins[2]], n_fighters)
+        self.loss_offsets, (self.beaten_by,) = build_csr(wins[1], [wins[0]], n_fighters)
+    
+    @classmethod
+    def from_fighter_index(cls, fighter_index) -> 'FightGraph':
+        """Graph over FighterIndex IDs; bout rows are events frame positions"""
+        score, _ = fight_outcomes(fighter_index.events_df)
+        return cls(fighter_index.fighter1_ids, fighter_index.fighter2_ids, score, fighter_index.n_fighters)
+    
+    def appended(self, fighter1_ids: np.ndarray, fighter2_ids: np.ndarray, score: np.ndarray,
+                 n_fighters: int) -> 'FightGraph':
+        """
+        New graph with bouts added after the existing ones; this graph is unchanged
+        
+        The added bouts get rows n_fights, n_fights + 1, ... Entries are
+        appended to each fighter's adjacency instead of rebuilding it.
+        """
+        graph = copy.copy(self)
+        graph.n_fighters = n_fighters
+        graph.n_fights = self.n_fights + len(fighter1_ids)
+        opponents, wins = _bout_edges(fighter1_ids, fighter2_ids, score, first_row=self.n_fights)
+        graph.opponent_offsets, (graph.opponents, graph.opponent_results, graph.opponent_rows) = append_csr(
+            self.opponent_offsets, [self.opponents, self.opponent_results, self.opponent_rows],
+            opponents[0], opponents[1:], n_fighters
+        )
+        graph.win_offsets, (graph.beaten, graph.win_rows) = append_csr(
+            self.win_offsets, [self.beaten, self.win_rows], wins[0], [wins[1], wins[2]], n_fighters
+        )
+        graph.loss_offsets, (graph.beaten_by,) = append_csr(
+            self.loss_offsets, [self.beaten_by], wins[1], [wins[0]], n_fighters
+        )
+        return graph
+    
+    def _opponents_of(self, fighter_id: int):
+        """Opponent IDs, results and bout rows of one fighter"""
+        span = slice(self.opponent_offsets[fighter_id], self.opponent_offsets[fighter_id + 1])
+        return self.opponents[span], self.opponent_results[span], self.opponent_rows[span]
+    
+    def head_to_head(self, fighter_a: int, fighter_b: int) -> np.ndarray:
+        """Bout rows in which the two fighters met, oldest first"""
+        opponents, _, rows = self._opponents_of(fighter_a)
+        return np.sort(rows[opponents == fighter_b])
+    
+    def common_opponents(self, fighter_a: int, fighter_b: int) -> pd.DataFrame:
+        """
+        Opponents both fighters have faced, with each fighter's record against them
+        
+        Columns: Opponent ID, then Wins/Losses/Draws for fighter A (suffix 1)
+        and fighter B (suffix 2).
+        """
+        opponents_a, results_a, _ = self._opponents_of(fighter_a)
+        opponents_b, results_b, _ = self._opponents_of(fighter_b)
+        common = np.intersect1d(opponents_a, opponents_b)
+        common = common[(common != fighter_a) & (common != fighter_b)]
+        
+        table = {'Opponent ID': common}
+        for suffix, opponents, results in [('1', opponents_a, results_a), ('2', opponents_b, results_b)]:
+            shared = np.isin(opponents, common)
+            cells = np.searchsorted(common, opponents[shared]) * 4 + results[shared]
+            record = np.bincount(cells, minlength=len(common) * 4).reshape(-1, 4)
+            table[f'Wins {suffix}'] = record[:, WIN]
+            table[f'Losses {suffix}'] = record[:, LOSS]
+            table[f'Draws {suffix}'] = record[:, DRAW]
+        return pd.DataFrame(table)
+    
+    def win_path(self, fighter_a: int, fighter_b: int) -> Optional[List[int]]:
+        """
+        Shortest chain of wins from fighter_a to fighter_b ("MMA math")
+        
+        Returns [fighter_a, x, ..., fighter_b] where each fighter beat the
+        next one, or None if no chain exists. Bidirectional breadth-first
+        search: winner → loser edges from fighter_a, loser → winner edges
+        from fighter_b, always growing the smaller frontier one full level.
+        """
+        if fighter_a == fighter_b:
+            return [fighter_a]
+        
+        unseen = -2
+        forward_parent = np.full(self.n_fighters, unseen, dtype=np.int64)
+        backward_parent = np.full(self.n_fighters, unseen, dtype=np.int64)
+        forward_parent[fighter_a] = -1
+        backward_parent[fighter_b] = -1
+        forward = np.array([fighter_a], dtype=np.int64)
+        backward = np.array([fighter_b], dtype=np.int64)
+        
+        meeting = None
+        while len(forward) and len(backward):
+            grow_forward = len(forward) <= len(backward)
+            if grow_forward:
+                reached, parents = _expand(self.win_offsets, self.beaten, forward)
+                own, other = forward_parent, backward_parent
+            else:
+                reached, parents = _expand(self.loss_offsets, self.beaten_by, backward)
+                own, other = backward_parent, forward_parent
+            
+            fresh = own[reached] == unseen
+            reached, first = np.unique(reached[fresh], return_index=True)
+            own[reached] = parents[fresh][first]
+            
+            # Every meeting node found within one level closes a shortest chain
+            met = reached[other[reached] != unseen]
+            if len(met):
+                meeting = int(met[0])
+                break
+            if grow_forward:
+                forward = reached
+            else:
+                backward = reached
+        
+        if meeting is None:
+            return None
+        path = [meeting]
+        while forward_parent[path[-1]] != -1:
+            path.append(int(forward_parent[path[-1]]))
+        path.reverse()
+        while backward_parent[path[-1]] != -1:
+            path.append(int(backward_parent[path[-1]]))
+        return path
+    
+    def win_row(self, winner: int, loser: int) -> int:
+        """Bout row of the most recent win of winner over loser"""
+        span = slice(self.win_offsets[winner], self.win_offsets[winner + 1])
+        return int(self.win_rows[span][self.beaten[span] == loser].max())
@@ -0,0 +1,165 @@
+"""
+Canonical fighter IDs and a fighter → fight history index
+"""
+import copy
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+from src.config.settings import WEIGHT_CLASS_LBS
+from src.utils.csr import append_csr
+
+
+def normalize_names(names: pd.Series) -> pd.Series:
+    """Comparable name keys: ASCII-folded, lowercase, punctuation dropped, single spaces"""
+    return (
+        names.fillna('').astype(str)
+        .str.normalize('NFKD').str.encode('ascii', 'ignore').str.decode('ascii')
+        .str.lower()
+        .str.replace(r"[^a-z0-9 ]", '', regex=True)
+        .str.replace(r"\s+", ' ', regex=True)
+        .str.strip()
+    )
+
+
+class FighterIndex:
+    """
+    Fighter IDs shared by the roster and the event data, with CSR fight lists
+    
+    IDs 0..len(fighters_df)-1 are roster positions; fighters who only appear
+    in events_df get the following IDs. Each fighter's fights are
+    rows[offsets[id]:offsets[id + 1]], event row positions in date order.
+    """
+    
+    def __init__(self, fighters_df: pd.DataFrame, events_df: pd.DataFrame):
+        self.fighters_df = fighters_df
+        n_roster = len(fighters_df)
+        
+        roster_keys = normalize_names(fighters_df['Full Name']).to_numpy(dtype=object)
+        self._roster_weights = fighters_df['Weight (lbs)'].to_numpy(dtype=float)
+        key_owners: Dict[str, List[int]] = {}
+        for pos, key in enumerate(roster_keys):
+            key_owners.setdefault(key, []).append(pos)
+        # Duplicate roster names are resolved per bout by weight class
+        self._ambiguous = {key: owners for key, owners in key_owners.items() if len(owners) > 1}
+        self._key_ids: Dict[str, int] = {key: owners[0] for key, owners in key_owners.items()}
+        
+        self.n_fighters = n_roster
+        self.names = np.array(fighters_df['Full Name'].tolist(), dtype=object)
+        self.keys = roster_keys
+        self.events_df = events_df.iloc[:0]
+        self.fighter1_ids = self.fighter2_ids = np.empty(0, dtype=np.int32)
+        self.rows = np.empty(0, dtype=np.int32)
+        self.offsets = np.zeros(n_roster + 1, dtype=np.int64)
+        self._add_fights(events_df)
+    
+    def appended(self, events_df: pd.DataFrame) -> 'FighterIndex':
+        """
+        Index of events_df, which extends this index's events_df with new rows
+        
+        Only the new rows are matched; existing IDs keep their meaning and
+        this index is left unchanged, so readers of it are unaffected.
+        """
+        index = copy.copy(self)
+        index._key_ids = dict(self._key_ids)
+        index._add_fights(events_df)
+        return index
+    
+    def _add_fights(self, events_df: pd.DataFrame):
+        """Assign fighter IDs to the rows of events_df past the indexed ones and extend the fight lists"""
+        first_row = len(self.fighter1_ids)
+        new = events_df.iloc[first_row:]
+        n_new = len(new)
+        
+        # Both sides of every new bout in one array: Fighter1 rows, then Fighter2 rows
+        side_names = pd.concat([new['Fighter1'].astype(object), new['Fighter2'].astype(object)], ignore_index=True)
+        side_keys = normalize_names(side_names)
+        codes, uniques = pd.factorize(side_keys)
+        uniques = np.asarray(uniques, dtype=object)
+        
+        # Known names keep their ID (roster position first); new names are numbered after the last ID
+        unique_ids = pd.Series(uniques, dtype=object).map(self._key_ids).to_numpy(dtype=float, copy=True)
+        is_new = np.isnan(unique_ids)
+        unique_ids[is_new] = self.n_fighters + np.arange(is_new.sum())
+        side_ids = unique_ids.astype(np.int32)[codes]
+        
+        # Display name of a new fighter: the spelling at its first appearance
+        _, first_seen = np.unique(codes, return_index=True)
+        new_names = side_names.to_numpy()[first_seen[is_new]].tolist()
+        
+        # Duplicate roster names: pick the namesake whose weight is closest to the bout's class
+        if self._ambiguous:
+            class_lbs = new['Weight Class'].astype(str).map(WEIGHT_CLASS_LBS).to_numpy(dtype=float)
+            class_lbs = np.r_[class_lbs, class_lbs]
+            for side in np.flatnonzero(side_keys.isin(list(self._ambiguous)).to_numpy()):
+                owners = self._ambiguous[side_keys.iat[side]]
+                if not np.isnan(class_lbs[side]):
+                    gaps = np.abs(self._roster_weights[owners] - class_lbs[side])
+                    side_ids[side] = owners[int(np.nanargmin(gaps))] if not np.isnan(gaps).all() else owners[0]
+        
+        for offset, key in enumerate(uniques[is_new].tolist()):
+            self._key_ids.setdefault(key, self.n_fighters + offset)
+        self.n_fighters += len(new_names)
+        self.names = np.concatenate([self.names, np.array(new_names, dtype=object)])
+        self.keys = np.concatenate([self.keys, uniques[is_new]])
+        self.fighter1_ids = np.concatenate([self.fighter1_ids, side_ids[:n_new]])
+        self.fighter2_ids = np.concatenate([self.fighter2_ids, side_ids[n_new:]])
+        self.events_df = events_df
+        
+        # CSR: new rows follow every indexed row, so appending in row order keeps each list in date order
+        side_rows = np.r_[np.arange(n_new), np.arange(n_new)] + first_row
+        order = np.argsort(side_rows, kind='stable')
+        self.offsets, (self.rows,) = append_csr(
+            self.offsets, [self.rows], side_ids[order], [side_rows[order].astype(np.int32)], self.n_fighters
+        )
+    
+    @property
+    def unique_keys(self) -> np.ndarray:
+        """
+        Name key of every ID, roster namesakes suffixed with their roster order ("mike davis#1")
+        
+        Unlike keys, no two IDs share one, and they are stable across
+        rebuilds of the same data, so state saved per fighter can use them.
+        """
+        keys = self.keys.copy()
+        for key, owners in self._ambiguous.items():
+            for rank, owner in enumerate(owners):
+                keys[owner] = f"{key}#{rank}"
+        return keys
+    
+    def id_for_name(self, name: str) -> Optional[int]:
+        """Fighter ID for a display name, or None if the name is unknown"""
+        key = normalize_names(pd.Series([name], dtype=object)).iat[0]
+        return self._key_ids.get(key)
+    
+    def fight_rows(self, fighter_id: int) -> np.ndarray:
+        """Event row positions of a fighter's bouts, oldest first"""
+        return self.rows[self.offsets[fighter_id]:self.offsets[fighter_id + 1]]
+    
+    def history(self, fighter_id: int) -> pd.DataFrame:
+        """A fighter's bouts, newest first, from their own corner"""
+        rows = self.fight_rows(fighter_id)[::-1]
+        fights = self.events_df.iloc[rows]
+        is_fighter1 = self.fighter1_ids[rows] == fighter_id
+        
+        opponent_ids = np.where(is_fighter1, self.fighter2_ids[rows], self.fighter1_ids[rows])
+        own_name = np.where(is_fighter1, fights['Fighter1'].to_numpy(), fights['Fighter2'].to_numpy())
+        opponent_name = np.where(is_fighter1, fights['Fighter2'].to_numpy(), fights['Fighter1'].to_numpy())
+        result = fights['Result'].to_numpy()
+        outcome = np.select(
+            [result == own_name, result == opponent_name, result == 'Draw'],
+            ['Win', 'Loss', 'Draw'],
+            default='No Contest'
+        )
+        
+        return pd.DataFrame({
+            'Event Date': fights['Event Date'].to_numpy(),
+            'Event Name': fights['Event Name'].to_numpy(),
+            'Opponent': opponent_name,
+            'Opponent ID': opponent_ids,
+            'Outcome': outcome,
+            'Weight Class': fights['Weight Class'].to_numpy(),
+            'Method': fights['Method'].to_numpy(),
+            'Round': fights['Round'].to_numpy(),
+            'Time': fights['Time'].to_numpy(),
+        }, index=rows)
@@ -0,0 +1,148 @@
+"""
+On-disk columnar cache of preprocessed data frames
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (enables the Feather format)
+    HAS_ARROW = True
+except ImportError:
+    HAS_ARROW = False
+
+
+def content_hash(path) -> str:
+    """BLAKE2 digest of a file's bytes"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_cached_frame(name: str, csv_path, build: Callable[[Path], pd.DataFrame],
+                      cache_dir, code_version: str = '') -> pd.DataFrame:
+    """
+    Load a preprocessed frame from the cache, or build it from the CSV and cache it
+    
+    The cache entry is valid for the same CSV path, size and content hash
+    (the mtime is only a shortcut to skip hashing) and the same code_version,
+    which callers derive from their preprocessing code. Any mismatch or
+    unreadable entry falls back to build(csv_path).
+    """
+    csv_path = Path(csv_path)
+    cache_dir = Path(cache_dir)
+    # One entry per source file, so synthetic copies do not evict the real data
+    name = f"{name}-{hashlib.blake2b(str(csv_path.resolve()).encode(), digest_size=4).hexdigest()}"
+    manifest_path = cache_dir / f"{name}.json"
+    stat = csv_path.stat()
+    
+    manifest = _read_manifest(manifest_path)
+    if manifest and _is_current(manifest, csv_path, stat, code_version):
+        try:
+            return _read_frame(cache_dir, name, manifest)
+        except (OSError, ValueError, KeyError):
+            pass  # Damaged entry: rebuild below
+    
+    df = build(csv_path)
+    try:
+        _write_frame(df, cache_dir, name, {
+            'csv_path': str(csv_path.resolve()),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'content_hash': content_hash(csv_path),
+            'code_version': code_version,
+        })
+    except OSError:
+        pass  # Read-only deployments just skip the cache
+    return df
+
+
+def _read_manifest(manifest_path: Path) -> Optional[dict]:
+    try:
+        return json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _is_current(manifest: dict, csv_path: Path, stat: os.stat_result, code_version: str) -> bool:
+    """Whether a manifest describes the CSV as it is on disk now"""
+    if (manifest.get('csv_path') != str(csv_path.resolve())
+            or manifest.get('size') != stat.st_size
+            or manifest.get('code_version') != code_version):
+        return False
+    if manifest.get('mtime_ns') == stat.st_mtime_ns:
+        return True
+    return manifest.get('content_hash') == content_hash(csv_path)
+
+
+def _write_frame(df: pd.DataFrame, cache_dir: Path, name: str, key: dict):
+    """Write the frame, then its manifest, so readers never see a half-written entry"""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    if HAS_ARROW:
+        tmp_path = cache_dir / f"{name}.feather.tmp"
+        df.reset_index(drop=True).to_feather(tmp_path)
+        os.replace(tmp_path, cache_dir / f"{name}.feather")
+        manifest = dict(key, format='feather')
+    else:
+        manifest = dict(key, format='npy', columns=_write_columns(df, cache_dir / name))
+    
+    tmp_path = cache_dir / f"{name}.json.tmp"
+    tmp_path.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp_path, cache_dir / f"{name}.json")
+
+
+def _read_frame(cache_dir: Path, name: str, manifest: dict) -> pd.DataFrame:
+    if manifest['format'] == 'feather':
+        if not HAS_ARROW:
+            raise ValueError("Feather cache entry but pyarrow is not installed")
+        return pd.read_feather(cache_dir / f"{name}.feather")
+    return _read_columns(cache_dir / name, manifest['columns'])
+
+
+def _write_columns(df: pd.DataFrame, column_dir: Path) -> list:
+    """NumPy fallback: one .npy file (or two) per column, described in the manifest"""
+    column_dir.mkdir(parents=True, exist_ok=True)
+    columns = []
+    for i, (column, series) in enumerate(df.items()):
+        spec = {'name': column, 'file': f"col{i}", 'dtype': str(series.dtype)}
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            spec['kind'] = 'category'
+            np.save(column_dir / f"col{i}.npy", series.cat.codes.to_numpy())
+            categories = series.cat.categories
+            if not pd.api.types.is_numeric_dtype(categories.dtype):
+                categories = np.array(categories.astype(str).tolist(), dtype=str)
+            np.save(column_dir / f"col{i}.categories.npy", np.asarray(categories))
+            spec['ordered'] = bool(series.cat.ordered)
+        elif pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_datetime64_dtype(series.dtype):
+            spec['kind'] = 'array'
+            np.save(column_dir / f"col{i}.npy", series.to_numpy())
+        else:
+            spec['kind'] = 'string'
+            missing = series.isna().to_numpy()
+            np.save(column_dir / f"col{i}.npy", np.array(series.fillna('').astype(str).tolist(), dtype=str))
+            np.save(column_dir / f"col{i}.missing.npy", missing)
+        columns.append(spec)
+    return columns
+
+
+def _read_columns(column_dir: Path, columns: list) -> pd.DataFrame:
+    data = {}
+    for spec in columns:
+        values = np.load(column_dir / f"{spec['file']}.npy")
+        if spec['kind'] == 'category':
+            categories = np.load(column_dir / f"{spec['file']}.categories.npy").tolist()
+            data[spec['name']] = pd.Categorical.from_codes(values, categories, ordered=spec['ordered'])
+        elif spec['kind'] == 'array':
+            data[spec['name']] = values
+        else:
+            values = values.astype(object)
+            values[np.load(column_dir / f"{spec['file']}.missing.npy")] = np.nan
+            data[spec['name']] = pd.Series(values, dtype=spec['dtype'])
+    return pd.DataFrame(data)
@@ -0,0 +1,191 @@
+"""
+Top-k leaderboards per weight class and stance, maintained with heaps
+"""
+import copy
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from src.config.settings import LEADERBOARD_SIZE, MIN_FIGHTS_FOR_WINRATE, WEIGHT_CLASS_LBS
+
+METRICS = ['Wins', 'Win Rate', 'Total Fights']
+
+
+def fighter_divisions(fighters_df: pd.DataFrame, fighter_index) -> np.ndarray:
+    """
+    Weight class of each roster fighter
+    
+    The class of the fighter's latest bout in a standard division; fighters
+    without one get the lightest division their listed weight fits (men's
+    classes, except 115 lbs which only exists as Women's Strawweight).
+    """
+    n_roster = len(fighters_df)
+    divisions = np.full(n_roster, None, dtype=object)
+    
+    bout_classes = fighter_index.events_df['Weight Class'].to_numpy()
+    standard = pd.Series(bout_classes).isin(list(WEIGHT_CLASS_LBS)).to_numpy()
+    # Standard-division bouts per fighter in date order; keep each fighter's last one
+    kept = standard[fighter_index.rows]
+    owners = np.repeat(np.arange(fighter_index.n_fighters), np.diff(fighter_index.offsets))[kept]
+    kept_rows = fighter_index.rows[kept]
+    last = np.flatnonzero(np.r_[owners[1:] != owners[:-1], True]) if len(owners) else np.empty(0, dtype=np.int64)
+    in_roster = owners[last] < n_roster
+    divisions[owners[last][in_roster]] = bout_classes[kept_rows[last][in_roster]]
+    
+    listed = fighters_df['Weight (lbs)'].to_numpy(dtype=float)
+    limits = sorted((lbs, name) for name, lbs in WEIGHT_CLASS_LBS.items() if not name.startswith("Women's"))
+    limits = [(115, "Women's Strawweight")] + limits
+    limit_lbs = np.array([lbs for lbs, _ in limits])
+    limit_names = np.array([name for _, name in limits], dtype=object)
+    fallback = np.flatnonzero((divisions == None) & ~np.isnan(listed))  # noqa: E711
+    slot = np.minimum(np.searchsorted(limit_lbs, listed[fallback]), len(limits) - 1)
+    divisions[fallback] = limit_names[slot]
+    return divisions
+
+
+class Leaderboards:
+    """
+    Top-k fighters per metric for every weight class / stance slice
+    
+    A slice is (weight_class, stance) with None meaning "all", so each
+    fighter belongs to four slices. Every (metric, slice) keeps a min-heap of
+    its k best (value, -position) entries; a record change (with_record)
+    yields new boards that repair only the fighter's own slices. Ties rank by
+    roster order, as DataFrame.nlargest does.
+    """
+    
+    def __init__(self, fighters_df: pd.DataFrame, divisions: np.ndarray, k: int = LEADERBOARD_SIZE):
+        self.fighters_df = fighters_df
+        self.k = k
+        self.divisions = divisions
+        self.stances = fighters_df['Stance'].to_numpy(dtype=object)
+        named = set(divisions[divisions != None])  # noqa: E711
+        self.weight_classes = sorted(named, key=lambda name: (WEIGHT_CLASS_LBS[name], name))
+        self.stance_names = sorted(set(self.stances[pd.notna(self.stances)]))
+        
+        self._values = {metric: self._metric_values(metric) for metric in METRICS}
+        self._members: Dict[Tuple, np.ndarray] = self._group_slices()
+        self._heaps: Dict[Tuple, List[Tuple[float, int]]] = {}
+        self._sorted: Dict[Tuple, List[int]] = {}
+        for metric in METRICS:
+            for key in self._members:
+                self._rebuild(metric, key)
+    
+    def _metric_values(self, metric: str) -> np.ndarray:
+        """Metric per fighter; NaN marks fighters who do not qualify"""
+        values = self.fighters_df[metric].to_numpy(dtype=float, copy=True)
+        if metric == 'Win Rate':
+            values[self.fighters_df['Total Fights'].to_numpy() < MIN_FIGHTS_FOR_WINRATE] = np.nan
+        return values
+    
+    def _group_slices(self) -> Dict[Tuple, np.ndarray]:
+        """Roster positions of every (weight_class, stance) slice, wildcards included"""
+        frame = pd.DataFrame({'division': self.divisions, 'stance': self.stances})
+        slices = {(None, None): np.arange(len(frame))}
+        for column, make_key in [('division', lambda value: (value, None)),
+                                 ('stance', lambda value: (None, value))]:
+            for value, positions in frame.groupby(column, sort=False).indices.items():
+                slices[make_key(value)] = positions
+        for (division, stance), positions in frame.groupby(['division', 'stance'], sort=False).indices.items():
+            slices[(division, stance)] = positions
+        return slices
+    
+    def _slices_of(self, position: int) -> List[Tuple]:
+        """Slice keys that contain one fighter"""
+        division = self.divisions[position]
+        stance = self.stances[position] if pd.notna(self.stances[position]) else None
+        keys = [(None, None), (division, None), (None, stance), (division, stance)]
+        return [key for key in dict.fromkeys(keys) if key in self._members]
+    
+    def _rebuild(self, metric: str, key: Tuple):
+        """Recompute one board from its slice members with a partial sort"""
+        members = self._members[key]
+        values = self._values[metric][members]
+        qualified = ~np.isnan(values)
+        members, values = members[qualified], values[qualified]
+        if len(members) > self.k:
+            # Keep everything tied with the k-th value, then break ties by position
+            kth = np.partition(values, len(values) - self.k)[len(values) - self.k]
+            keep = values >= kth
+            members, values = members[keep], values[keep]
+        order = np.lexsort((members, -values))[:self.k]
+        heap = [(float(values[i]), -int(members[i])) for i in order]
+        heapq.heapify(heap)
+        self._heaps[(metric, key)] = heap
+        self._sorted.pop((metric, key), None)
+    
+    def top(self, metric: str, weight_class: Optional[str] = None, stance: Optional[str] = None) -> List[int]:
+        """Roster positions of the best fighters in one slice, best first"""
+        board = (metric, (weight_class, stance))
+        if board not in self._sorted:
+            heap = self._heaps.get(board, [])
+            self._sorted[board] = [-neg_position for _, neg_position in sorted(heap, reverse=True)]
+        return self._sorted[board]
+    
+    def table(self, metric: str, weight_class: Optional[str] = None, stance: Optional[str] = None) -> pd.DataFrame:
+        """Roster rows of one leaderboard, best first"""
+        return self.fighters_df.iloc[self.top(metric, weight_class, stance)]
+    
+    def members(self, weight_class: Optional[str] = None, stance: Optional[str] = None) -> np.ndarray:
+        """Roster positions in one slice"""
+        return self._members.get((weight_class, stance), np.empty(0, dtype=np.int64))
+    
+    def with_record(self, position: int, wins: int, losses: int, draws: int) -> 'Leaderboards':
+        """
+        Boards after one fighter's record changes; these boards and their roster frame are left as they are
+        
+        The new boards hold a roster frame with the fighter's row updated
+        (copy-on-write: only the written columns are copied) and share every
+        board the fighter is not on. A fighter entering or climbing a board is
+        a heap push or re-heapify of k entries; only a board member dropping
+        out of contention triggers a rebuild of that slice.
+        """
+        total = wins + losses + draws
+        win_rate = float(np.round(wins / total * 100, 1)) if total else 0.0
+        boards = copy.copy(self)
+        boards.fighters_df = self.fighters_df.copy(deep=False)
+        for column, value in [('Wins', wins), ('Losses', losses), ('Draws', draws),
+                              ('Total Fights', total), ('Win Rate', win_rate)]:
+            boards.fighters_df.iat[position, boards.fighters_df.columns.get_loc(column)] = value
+        boards._values = dict(self._values)
+        boards._heaps = dict(self._heaps)
+        boards._sorted = dict(self._sorted)
+        
+        new_values = {
+            'Wins': float(wins),
+            'Win Rate': win_rate if total >= MIN_FIGHTS_FOR_WINRATE else np.nan,
+            'Total Fights': float(total),
+        }
+        for metric in METRICS:
+            old_value, new_value = self._values[metric][position], new_values[metric]
+            if new_value == old_value or (np.isnan(new_value) and np.isnan(old_value)):
+                continue
+            boards._values[metric] = boards._values[metric].copy()
+            boards._values[metric][position] = new_value
+            for key in boards._slices_of(position):
+                boards._update_board(metric, key, position, old_value, new_value)
+        return boards
+    
+    def _update_board(self, metric: str, key: Tuple, position: int, old_value: float, new_value: float):
+        """Apply one fighter's value change to one board, replacing its heap rather than editing it"""
+        heap = self._heaps[(metric, key)] = list(self._heaps[(metric, key)])
+        entry = (new_value, -position)
+        on_board = [i for i, (_, neg_position) in enumerate(heap) if neg_position == -position]
+        
+        if on_board:
+            if np.isnan(new_value) or new_value < old_value:
+                # The best fighter below the board may now outrank this one
+                self._rebuild(metric, key)
+                return
+            heap[on_board[0]] = entry
+            heapq.heapify(heap)
+        elif np.isnan(new_value):
+            return
+        elif len(heap) < self.k:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+        else:
+            return
+        self._sorted.pop((metric, key), None)
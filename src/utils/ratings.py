@@ -0,0 +1,237 @@
+"""
+Chronological Elo ratings replayed from event results
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from src.config.settings import ELO_INITIAL_RATING, ELO_K_FACTOR, ELO_METHOD_WEIGHTS
+from src.utils.data_loader import method_lookup
+
+# Bumped whenever rating slots are keyed differently, so saved states are replayed instead of reused
+KEY_FORMAT = 2
+# Columns the replay depends on: event order, who fought, the result, K weight and namesake weight class
+RATED_COLUMNS = ['Event Name', 'Event Date', 'Fighter1', 'Fighter2', 'Result', 'Method', 'Weight Class']
+
+
+def fight_outcomes(events_df: pd.DataFrame):
+    """
+    Fighter1 score (1 win, 0.5 draw, 0 loss, NaN unrated) and K weight per bout
+    
+    Bouts without a winner or draw (no contests, unknown results) are NaN.
+    """
+    result = events_df['Result'].to_numpy()
+    score = np.select(
+        [result == events_df['Fighter1'].to_numpy(), result == events_df['Fighter2'].to_numpy(), result == 'Draw'],
+        [1.0, 0.0, 0.5],
+        default=np.nan
+    )
+    weight = method_lookup(events_df['Method'], ELO_METHOD_WEIGHTS, 1.0)
+    return score, weight
+
+
+def side_outcomes(score: np.ndarray, side: str) -> Dict[str, np.ndarray]:
+    """Wins, Losses, Draws and No Contests flags of one side ('Fighter1' or 'Fighter2') from fight_outcomes scores"""
+    win_score = 1.0 if side == 'Fighter1' else 0.0
+    return {
+        'Wins': score == win_score,
+        'Losses': score == 1.0 - win_score,
+        'Draws': score == 0.5,
+        'No Contests': np.isnan(score),
+    }
+
+
+def independent_batches(side1: np.ndarray, side2: np.ndarray) -> List[int]:
+    """
+    Start offsets of consecutive runs of bouts in which no fighter appears twice
+    
+    Bouts inside one run can be rated simultaneously with the exact result of
+    rating them one by one.
+    """
+    n = len(side1)
+    sides = np.r_[side1, side2]
+    bouts = np.r_[np.arange(n), np.arange(n)]
+    order = np.lexsort((bouts, sides))
+    same_fighter = np.r_[False, sides[order][1:] == sides[order][:-1]]
+    previous = np.full(2 * n, -1)
+    previous[order[same_fighter]] = bouts[order][np.flatnonzero(same_fighter) - 1]
+    last_seen = np.maximum(previous[:n], previous[n:])
+    
+    starts = [0]
+    for bout, seen in enumerate(last_seen.tolist()):
+        if seen >= starts[-1] and bout > starts[-1]:
+            starts.append(bout)
+    return starts
+
+
+class EloRatings:
+    """Elo ratings keyed by FighterIndex.unique_keys, so roster namesakes are rated apart; updated incrementally"""
+    
+    def __init__(self, k_factor: float = ELO_K_FACTOR, initial_rating: float = ELO_INITIAL_RATING):
+        self.k_factor = k_factor
+        self.initial_rating = initial_rating
+        self.method_weights = dict(ELO_METHOD_WEIGHTS)
+        self.reset()
+    
+    def reset(self):
+        """Forget every rating and the replay position"""
+        self.keys: List[str] = []
+        self.ratings = np.empty(0, dtype=np.float64)
+        self.bouts = np.empty(0, dtype=np.int32)
+        self.n_processed = 0
+        self.prefix_hash = None
+        self._slots: Dict[str, int] = {}
+    
+    def copy(self) -> 'EloRatings':
+        """Independent engine at the same ratings and replay position"""
+        other = EloRatings(self.k_factor, self.initial_rating)
+        other.method_weights = dict(self.method_weights)
+        other.keys = list(self.keys)
+        other.ratings = self.ratings.copy()
+        other.bouts = self.bouts.copy()
+        other.n_processed = self.n_processed
+        other.prefix_hash = self.prefix_hash
+        other._slots = dict(self._slots)
+        return other
+    
+    def slots_for(self, keys) -> np.ndarray:
+        """Rating slot of each fighter key, adding unseen fighters at the initial rating"""
+        slots = np.empty(len(keys), dtype=np.int64)
+        for i, key in enumerate(keys):
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._slots[key] = len(self.keys)
+                self.keys.append(key)
+            slots[i] = slot
+        if len(self.keys) > len(self.ratings):
+            grow = len(self.keys) - len(self.ratings)
+            self.ratings = np.r_[self.ratings, np.full(grow, self.initial_rating)]
+            self.bouts = np.r_[self.bouts, np.zeros(grow, dtype=np.int32)]
+        return slots
+    
+    def rate(self, slot1: np.ndarray, slot2: np.ndarray, score: np.ndarray, weight: np.ndarray):
+        """Apply bouts in order; score is Fighter1's result and NaN bouts are skipped"""
+        rated = ~np.isnan(score)
+        slot1, slot2, score, weight = slot1[rated], slot2[rated], score[rated], weight[rated]
+        ratings = self.ratings
+        
+        starts = independent_batches(slot1, slot2) + [len(slot1)]
+        for start, stop in zip(starts[:-1], starts[1:]):
+            a, b = slot1[start:stop], slot2[start:stop]
+            expected = 1.0 / (1.0 + 10.0 ** ((ratings[b] - ratings[a]) / 400.0))
+            delta = self.k_factor * weight[start:stop] * (score[start:stop] - expected)
+            ratings[a] += delta
+            ratings[b] -= delta
+        
+        np.add.at(self.bouts, slot1, 1)
+        np.add.at(self.bouts, slot2, 1)
+    
+    def update_from_events(self, events_df: pd.DataFrame, fighter_index) -> int:
+        """
+        Rate the bouts of events_df not seen yet, returning how many were processed
+        
+        events_df must be the date-sorted frame from load_events_data, so new
+        events append rows. If any already processed row changed (a
+        corrected result or method, a back-dated bout), the whole history is
+        replayed.
+        """
+        n_processed = min(self.n_processed, len(events_df))
+        processed_hash, events_hash = _prefix_hashes(events_df, n_processed)
+        if self.n_processed and (self.n_processed > len(events_df) or processed_hash != self.prefix_hash):
+            self.reset()
+        
+        new = slice(self.n_processed, len(events_df))
+        if new.start == new.stop:
+            return 0
+        
+        id_slots = self.slots_for(fighter_index.unique_keys)
+        score, weight = fight_outcomes(events_df.iloc[new])
+        self.rate(id_slots[fighter_index.fighter1_ids[new]], id_slots[fighter_index.fighter2_ids[new]],
+                  score, weight)
+        
+        self.n_processed = len(events_df)
+        self.prefix_hash = events_hash
+        return new.stop - new.start
+    
+    def for_fighters(self, fighter_index) -> pd.DataFrame:
+        """Rating and rated bout count per FighterIndex ID"""
+        slots = self.slots_for(fighter_index.unique_keys)
+        return pd.DataFrame({
+            'Fighter': fighter_index.names,
+            'Elo': self.ratings[slots].round(1),
+            'UFC Bouts': self.bouts[slots],
+        })
+    
+    def save(self, path):
+        """Persist ratings and replay position"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp.npz')
+        np.savez(tmp_path, keys=np.array(self.keys, dtype=str), ratings=self.ratings, bouts=self.bouts,
+                 meta=np.array(json.dumps({
+                     'key_format': KEY_FORMAT,
+                     'k_factor': self.k_factor,
+                     'initial_rating': self.initial_rating,
+                     'method_weights': ELO_METHOD_WEIGHTS,
+                     'n_processed': self.n_processed,
+                     'prefix_hash': self.prefix_hash,
+                 })))
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path) -> 'EloRatings':
+        """Restore ratings saved with save()"""
+        with np.load(path) as state:
+            meta = json.loads(str(state['meta']))
+            if meta.get('key_format') != KEY_FORMAT:
+                raise ValueError(f"rating keys of format {meta.get('key_format')}, expected {KEY_FORMAT}")
+            engine = cls(meta['k_factor'], meta['initial_rating'])
+            engine.keys = state['keys'].tolist()
+            engine.ratings = state['ratings'].astype(np.float64)
+            engine.bouts = state['bouts'].astype(np.int32)
+        engine._slots = {key: slot for slot, key in enumerate(engine.keys)}
+        engine.method_weights = meta['method_weights']
+        engine.n_processed = meta['n_processed']
+        engine.prefix_hash = meta['prefix_hash']
+        return engine
+
+
+def load_ratings(events_df: pd.DataFrame, fighter_index, state_path) -> EloRatings:
+    """Load persisted ratings, rate any newly appended bouts and save the result"""
+    engine = None
+    if Path(state_path).exists():
+        try:
+            engine = EloRatings.load(state_path)
+        except (OSError, ValueError, KeyError):
+            engine = None
+    # Ratings computed with other parameters cannot be extended, only replayed
+    if engine is None or (engine.k_factor, engine.initial_rating, engine.method_weights) != (
+        ELO_K_FACTOR, ELO_INITIAL_RATING, ELO_METHOD_WEIGHTS
+    ):
+        engine = EloRatings()
+    
+    if engine.update_from_events(events_df, fighter_index):
+        try:
+            engine.save(state_path)
+        except OSError:
+            pass  # Read-only deployments replay on every start
+    return engine
+
+
+def _prefix_hashes(events_df: pd.DataFrame, n_rows: int) -> Tuple[str, str]:
+    """
+    Content hashes of the first n_rows rows of events_df and of all of it, over RATED_COLUMNS
+    
+    Values are hashed, not category codes, so a frame reloaded from the CSV
+    or the frame cache hashes like the one that was rated. Rows are digested
+    in order in one pass; the prefix hash is read along the way.
+    """
+    rows = pd.util.hash_pandas_object(events_df[RATED_COLUMNS], index=False).to_numpy()
+    digest = hashlib.blake2b(rows[:n_rows].tobytes(), digest_size=16)
+    prefix = digest.hexdigest()
+    digest.update(rows[n_rows:].tobytes())
+    return prefix, digest.hexdigest()
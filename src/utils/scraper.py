@@ -0,0 +1,259 @@
+"""
+Concurrent, incremental scraper writing the fighters and events CSVs from ufcstats.com
+
+Pages are fetched by a bounded thread pool over one pooled requests
+session. Each page's ETag / Last-Modified and parsed rows are checkpointed
+to SCRAPER_STATE_PATH, so a rerun sends conditional requests (a 304 reuses
+the checkpointed rows), fight cards are not fetched again once final (see
+ufcstats.card_is_final) and an interrupted run resumes where it stopped. Entry point: scrape.py at the
+repository root.
+"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from pathlib import Path
+from typing import Callable, Collection, Dict, List, Optional, Sequence
+import json
+import os
+import threading
+import time
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from tqdm import tqdm
+from urllib3.util.retry import Retry
+from src.config.settings import (
+    FIGHTERS_CSV, EVENTS_CSV, SCRAPER_STATE_PATH, SCRAPER_BASE_URL, SCRAPER_WORKERS, SCRAPER_TIMEOUT,
+    SCRAPER_RETRIES, SCRAPER_CHECKPOINT_EVERY, SCRAPER_USER_AGENT
+)
+from src.utils.ufcstats import (
+    FIGHTER_COLUMNS, EVENT_COLUMNS, EVENTS_LIST_PATH, FIGHTERS_LIST_PATHS,
+    card_is_final, parse_events_list, parse_event_card, parse_fighters_list
+)
+
+# A bout's identity in the events CSV; rows of a card scraped before it was complete are topped up by it
+BOUT_KEY = ['Event Name', 'Event Date', 'Fighter1', 'Fighter2']
+
+
+def make_session(workers: int = SCRAPER_WORKERS, retries: int = SCRAPER_RETRIES) -> requests.Session:
+    """Session keeping up to workers connections alive, retrying connection errors, 429 and 5xx"""
+    session = requests.Session()
+    retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=frozenset(['GET']), respect_retry_after_header=True)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers, max_retries=retry, pool_block=True)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = SCRAPER_USER_AGENT
+    return session
+
+
+class ScrapeState:
+    """
+    Checkpoint of every page fetched: its validators, parsed rows and whether it was final when fetched
+    
+    Shared by the worker threads; written atomically (temp file + rename),
+    so a run killed mid-write leaves the previous checkpoint intact.
+    """
+    
+    def __init__(self, path=SCRAPER_STATE_PATH):
+        self.path = Path(path)
+        self.pages: Dict[str, dict] = {}
+        self.unsaved = 0
+        self._lock = threading.Lock()
+        if self.path.exists():
+            try:
+                self.pages = json.loads(self.path.read_text(encoding='utf-8'))['pages']
+            except (ValueError, KeyError):
+                pass  # Unreadable checkpoint: start over
+    
+    def get(self, path: str) -> Optional[dict]:
+        with self._lock:
+            return self.pages.get(path)
+    
+    def put(self, path: str, etag: Optional[str], last_modified: Optional[str], rows: List[dict],
+            final: bool = False):
+        with self._lock:
+            self.pages[path] = {'etag': etag, 'last_modified': last_modified, 'rows': rows, 'final': final}
+            self.unsaved += 1
+    
+    def save(self):
+        with self._lock:
+            text = json.dumps({'pages': self.pages})
+            self.unsaved = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        tmp_path.write_text(text, encoding='utf-8')
+        os.replace(tmp_path, self.path)
+
+
+class Scraper:
+    """
+    Fetches ufcstats.com pages concurrently, downloading only pages that changed
+    
+    stats counts requests sent, 304 responses, pages downloaded and fight
+    cards skipped without a request.
+    """
+    
+    def __init__(self, base_url: str = SCRAPER_BASE_URL, state_path=SCRAPER_STATE_PATH,
+                 workers: int = SCRAPER_WORKERS, timeout: float = SCRAPER_TIMEOUT, progress: bool = False):
+        self.base_url = base_url.rstrip('/')
+        self.workers = max(int(workers), 1)
+        self.timeout = timeout
+        self.progress = progress
+        self.session = make_session(self.workers)
+        self.state = ScrapeState(state_path)
+        self.stats = {'requests': 0, 'not_modified': 0, 'downloaded': 0, 'skipped': 0}
+        self._stats_lock = threading.Lock()
+    
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+    
+    def fetch(self, path: str, parse: Callable[[str], List[dict]], final: bool = False) -> List[dict]:
+        """
+        Parsed rows of one page, sent as a conditional request when it was fetched before
+        
+        final pages (fight cards that can no longer change) are not requested
+        again once checkpointed with rows by a final fetch; a copy fetched
+        before the page was final is requested once more.
+        """
+        cached = self.state.get(path)
+        if final and cached and cached.get('final') and cached['rows']:
+            self._count('skipped')
+            return cached['rows']
+        
+        headers = {}
+        if cached and cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached and cached['last_modified']:
+            headers['If-Modified-Since'] = cached['last_modified']
+        response = self.session.get(self.base_url + path, headers=headers, timeout=self.timeout)
+        self._count('requests')
+        if response.status_code == 304 and cached:
+            self._count('not_modified')
+            if final and not cached.get('final'):
+                self.state.put(path, cached['etag'], cached['last_modified'], cached['rows'], final)
+            return cached['rows']
+        response.raise_for_status()
+        
+        rows = parse(response.text)
+        self.state.put(path, response.headers.get('ETag'), response.headers.get('Last-Modified'), rows, final)
+        self._count('downloaded')
+        return rows
+    
+    def fetch_all(self, paths: Sequence[str], parse: Callable[[str], List[dict]], final: Collection[str] = (),
+                  desc: str = None) -> Dict[str, List[dict]]:
+        """
+        fetch() every path on the thread pool, checkpointing every SCRAPER_CHECKPOINT_EVERY pages
+        
+        Paths in final are fetched as final pages.
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool, \
+                tqdm(total=len(paths), desc=desc, disable=not self.progress) as progress:
+            futures = {pool.submit(self.fetch, path, parse, path in final): path for path in paths}
+            try:
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    progress.update()
+                    if self.state.unsaved >= SCRAPER_CHECKPOINT_EVERY:
+                        self.state.save()
+            finally:
+                # On a failed page, drop the queued ones and keep what was fetched for the next run
+                for future in futures:
+                    future.cancel()
+                self.state.save()
+        return results
+    
+    def scrape_events(self, today: Optional[date] = None) -> List[dict]:
+        """
+        Every completed bout in the events CSV layout: newest event first, each card in card order
+        
+        Cards still open on today (the upcoming event, recent dates) hold
+        the bouts fought so far and are fetched again on every run.
+        """
+        events = self.fetch(EVENTS_LIST_PATH, parse_events_list)
+        final = {event['path'] for event in events if card_is_final(event, today)}
+        cards = self.fetch_all([event['path'] for event in events], parse_event_card, final=final,
+                               desc='fight cards')
+        return [
+            {'Event Name': event['Event Name'], 'Event Date': event['Event Date'], **bout}
+            for event in events for bout in cards[event['path']]
+        ]
+    
+    def scrape_fighters(self) -> List[dict]:
+        """Every roster row in the fighters CSV layout, letter page by letter page"""
+        pages = self.fetch_all(FIGHTERS_LIST_PATHS, parse_fighters_list, desc='fighter pages')
+        return [fighter for path in FIGHTERS_LIST_PATHS for fighter in pages[path]]
+    
+    def run(self, fighters_csv=FIGHTERS_CSV, events_csv=EVENTS_CSV, rewrite: bool = False,
+            today: Optional[date] = None) -> dict:
+        """Scrape everything and bring both CSVs up to date; returns the run summary"""
+        start = time.perf_counter()
+        fighters = self.scrape_fighters()
+        bouts = self.scrape_events(today)
+        fighters_written = write_fighters_csv(fighters, fighters_csv)
+        bouts_written = write_events_csv(bouts, events_csv, rewrite)
+        return {
+            'Fighters': len(fighters),
+            'Bouts': len(bouts),
+            'Fighters Written': fighters_written,
+            'Bouts Written': bouts_written,
+            **{key.replace('_', ' ').title(): count for key, count in self.stats.items()},
+            'Seconds': round(time.perf_counter() - start, 2),
+        }
+
+
+def _csv_text(rows: List[dict], columns: List[str], header: bool = True) -> str:
+    return pd.DataFrame(rows, columns=columns).to_csv(index=False, header=header)
+
+
+def _replace_if_changed(path, text: str) -> bool:
+    """Atomically replace a file's contents unless they are already text"""
+    path = Path(path)
+    if path.exists() and path.read_text(encoding='utf-8') == text:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_text(text, encoding='utf-8')
+    os.replace(tmp_path, path)
+    return True
+
+
+def write_fighters_csv(fighters: List[dict], csv_path=FIGHTERS_CSV) -> int:
+    """Rewrite the fighters CSV if the roster changed; returns the rows written (0 if unchanged)"""
+    return len(fighters) if _replace_if_changed(csv_path, _csv_text(fighters, FIGHTER_COLUMNS)) else 0
+
+
+def write_events_csv(bouts: List[dict], csv_path=EVENTS_CSV, rewrite: bool = False) -> int:
+    """
+    Bring the events CSV up to date with scraped bouts; returns the rows written
+    
+    Bouts already in the file (by BOUT_KEY) are left as they are and new
+    ones are appended, oldest event first and in card order within an
+    event, so a running dashboard's DataStore folds them in without a full
+    reload. A card written while its event was in progress is completed by
+    a later run. rewrite=True (or a missing file) writes every bout in
+    scrape order instead, newest event first like the bundled file.
+    """
+    csv_path = Path(csv_path)
+    if rewrite or not csv_path.exists() or not csv_path.stat().st_size:
+        return len(bouts) if _replace_if_changed(csv_path, _csv_text(bouts, EVENT_COLUMNS)) else 0
+    
+    existing = pd.read_csv(csv_path, usecols=BOUT_KEY, dtype=str, keep_default_na=False)
+    known = set(existing[BOUT_KEY].itertuples(index=False, name=None))
+    new_cards: Dict[tuple, List[dict]] = {}
+    for bout in bouts:
+        if tuple(bout[column] for column in BOUT_KEY) not in known:
+            new_cards.setdefault((bout['Event Name'], bout['Event Date']), []).append(bout)
+    rows = [bout for card in reversed(list(new_cards.values())) for bout in card]
+    if not rows:
+        return 0
+    
+    with open(csv_path, 'rb') as handle:
+        handle.seek(-1, os.SEEK_END)
+        newline = '' if handle.read(1) == b'\n' else '\n'
+    # One write of whole lines, so a concurrent refresh never sees half a bout
+    with open(csv_path, 'a', encoding='utf-8', newline='') as handle:
+        handle.write(newline + _csv_text(rows, EVENT_COLUMNS, header=False))
+    return len(rows)
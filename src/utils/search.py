@@ -1,18 +1,154 @@
 """
 Advanced search utilities for fighter lookup
 """
+import numpy as np
 import pandas as pd
 from difflib import SequenceMatcher, get_close_matches
-from typing import List, Tuple
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Tuple
 import re
+import threading
+from src.config.settings import AUTOCOMPLETE_DEPTH, SEARCH_CACHE_SIZE
+
+
+NAME_FIELDS = ['First Name', 'Last Name', 'Nickname', 'Full Name']
+MATCH_FIELDS = ['First Name', 'Last Name', 'Nickname']
+
+# (fighter positions, scores, strategy name) for one query
+SearchHit = Tuple[List[int], List[float], str]
+
+SearchCacheInfo = namedtuple('SearchCacheInfo', ['hits', 'misses', 'evictions', 'size', 'capacity'])
 
 
 class FighterSearch:
     """Advanced fighter search with multiple matching strategies"""
     
-    def __init__(self, fighters_df: pd.DataFrame):
+    def __init__(self, fighters_df: pd.DataFrame, cache_size: int = SEARCH_CACHE_SIZE):
         self.fighters_df = fighters_df
+        self.cache_size = cache_size
+        self._lock = threading.RLock()
+        self._result_cache: OrderedDict = OrderedDict()
+        self._cache_hits = self._cache_misses = self._cache_evictions = 0
+        self._build_indexes()
+    
+    def __getstate__(self):
+        # Locks cannot be pickled; process pool workers get a fresh one
+        state = self.__dict__.copy()
+        del state['_lock']
+        state['_result_cache'] = OrderedDict()
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+    
+    def _data_version(self) -> tuple:
+        """Identity of the indexed data: the frame object, its length and loader version"""
+        return (id(self.fighters_df), len(self.fighters_df), self.fighters_df.attrs.get('data_version'))
+    
+    def _build_indexes(self):
+        """(Re)build every lookup structure for the current fighters_df"""
+        self._version = self._data_version()
+        self._fuzzy_cache: Tuple[str, Dict[int, float]] = ('', {})
+        self._matchers: Dict[int, SequenceMatcher] = {}
+        self._result_cache.clear()
+        self._build_name_index()
+        self._build_field_index()
+        self._build_prefix_index()
+    
+    def _ensure_current(self):
+        """Rebuild indexes and drop cached results if fighters_df changed"""
+        if self._data_version() != self._version:
+            self._build_indexes()
+    
+    def cache_info(self) -> SearchCacheInfo:
+        """Hit, miss and eviction counters of the search result cache"""
+        with self._lock:
+            return SearchCacheInfo(self._cache_hits, self._cache_misses, self._cache_evictions,
+                                   len(self._result_cache), self.cache_size)
+    
+    def cache_clear(self):
+        """Empty the search result cache and reset its counters"""
+        with self._lock:
+            self._result_cache.clear()
+            self._cache_hits = self._cache_misses = self._cache_evictions = 0
+    
+    def _build_name_index(self):
+        """Index distinct lowered names with per-character counts for fuzzy filtering"""
+        # Same string conversion as a row-by-row scan would use ("nan" included)
+        self._names: List[str] = []
+        self._name_owners: List[List[int]] = []
+        name_ids: Dict[str, int] = {}
+        for field in NAME_FIELDS:
+            for pos, value in enumerate(self.fighters_df[field].tolist()):
+                name = str(value).lower()
+                name_id = name_ids.setdefault(name, len(self._names))
+                if name_id == len(self._names):
+                    self._names.append(name)
+                    self._name_owners.append([])
+                self._name_owners[name_id].append(pos)
+        
+        alphabet = sorted(set(''.join(self._names)))
+        self._char_ids = {char: i for i, char in enumerate(alphabet)}
+        self._name_lengths = np.array([len(name) for name in self._names], dtype=np.int32)
+        
+        rows = np.repeat(np.arange(len(self._names)), self._name_lengths)
+        cols = np.fromiter(
+            (self._char_ids[char] for name in self._names for char in name),
+            dtype=np.int32, count=int(self._name_lengths.sum())
+        )
+        char_counts = np.zeros((len(self._names), len(alphabet)), dtype=np.int16)
+        np.add.at(char_counts, (rows, cols), 1)
+        # One row per character over names in length order: the lengths that can reach a
+        # threshold are one contiguous slice, read once per distinct query character
+        self._length_order = np.argsort(self._name_lengths, kind='stable')
+        self._sorted_lengths = self._name_lengths[self._length_order]
+        self._char_counts = np.ascontiguousarray(char_counts[self._length_order].T)
+    
+    def _build_field_index(self):
+        """Lowered first/last/nickname lookups shared by exact, partial and token matching"""
+        exact_index: Dict[str, set] = {}
+        for field in MATCH_FIELDS:
+            for pos, value in enumerate(self.fighters_df[field].str.lower().tolist()):
+                if isinstance(value, str):
+                    exact_index.setdefault(value, set()).add(pos)
+        self._exact_index: Dict[str, List[int]] = {
+            name: sorted(owners) for name, owners in exact_index.items()
+        }
+        
+        # One newline-joined string so substring search runs in a single C-level scan
+        field_names = list(self._exact_index)
+        self._field_owners = [self._exact_index[name] for name in field_names]
+        self._field_text = '\n'.join(field_names)
+        lengths = np.array([len(name) + 1 for name in field_names], dtype=np.int64)
+        self._field_offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    
+    def _build_prefix_index(self):
+        """Map every name prefix to its most popular completions (a flattened trie)"""
+        if 'Total Fights' in self.fighters_df:
+            total_fights = self.fighters_df['Total Fights'].tolist()
+        else:
+            total_fights = (self.fighters_df['Wins'] + self.fighters_df['Losses'] + self.fighters_df['Draws']).tolist()
         
+        popularity: Dict[str, int] = {}
+        for field in NAME_FIELDS:
+            for pos, value in enumerate(self.fighters_df[field].str.lower().tolist()):
+                if isinstance(value, str) and value:
+                    popularity[value] = max(popularity.get(value, 0), total_fights[pos])
+        
+        # Most popular first, so each prefix keeps the first completions it sees
+        self._suggestion_names = sorted(popularity, key=lambda name: (-popularity[name], name))
+        self._prefix_index: Dict[str, List[str]] = {}
+        for name in self._suggestion_names:
+            # Index from every word start so "notor" completes "the notorious"
+            starts = [0] + [i + 1 for i, char in enumerate(name) if char == ' ']
+            for start in starts:
+                for end in range(start + 1, len(name) + 1):
+                    completions = self._prefix_index.setdefault(name[start:end], [])
+                    if len(completions) < AUTOCOMPLETE_DEPTH and name not in completions:
+                        completions.append(name)
+    
     def search(self, query: str, max_results: int = 10) -> pd.DataFrame:
         """
         Multi-strategy search for fighters
@@ -26,99 +162,215 @@ class FighterSearch:
         if not query or not query.strip():
             return pd.DataFrame()
         
-        query = query.strip()
-        query_lower = query.lower()
+        positions = self._cached_positions(query.strip().lower(), max_results)
+        if len(positions) == 0:
+            return pd.DataFrame()
+        return self.fighters_df.iloc[positions]
+    
+    def _cached_positions(self, query: str, max_results: int) -> np.ndarray:
+        """Result positions for a normalized query, through the LRU cache"""
+        key = (query, max_results)
+        with self._lock:
+            self._ensure_current()
+            positions = self._result_cache.get(key)
+            if positions is not None:
+                self._result_cache.move_to_end(key)
+                self._cache_hits += 1
+                return positions
+            
+            self._cache_misses += 1
+            positions = np.array(self._search_positions(query, max_results)[0], dtype=np.int32)
+            self._result_cache[key] = positions
+            if len(self._result_cache) > self.cache_size:
+                self._result_cache.popitem(last=False)
+                self._cache_evictions += 1
+            return positions
+    
+    def search_many(self, queries: Iterable[str], max_results: int = 10,
+                    workers: int = 1) -> pd.DataFrame:
+        """
+        Search a batch of names, returning one row per match
+        
+        Queries are normalized and deduplicated before searching, and with
+        workers > 1 the distinct queries are split across a process pool.
+        The result has columns Query, Rank, Fighter Index (a fighters_df
+        index label), Score and Strategy; queries without matches have no rows.
+        Score is the similarity ratio for fuzzy strategies, 1.0 for exact
+        matches and NaN for partial/token matches.
+        """
+        raw_queries = list(dict.fromkeys(q for q in queries if q and q.strip()))
+        normalized = list(dict.fromkeys(q.strip().lower() for q in raw_queries))
+        
+        if workers > 1 and len(normalized) > workers:
+            with self._lock:
+                self._ensure_current()
+            chunk_size = -(-len(normalized) // workers)
+            chunks = [normalized[i:i + chunk_size] for i in range(0, len(normalized), chunk_size)]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(self,)) as pool:
+                chunk_results = pool.map(_search_chunk, chunks, [max_results] * len(chunks))
+                results = [result for chunk in chunk_results for result in chunk]
+        else:
+            with self._lock:
+                self._ensure_current()
+                results = self._search_chunk(normalized, max_results)
+        by_query = dict(zip(normalized, results))
         
+        index_labels = self.fighters_df.index.to_numpy()
+        rows = []
+        for raw in raw_queries:
+            positions, scores, strategy = by_query[raw.strip().lower()]
+            for rank, (pos, score) in enumerate(zip(positions, scores), start=1):
+                rows.append((raw, rank, index_labels[pos], score, strategy))
+        
+        return pd.DataFrame(
+            rows, columns=['Query', 'Rank', 'Fighter Index', 'Score', 'Strategy']
+        ).astype({'Rank': 'int32', 'Score': 'float32'})
+    
+    def _search_chunk(self, queries: List[str], max_results: int) -> List[SearchHit]:
+        """Run the strategy cascade over already normalized queries"""
+        return [self._search_positions(query, max_results) for query in queries]
+    
+    def _search_positions(self, query: str, max_results: int) -> SearchHit:
+        """Strategy cascade on a lowered query, as (positions, scores, strategy)"""
         # Strategy 1: Exact match
-        exact_matches = self._exact_match(query_lower)
-        if len(exact_matches) > 0:
-            return exact_matches.head(max_results)
+        positions = self._exact_match(query)[:max_results]
+        if positions:
+            return positions, [1.0] * len(positions), 'exact'
         
         # Strategy 2: Partial match (contains)
-        partial_matches = self._partial_match(query_lower)
-        if len(partial_matches) > 0:
-            return partial_matches.head(max_results)
+        positions = self._partial_match(query)[:max_results]
+        if positions:
+            return positions, [np.nan] * len(positions), 'partial'
         
         # Strategy 3: Fuzzy match
-        fuzzy_matches = self._fuzzy_match(query_lower, threshold=0.6)
-        if len(fuzzy_matches) > 0:
-            return fuzzy_matches.head(max_results)
+        matches = self._fuzzy_match(query, threshold=0.6, limit=max_results)
+        if matches:
+            return [m[0] for m in matches], [m[1] for m in matches], 'fuzzy'
         
         # Strategy 4: Token match (any word)
-        token_matches = self._token_match(query_lower)
-        if len(token_matches) > 0:
-            return token_matches.head(max_results)
+        positions = self._token_match(query)[:max_results]
+        if positions:
+            return positions, [np.nan] * len(positions), 'token'
         
         # Strategy 5: Very loose fuzzy match
-        loose_matches = self._fuzzy_match(query_lower, threshold=0.4)
-        return loose_matches.head(max_results)
+        matches = self._fuzzy_match(query, threshold=0.4, limit=max_results)
+        return [m[0] for m in matches], [m[1] for m in matches], 'loose'
     
-    def _exact_match(self, query: str) -> pd.DataFrame:
+    def _exact_match(self, query: str) -> List[int]:
         """Exact match on first name, last name, or nickname"""
-        return self.fighters_df[
-            (self.fighters_df['First Name'].str.lower() == query) |
-            (self.fighters_df['Last Name'].str.lower() == query) |
-            (self.fighters_df['Nickname'].str.lower() == query)
-        ]
+        return self._exact_index.get(query, [])
     
-    def _partial_match(self, query: str) -> pd.DataFrame:
+    def _partial_match(self, query: str) -> List[int]:
         """Partial match - query is contained in any name field"""
-        return self.fighters_df[
-            self.fighters_df['First Name'].str.lower().str.contains(query, na=False, regex=False) |
-            self.fighters_df['Last Name'].str.lower().str.contains(query, na=False, regex=False) |
-            self.fighters_df['Nickname'].str.lower().str.contains(query, na=False, regex=False)
-        ]
+        if '\n' in query:
+            return []
+        
+        owners = set()
+        for match in re.finditer(re.escape(query), self._field_text):
+            name_id = int(np.searchsorted(self._field_offsets, match.start(), side='right')) - 1
+            owners.update(self._field_owners[name_id])
+        return sorted(owners)
     
-    def _fuzzy_match(self, query: str, threshold: float = 0.6) -> pd.DataFrame:
-        """Fuzzy match using sequence matching"""
-        matches = []
+    def _fuzzy_candidates(self, query: str, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Ids and upper bounds of names that may reach the threshold, best bound first
         
-        for idx, row in self.fighters_df.iterrows():
-            # Check similarity with each name component
-            first_name = str(row['First Name']).lower()
-            last_name = str(row['Last Name']).lower()
-            nickname = str(row['Nickname']).lower()
-            full_name = str(row['Full Name']).lower()
-            
-            # Calculate similarity scores
-            scores = [
-                SequenceMatcher(None, query, first_name).ratio(),
-                SequenceMatcher(None, query, last_name).ratio(),
-                SequenceMatcher(None, query, nickname).ratio(),
-                SequenceMatcher(None, query, full_name).ratio(),
-            ]
-            
-            max_score = max(scores)
-            
-            if max_score >= threshold:
-                matches.append((idx, max_score))
+        Bounds are, in turn, difflib's real_quick_ratio (lengths only),
+        quick_ratio (shared character counts) and the longest common
+        subsequence, so no name that SequenceMatcher would score at or above
+        threshold is dropped. The length bound selects a slice of the
+        length-sorted rows; the count bound still scans every name in that
+        slice, O(names) for mid-length queries at loose thresholds.
+        """
+        # 2 * min(n, m) / (n + m) >= threshold holds for names of length n in [m * t / (2 - t), m * (2 - t) / t]
+        length = len(query)
+        lo, hi = 0, len(self._sorted_lengths)
+        if threshold > 0:
+            lo = np.searchsorted(self._sorted_lengths, np.floor(length * threshold / (2 - threshold)), side='left')
+            hi = np.searchsorted(self._sorted_lengths, np.ceil(length * (2 - threshold) / threshold), side='right')
         
-        if matches:
-            # Sort by score descending
-            matches.sort(key=lambda x: x[1], reverse=True)
-            indices = [m[0] for m in matches]
-            return self.fighters_df.loc[indices]
+        query_ids = [self._char_ids[char] for char in query if char in self._char_ids]
+        query_chars, query_counts = np.unique(np.array(query_ids, dtype=np.int32), return_counts=True)
+        shared = np.zeros(hi - lo, dtype=np.int32)
+        for char, count in zip(query_chars.tolist(), query_counts.tolist()):
+            shared += np.minimum(self._char_counts[char, lo:hi], count)
+        upper_bound = 2.0 * shared / (self._sorted_lengths[lo:hi] + length)
+        
+        # Tighten with the LCS length, which also bounds SequenceMatcher's matches
+        char_masks = _char_masks(query)
+        candidates = []
+        for name_id in np.sort(self._length_order[lo:hi][upper_bound >= threshold]).tolist():
+            name = self._names[name_id]
+            bound = 2.0 * _lcs_length(char_masks, len(query), name) / (len(name) + len(query))
+            if bound >= threshold:
+                candidates.append((bound, name_id))
         
-        return pd.DataFrame()
+        candidates.sort(key=lambda x: -x[0])
+        return (np.array([c[1] for c in candidates], dtype=np.int64),
+                np.array([c[0] for c in candidates], dtype=np.float64))
     
-    def _token_match(self, query: str) -> pd.DataFrame:
-        """Match individual tokens/words"""
-        tokens = query.split()
-        if not tokens:
-            return pd.DataFrame()
+    def _name_ratio(self, query: str, name_id: int) -> float:
+        """SequenceMatcher ratio of query against one indexed name"""
+        # The name is the second sequence, whose analysis SequenceMatcher caches
+        matcher = self._matchers.get(name_id)
+        if matcher is None:
+            matcher = self._matchers[name_id] = SequenceMatcher(None, '', self._names[name_id])
+        matcher.set_seq1(query)
+        return matcher.ratio()
+    
+    def _fuzzy_scores(self, query: str, threshold: float, limit: int = None) -> Dict[int, float]:
+        """
+        Best similarity per fighter position, scored on candidate names only
         
-        # Find fighters where any token matches
-        mask = pd.Series([False] * len(self.fighters_df))
+        With a limit, scoring stops once `limit` fighters beat the bound of
+        every remaining name, which leaves the top `limit` matches exact.
+        """
+        cached_query, name_scores = self._fuzzy_cache
+        if query != cached_query:
+            name_scores = {}
+            self._fuzzy_cache = (query, name_scores)
         
-        for token in tokens:
-            if len(token) >= 3:  # Only match tokens with 3+ characters
-                mask |= (
-                    self.fighters_df['First Name'].str.lower().str.contains(token, na=False, regex=False) |
-                    self.fighters_df['Last Name'].str.lower().str.contains(token, na=False, regex=False) |
-                    self.fighters_df['Nickname'].str.lower().str.contains(token, na=False, regex=False)
-                )
+        name_ids, bounds = self._fuzzy_candidates(query, threshold)
+        scores: Dict[int, float] = {}
+        for i, name_id in enumerate(name_ids.tolist()):
+            if limit and i and bounds[i] < bounds[i - 1]:
+                if sum(score > bounds[i] for score in scores.values()) >= limit:
+                    break
+            ratio = name_scores.get(name_id)
+            if ratio is None:
+                ratio = name_scores[name_id] = self._name_ratio(query, name_id)
+            for pos in self._name_owners[name_id]:
+                if ratio > scores.get(pos, -1.0):
+                    scores[pos] = ratio
         
-        return self.fighters_df[mask]
+        return scores
+    
+    def _fuzzy_match(self, query: str, threshold: float = 0.6,
+                     limit: int = None) -> List[Tuple[int, float]]:
+        """Fuzzy match using sequence matching, as (position, score) best first"""
+        matches = [
+            (pos, score) for pos, score in self._fuzzy_scores(query, threshold, limit).items()
+            if score >= threshold
+        ]
+        
+        # Sort by score descending, keeping roster order for ties
+        matches.sort(key=lambda x: (-x[1], x[0]))
+        return matches[:limit]
+    
+    def _token_match(self, query: str) -> List[int]:
+        """Match individual tokens/words"""
+        positions = set()
+        for token in query.split():
+            if len(token) >= 3:  # Only match tokens with 3+ characters
+                positions.update(self._partial_match(token))
+        return sorted(positions)
+    
+    def autocomplete(self, prefix: str, n: int = 5) -> List[str]:
+        """Most popular names with a word starting with prefix (up to AUTOCOMPLETE_DEPTH)"""
+        with self._lock:
+            self._ensure_current()
+            return self._prefix_index.get(prefix.strip().lower(), [])[:n]
     
     def get_suggestions(self, query: str, n: int = 5) -> List[str]:
         """Get name suggestions based on query"""
@@ -127,19 +379,48 @@ class FighterSearch:
         
         query = query.strip().lower()
         
-        # Get all unique names
-        all_names = set()
-        all_names.update(self.fighters_df['First Name'].dropna().str.lower().tolist())
-        all_names.update(self.fighters_df['Last Name'].dropna().str.lower().tolist())
-        all_names.update(self.fighters_df['Nickname'].dropna().str.lower().tolist())
-        all_names.update(self.fighters_df['Full Name'].dropna().str.lower().tolist())
-        
-        # Get close matches
-        suggestions = get_close_matches(query, all_names, n=n, cutoff=0.3)
+        # Prefix completions, falling back to close matches for typos
+        suggestions = self.autocomplete(query, n)
+        if not suggestions:
+            with self._lock:
+                names = self._suggestion_names
+            suggestions = get_close_matches(query, names, n=n, cutoff=0.3)
         
         return suggestions
 
 
+def _char_masks(text: str) -> Dict[str, int]:
+    """Bit mask of the positions of each character in text"""
+    masks: Dict[str, int] = {}
+    for i, char in enumerate(text):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _lcs_length(char_masks: Dict[str, int], length: int, other: str) -> int:
+    """Bit-parallel longest common subsequence length (Hyyro, 2004)"""
+    full = (1 << length) - 1
+    row = full
+    for char in other:
+        matched = row & char_masks.get(char, 0)
+        row = ((row + matched) | (row - matched)) & full
+    return length - row.bit_count()
+
+
+_worker_engine = None
+
+
+def _init_worker(search_engine: FighterSearch):
+    """Process pool initializer holding one engine per worker"""
+    global _worker_engine
+    _worker_engine = search_engine
+
+
+def _search_chunk(queries: List[str], max_results: int) -> List[SearchHit]:
+    """Process pool task searching a chunk of normalized queries"""
+    return _worker_engine._search_chunk(queries, max_results)
+
+
 def highlight_match(text: str, query: str) -> str:
     """Highlight matching parts of text"""
     if not query or not text:
@@ -0,0 +1,159 @@
+"""
+Nearest-neighbor "similar fighters" index over physical, record and finish features
+"""
+from typing import Tuple
+import warnings
+
+import numpy as np
+import pandas as pd
+from src.config.settings import SIMILAR_FIGHTERS, SIMILARITY_BLOCK_ELEMENTS
+from src.utils.ratings import fight_outcomes
+
+# Strided sample size per neighbor sought when bounding the k smallest scores of a block
+SAMPLE_PER_NEIGHBOR = 1024
+
+# Standardized to zero mean and unit variance; the stance one-hot columns are appended as 0 / 1
+NUMERIC_FEATURES = ['Height (in)', 'Reach (in)', 'Weight (lbs)', 'Win Rate', 'Total Fights',
+                    'KO/TKO Rate', 'SUB Rate', 'Finished Rate']
+
+
+def finish_rates(fighter_index, n_roster: int) -> pd.DataFrame:
+    """
+    Share of each roster fighter's UFC wins by KO/TKO and by submission, and of losses by either
+    
+    Rates with no wins (or losses) to divide by are NaN.
+    """
+    events_df = fighter_index.events_df
+    score, _ = fight_outcomes(events_df)
+    method = events_df['Method'].astype(str)
+    finish = {'KO/TKO Rate': method.str.startswith('KO/TKO').to_numpy(),
+              'SUB Rate': method.str.startswith('SUB').to_numpy()}
+    
+    decided = (score == 1.0) | (score == 0.0)
+    winner = np.where(score == 1.0, fighter_index.fighter1_ids, fighter_index.fighter2_ids)[decided]
+    loser = np.where(score == 1.0, fighter_index.fighter2_ids, fighter_index.fighter1_ids)[decided]
+    n = fighter_index.n_fighters
+    
+    def share(ids, mask, total):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return (np.bincount(ids[mask], minlength=n) / total)[:n_roster]
+    
+    wins = np.bincount(winner, minlength=n)
+    losses = np.bincount(loser, minlength=n)
+    rates = {column: share(winner, is_finish[decided], wins) for column, is_finish in finish.items()}
+    finished = (finish['KO/TKO Rate'] | finish['SUB Rate'])[decided]
+    rates['Finished Rate'] = share(loser, finished, losses)
+    return pd.DataFrame(rates)
+
+
+def fighter_features(fighters_df: pd.DataFrame, fighter_index) -> pd.DataFrame:
+    """Unscaled feature rows of the roster: NUMERIC_FEATURES then one 0 / 1 column per stance"""
+    features = fighters_df[NUMERIC_FEATURES[:5]].reset_index(drop=True).astype('float64')
+    features = features.join(finish_rates(fighter_index, len(fighters_df)))
+    stances = pd.get_dummies(fighters_df['Stance'].reset_index(drop=True), prefix='Stance', dtype='float64')
+    return features.join(stances)
+
+
+def _smallest(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Column positions of the k smallest values in each row of scores, smallest first
+    
+    Equal values go to the lower column, as in a stable argsort. Wide rows
+    are not partitioned whole: the k-th smallest of a strided sample bounds
+    each row's k-th smallest from above, so only the few values at or under
+    it are sorted.
+    """
+    q, n = scores.shape
+    if n <= k:
+        return np.broadcast_to(np.arange(n), (q, n))
+    stride = n // (SAMPLE_PER_NEIGHBOR * k)
+    sample = scores[:, ::stride] if stride >= 4 else scores
+    bound = np.partition(sample, k - 1, axis=1)[:, k - 1:k]
+    rows, columns = np.nonzero(scores <= bound)
+    order = np.lexsort((scores[rows, columns], rows))
+    rows, columns = rows[order], columns[order]
+    rank = np.arange(len(rows)) - np.searchsorted(rows, rows)
+    return columns[rank < k].reshape(q, k)
+
+
+class SimilarityIndex:
+    """
+    Euclidean k-nearest-neighbor search over standardized fighter features
+    
+    Numeric features are z-scored (missing values become the mean, i.e. 0)
+    and stored with the stance one-hot columns as one contiguous float32
+    (features x fighters) matrix, column i being roster position i, so a
+    query streams each feature as one long row. Queries expand
+    |x - q|^2 = |x|^2 - 2 x.q + |q|^2 over blocks of fighters, so a batch of
+    queries is a few matrix products and memory stays bounded on any roster.
+    """
+    
+    def __init__(self, features: pd.DataFrame):
+        self.columns = list(features.columns)
+        numeric = [column for column in self.columns if column in NUMERIC_FEATURES]
+        values = features.to_numpy(dtype=np.float64, copy=True)
+        scaled = np.isin(self.columns, numeric)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # All-missing columns scale to 0 below
+            mean = np.nanmean(values[:, scaled], axis=0)
+            std = np.nanstd(values[:, scaled], axis=0)
+        values[:, scaled] = (values[:, scaled] - mean) / np.where(std > 0, std, 1.0)
+        self.matrix = np.ascontiguousarray(np.nan_to_num(values, nan=0.0).T, dtype=np.float32)
+        self.sq_norms = np.einsum('ij,ij->j', self.matrix, self.matrix)
+    
+    @classmethod
+    def build(cls, fighters_df: pd.DataFrame, fighter_index) -> 'SimilarityIndex':
+        return cls(fighter_features(fighters_df, fighter_index))
+    
+    def __len__(self) -> int:
+        return self.matrix.shape[1]
+    
+    def nearest(self, positions, k: int = SIMILAR_FIGHTERS,
+                block_elements: int = SIMILARITY_BLOCK_ELEMENTS) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The k fighters closest to each queried roster position, nearest first, excluding itself
+        
+        Returns (positions, distances) arrays of shape (len(positions), k).
+        Each block holds at most block_elements query x fighter scores; its
+        k best per query are merged into the running top k.
+        """
+        positions = np.atleast_1d(np.asarray(positions, dtype=np.int64))
+        n, q = len(self), len(positions)
+        k = max(min(k, n - 1), 0)
+        best = np.full((q, k), np.inf, dtype=np.float32)
+        best_ids = np.full((q, k), -1, dtype=np.int64)
+        if not k or not q:
+            return best_ids, best.astype(np.float64)
+        
+        queries = self.matrix[:, positions].T
+        block_size = max(block_elements // q, k + 1)
+        rows = np.arange(q)
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            # |q|^2 is the same for every candidate of a query, so ranking needs only |x|^2 - 2 x.q
+            scores = queries @ self.matrix[:, start:stop]
+            scores *= -2
+            scores += self.sq_norms[start:stop]
+            own = (positions >= start) & (positions < stop)
+            scores[rows[own], positions[own] - start] = np.inf
+            candidates = _smallest(scores, k)
+            merged = np.concatenate([best, np.take_along_axis(scores, candidates, axis=1)], axis=1)
+            merged_ids = np.concatenate([best_ids, candidates + start], axis=1)
+            # Ties go to the lower roster position, so blocking never changes the answer
+            keep = np.lexsort((merged_ids, merged), axis=1)[:, :k]
+            best = np.take_along_axis(merged, keep, axis=1)
+            best_ids = np.take_along_axis(merged_ids, keep, axis=1)
+        
+        # Exact distances of the winners, free of the cancellation in the expanded form
+        differences = self.matrix[:, best_ids] - queries.T[:, :, None]
+        distances = np.sqrt((differences.astype(np.float64) ** 2).sum(axis=0))
+        # Nearest first, equal distances in roster order
+        by_position = np.argsort(best_ids, axis=1)
+        best_ids, distances = (np.take_along_axis(array, by_position, axis=1) for array in (best_ids, distances))
+        order = np.argsort(distances, axis=1, kind='stable')
+        return np.take_along_axis(best_ids, order, axis=1), np.take_along_axis(distances, order, axis=1)
+    
+    def similar(self, position: int, k: int = SIMILAR_FIGHTERS) -> Tuple[np.ndarray, np.ndarray]:
+        """Roster positions and distances of the k fighters most like one fighter, nearest first"""
+        neighbors, distances = self.nearest([position], k)
+        return neighbors[0], distances[0]
@@ -0,0 +1,156 @@
+"""
+Page-independent aggregates shared by the dashboard pages and the batch reports
+"""
+import pandas as pd
+from typing import Dict, Optional
+from src.config.settings import CAREER_MIN_BOUTS, ELO_MIN_BOUTS, LEADERBOARD_SIZE
+
+EVENT_FIGHT_COLUMNS = ['Fighter1', 'Fighter2', 'Result', 'Weight Class', 'Method', 'Round', 'Time']
+HISTORY_COLUMNS = ['Event Date', 'Event Name', 'Opponent', 'Outcome', 'Method', 'Round', 'Time']
+RANKING_COLUMNS = {
+    'Wins': ['First Name', 'Last Name', 'Nickname', 'Wins', 'Losses', 'Draws', 'Weight', 'Win Rate'],
+    'Win Rate': ['First Name', 'Last Name', 'Nickname', 'Wins', 'Losses', 'Win Rate', 'Total Fights', 'Weight'],
+    'Total Fights': ['First Name', 'Last Name', 'Nickname', 'Total Fights', 'Wins', 'Losses', 'Win Rate', 'Weight'],
+}
+ELO_COLUMNS = ['First Name', 'Last Name', 'Nickname', 'Elo', 'UFC Bouts', 'Wins', 'Losses', 'Weight']
+CAREER_COLUMNS = ['First Name', 'Last Name', 'Nickname', 'UFC Bouts', 'Weight']
+SIMILAR_COLUMNS = ['Full Name', 'Nickname', 'Record', 'Weight', 'Height', 'Reach', 'Stance', 'Distance']
+PHYSICAL_COLUMNS = {'Height': ('Height (in)', 'in'), 'Reach': ('Reach (in)', 'in'), 'Weight': ('Weight (lbs)', 'lbs')}
+
+
+def overview(fighters_df: pd.DataFrame, events_df: pd.DataFrame) -> Dict[str, float]:
+    """Headline counts of the whole dataset"""
+    return {
+        'Total Fighters': len(fighters_df),
+        'Total Events': int(events_df['Event Name'].nunique()),
+        'Total Fights': len(events_df),
+        'Avg Wins/Fighter': float(fighters_df['Wins'].mean()),
+    }
+
+
+def weight_distribution(fighters_df: pd.DataFrame, n: int = 10) -> pd.Series:
+    """Fighter count of the n most common listed weights"""
+    counts = fighters_df['Weight (lbs)'].value_counts().head(n)
+    counts.index = [f"{lbs:g} lbs." for lbs in counts.index]
+    return counts
+
+
+def stance_distribution(fighters_df: pd.DataFrame) -> pd.Series:
+    """Fighter count per stance"""
+    counts = fighters_df['Stance'].value_counts()
+    return counts[counts > 0]
+
+
+def event_summary(event_fights: pd.DataFrame) -> dict:
+    """Totals, bout table and method / weight class breakdown of one event's fights"""
+    methods = event_fights['Method'].value_counts()
+    weight_classes = event_fights['Weight Class'].value_counts()
+    return {
+        'Event Name': str(event_fights['Event Name'].iloc[0]),
+        'Event Date': event_fights['Event Date'].iloc[0],
+        'Total Fights': len(event_fights),
+        'Total Knockdowns': int(event_fights['Fighter1 KD'].sum() + event_fights['Fighter2 KD'].sum()),
+        'Fights': event_fights[EVENT_FIGHT_COLUMNS],
+        'Methods': methods[methods > 0],
+        'Weight Classes': weight_classes[weight_classes > 0],
+    }
+
+
+def fighter_profile(fighter: pd.Series, history: Optional[pd.DataFrame] = None,
+                    elo: Optional[pd.Series] = None) -> dict:
+    """
+    Bio, career record and, when given, UFC bouts and Elo of one roster fighter
+    
+    history is a FighterIndex.history frame; elo a row of EloRatings.for_fighters.
+    """
+    total_fights = int(fighter['Wins'] + fighter['Losses'] + fighter['Draws'])
+    profile = {
+        'Name': fighter['Full Name'],
+        'Nickname': fighter['Nickname'] if pd.notna(fighter['Nickname']) else None,
+        'Height': fighter['Height'],
+        'Weight': fighter['Weight'],
+        'Reach': fighter['Reach'],
+        'Stance': fighter['Stance'] if pd.notna(fighter['Stance']) else None,
+        'Wins': int(fighter['Wins']),
+        'Losses': int(fighter['Losses']),
+        'Draws': int(fighter['Draws']),
+        'Total Fights': total_fights,
+        'Win Rate': round(float(fighter['Wins'] / total_fights * 100), 1) if total_fights > 0 else 0.0,
+    }
+    for column, _ in PHYSICAL_COLUMNS.values():
+        profile[column] = float(fighter[column]) if pd.notna(fighter[column]) else None
+    
+    if history is not None:
+        outcomes = history['Outcome'].value_counts()
+        profile['UFC Bouts'] = len(history)
+        for outcome, key in [('Win', 'UFC Wins'), ('Loss', 'UFC Losses'), ('Draw', 'UFC Draws'),
+                             ('No Contest', 'UFC No Contests')]:
+            profile[key] = int(outcomes.get(outcome, 0))
+        profile['History'] = history[HISTORY_COLUMNS]
+    if elo is not None:
+        profile['Elo'] = float(elo['Elo'])
+    return profile
+
+
+def physical_advantages(fighter1: pd.Series, fighter2: pd.Series) -> Dict[str, tuple]:
+    """Fighter1's height, reach and weight difference over fighter2 as (value or None, unit)"""
+    advantages = {}
+    for label, (column, unit) in PHYSICAL_COLUMNS.items():
+        difference = fighter1[column] - fighter2[column]
+        advantages[label] = (None if pd.isna(difference) else float(difference), unit)
+    return advantages
+
+
+def ranking_tables(leaderboards, weight_class: Optional[str] = None,
+                   stance: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+    """Display table of every leaderboard metric for one weight class / stance slice"""
+    tables = {}
+    for metric, columns in RANKING_COLUMNS.items():
+        table = leaderboards.table(metric, weight_class, stance)[columns].copy()
+        if metric == 'Wins':
+            table['Record'] = (
+                table['Wins'].astype(str) + '-' + table['Losses'].astype(str) + '-' + table['Draws'].astype(str)
+            )
+        tables[metric] = table
+    return tables
+
+
+def elo_table(fighters_df: pd.DataFrame, elo_ratings: pd.DataFrame, positions=None,
+              n: int = LEADERBOARD_SIZE) -> pd.DataFrame:
+    """
+    Highest rated roster fighters with at least ELO_MIN_BOUTS UFC bouts
+    
+    elo_ratings comes from EloRatings.for_fighters, whose first len(fighters_df)
+    rows are the roster; positions optionally restricts to some roster positions.
+    """
+    roster_ratings = elo_ratings.iloc[:len(fighters_df)]
+    if positions is not None:
+        roster_ratings = roster_ratings.iloc[positions]
+    top = roster_ratings[roster_ratings['UFC Bouts'] >= ELO_MIN_BOUTS].nlargest(n, 'Elo')
+    return top[['Elo', 'UFC Bouts']].join(fighters_df.reset_index(drop=True))[ELO_COLUMNS]
+
+
+def career_table(fighters_df: pd.DataFrame, career_stats, metric: str, positions=None,
+                 n: int = LEADERBOARD_SIZE) -> pd.DataFrame:
+    """
+    Roster fighters with the highest value of one CareerStats column and at least CAREER_MIN_BOUTS UFC bouts
+    
+    positions optionally restricts to some roster positions.
+    """
+    roster_stats = career_stats.table.iloc[:len(fighters_df)]
+    if positions is not None:
+        roster_stats = roster_stats.iloc[positions]
+    top = roster_stats[roster_stats['Bouts'] >= CAREER_MIN_BOUTS].nlargest(n, metric)
+    table = top[[metric, 'Bouts']].rename(columns={'Bouts': 'UFC Bouts'}).join(fighters_df.reset_index(drop=True))
+    table[metric] = table[metric].astype('float64').round(2)
+    return table[CAREER_COLUMNS[:3] + [metric] + CAREER_COLUMNS[3:]]
+
+
+def similar_table(fighters_df: pd.DataFrame, positions, distances) -> pd.DataFrame:
+    """Display table of fighters from SimilarityIndex.similar, nearest first"""
+    table = fighters_df.iloc[positions].copy()
+    table['Record'] = (
+        table['Wins'].astype(str) + '-' + table['Losses'].astype(str) + '-' + table['Draws'].astype(str)
+    )
+    table['Distance'] = pd.Series(distances, index=table.index).round(2)
+    return table[SIMILAR_COLUMNS]
@@ -0,0 +1,123 @@
+"""
+Finish, decision, round, knockdown and card size trends over event dates
+"""
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from src.utils.event_stream import FAMILY_NAMES, method_families
+
+# Trend rows are one period each, indexed by the period's first day
+PERIODS = ['Year', 'Quarter']
+TREND_COLUMNS = ['Fights', 'Events', 'Finish Rate', 'Decision Rate', 'Avg Rounds', 'Knockdowns per Fight',
+                 'Fights per Event']
+
+
+class TrendIndex:
+    """
+    Per-period trend series of one events frame, sliceable by weight class
+    
+    Every bout is binned once at build (year and year * 4 + quarter codes,
+    weight class code, finish / decision flags, round, knockdowns); a
+    (period, weight class) series is then a few bincounts over the matching
+    bouts, kept in a per-filter cache. Build one per data version: the
+    cache is never invalidated.
+    """
+    
+    def __init__(self, events_df: pd.DataFrame):
+        dates = events_df['Event Date']
+        years = dates.dt.year.to_numpy(dtype=np.int64)
+        self._bins = {'Year': years, 'Quarter': years * 4 + dates.dt.quarter.to_numpy(dtype=np.int64) - 1}
+        
+        weight_classes = events_df['Weight Class']
+        if not isinstance(weight_classes.dtype, pd.CategoricalDtype):
+            weight_classes = weight_classes.astype('category')
+        self._class_codes = weight_classes.cat.codes.to_numpy()
+        categories = weight_classes.cat.categories
+        present = np.bincount(self._class_codes[self._class_codes >= 0], minlength=len(categories))
+        self._class_lookup = {str(name): code for code, name in enumerate(categories)}
+        self.weight_classes = tuple(sorted(name for name, code in self._class_lookup.items() if present[code]))
+        
+        families = method_families(events_df['Method']).codes
+        self._values = {
+            'Finishes': np.isin(families, [FAMILY_NAMES.index('KO/TKO'), FAMILY_NAMES.index('Submission')]),
+            'Decisions': families == FAMILY_NAMES.index('Decision'),
+            'Rounds': events_df['Round'].to_numpy(dtype=np.int64),
+            'Knockdowns': events_df['Fighter1 KD'].to_numpy(dtype=np.int64) +
+                          events_df['Fighter2 KD'].to_numpy(dtype=np.int64),
+        }
+        self._events, event_names = pd.factorize(events_df['Event Name'])
+        self._n_events = max(len(event_names), 1)
+        self._cache: Dict = {}  # (period, weight class) -> trends table; period -> its grids
+    
+    def trends(self, period: str = 'Year', weight_class: Optional[str] = None) -> pd.DataFrame:
+        """
+        TREND_COLUMNS per period (rows indexed by the period's first day), optionally for one weight class
+        
+        Every period from the first to the last bout of the frame is a row,
+        so slices share an axis; a period without bouts has 0 fights and
+        NaN rates.
+        """
+        key = (period, weight_class)
+        table = self._cache.get(key)
+        if table is None:
+            starts, grids = self._grids(period)
+            row = 0 if weight_class is None else self._class_lookup.get(weight_class, -1) + 1
+            
+            def series(name):
+                return grids[name][row] if row > 0 or weight_class is None else np.zeros(len(starts))
+            
+            fights, events = series('Fights'), series('Events')
+            with np.errstate(invalid='ignore', divide='ignore'):
+                table = pd.DataFrame({
+                    'Fights': fights,
+                    'Events': events,
+                    'Finish Rate': series('Finishes') * 100 / fights,
+                    'Decision Rate': series('Decisions') * 100 / fights,
+                    'Avg Rounds': series('Rounds') / fights,
+                    'Knockdowns per Fight': series('Knockdowns') / fights,
+                    'Fights per Event': fights / events,
+                }, index=starts)
+            table = self._cache.setdefault(key, table)
+        return table
+    
+    def _grids(self, period: str) -> Tuple[pd.DatetimeIndex, Dict[str, np.ndarray]]:
+        """
+        Period starts and the (1 + weight classes) x periods sums of one period
+        
+        Row 0 sums every bout and row c + 1 the bouts of weight class code c.
+        Each value is one bincount over every bout, so the first filter of a
+        period computes the slices of all the others.
+        """
+        grids = self._cache.get(period)
+        if grids is None:
+            bins = self._bins[period]
+            low = int(bins.min()) if len(bins) else 0
+            n_bins = int(bins.max()) - low + 1 if len(bins) else 0
+            bins = bins - low
+            shape = (len(self._class_lookup) + 1, n_bins)
+            # Bouts without a weight class land in row 0, which is then overwritten
+            rows = self._class_codes.astype(np.int64) + 1
+            cells = rows * n_bins + bins
+            
+            def grid(cell_keys, bin_keys, weights=None):
+                sums = np.bincount(cell_keys, weights=weights, minlength=shape[0] * n_bins).reshape(shape)
+                sums[0] = np.bincount(bin_keys, weights=weights, minlength=n_bins)
+                return sums
+            
+            sums = {name: grid(cells, bins, values) for name, values in [('Fights', None), *self._values.items()]}
+            # An event falls in one period, so a cell's events are the (row, event) pairs seen, counted by period
+            seen = np.bincount(rows * self._n_events + self._events, minlength=shape[0] * self._n_events)
+            seen_rows, seen_events = np.divmod(np.flatnonzero(seen), self._n_events)
+            event_bins = np.zeros(self._n_events, dtype=np.int64)
+            event_bins[self._events] = bins
+            sums['Events'] = grid(seen_rows * n_bins + event_bins[seen_events], event_bins)
+            grids = self._cache.setdefault(period, (self._period_starts(period, low, n_bins), sums))
+        return grids
+    
+    @staticmethod
+    def _period_starts(period: str, low: int, n_bins: int) -> pd.DatetimeIndex:
+        codes = np.arange(low, low + n_bins)
+        months = codes * 12 if period == 'Year' else codes * 3
+        starts = (months - 1970 * 12).astype('datetime64[M]').astype('datetime64[ns]')
+        return pd.DatetimeIndex(starts, name=period)
@@ -0,0 +1,140 @@
+"""
+Page layout of ufcstats.com: URL paths and HTML parsers producing rows of the bundled CSV formats
+
+Parsers are pure functions of the page HTML, so they run the same on live
+pages, on the checkpointed copies and on the fixtures served by
+benchmarks/scraper_fixtures.py.
+"""
+from datetime import date, datetime, timedelta
+from string import ascii_lowercase
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from bs4 import BeautifulSoup
+from src.config.settings import SCRAPER_CARD_FINAL_DAYS
+
+FIGHTER_COLUMNS = ['First Name', 'Last Name', 'Nickname', 'Height', 'Weight', 'Reach', 'Stance',
+                   'Wins', 'Losses', 'Draws']
+EVENT_COLUMNS = ['Event Name', 'Event Date', 'Result', 'Fighter1', 'Fighter2', 'KD', 'Strikes', 'TD', 'Sub',
+                 'Weight Class', 'Method', 'Round', 'Time']
+# Columns of a fight card row, after W/L and Fighter
+CARD_STAT_COLUMNS = ['KD', 'Strikes', 'TD', 'Sub']
+
+EVENTS_LIST_PATH = '/statistics/events/completed?page=all'
+# Result written for a no contest (ufcstats flags it "nc")
+NO_CONTEST_RESULT = 'Unknown'
+
+
+def fighters_list_path(letter: str) -> str:
+    """Path of the roster page of fighters whose last name starts with letter"""
+    return f'/statistics/fighters?char={letter}&page=all'
+
+
+FIGHTERS_LIST_PATHS = [fighters_list_path(letter) for letter in ascii_lowercase]
+
+
+def _path(url: str) -> str:
+    """Path (and query) of a link, so pages resolve against whatever base URL is scraped"""
+    parts = urlsplit(url)
+    return parts.path + (f'?{parts.query}' if parts.query else '')
+
+
+def _texts(cell) -> List[str]:
+    """Stripped text of each <p> in a table cell"""
+    return [p.get_text(strip=True) for p in cell.find_all('p')]
+
+
+def parse_events_list(html: str) -> List[Dict[str, str]]:
+    """
+    Completed events, newest first
+    
+    Each entry has Event Name, Event Date, the path of its fight card and
+    upcoming: whether the site marks it as the next event (the next.png row
+    heading the list), whose card is not fought yet or still in progress.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    events = []
+    for row in soup.select('tr.b-statistics__table-row'):
+        link = row.select_one('a.b-link')
+        date = row.select_one('span.b-statistics__date')
+        if link is None or date is None:
+            continue
+        events.append({
+            'Event Name': link.get_text(strip=True),
+            'Event Date': date.get_text(strip=True),
+            'path': _path(link['href']),
+            'upcoming': row.select_one('img[src$="next.png"]') is not None,
+        })
+    return events
+
+
+def card_is_final(event: Dict, today: Optional[date] = None) -> bool:
+    """
+    Whether an events list entry's card can no longer change
+    
+    Only once SCRAPER_CARD_FINAL_DAYS have passed since the event date, and
+    never for the upcoming event: until then bouts may still be added.
+    """
+    if event.get('upcoming', False):
+        return False
+    event_date = datetime.strptime(event['Event Date'], '%B %d, %Y').date()
+    return event_date + timedelta(days=SCRAPER_CARD_FINAL_DAYS) < (today or date.today())
+
+
+def _method(texts: List[str]) -> str:
+    """KO/TKO + Punches -> KO/TKO-Punches, as in the events CSV"""
+    method, detail = (texts + ['', ''])[:2]
+    return f"{method}-{detail.replace(' ', '-')}" if detail else method
+
+
+def _result(flag: Optional[str], fighter1: str) -> str:
+    """Result column: the winner (always listed first), Draw or the no contest marker"""
+    if flag == 'win':
+        return fighter1
+    if flag == 'draw':
+        return 'Draw'
+    return NO_CONTEST_RESULT
+
+
+def parse_event_card(html: str) -> List[Dict[str, str]]:
+    """
+    Bouts of one fight card in card order, without the Event Name / Event Date columns
+    
+    Bouts not fought yet (no result flag) are left out, so an upcoming card
+    parses to no rows.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    bouts = []
+    for row in soup.select('tbody.b-fight-details__table-body tr.b-fight-details__table-row'):
+        cells = row.find_all('td')
+        flag = row.select_one('i.b-flag__text')
+        if len(cells) < 10 or flag is None:
+            continue
+        fighters = _texts(cells[1])
+        if len(fighters) < 2:
+            continue
+        bout = {
+            'Result': _result(flag.get_text(strip=True).lower(), fighters[0]),
+            'Fighter1': fighters[0],
+            'Fighter2': fighters[1],
+        }
+        for column, cell in zip(CARD_STAT_COLUMNS, cells[2:6]):
+            bout[column] = '-'.join(_texts(cell)[:2])
+        bout['Weight Class'] = cells[6].get_text(strip=True)
+        bout['Method'] = _method(_texts(cells[7]))
+        bout['Round'] = cells[8].get_text(strip=True)
+        bout['Time'] = cells[9].get_text(strip=True)
+        bouts.append(bout)
+    return bouts
+
+
+def parse_fighters_list(html: str) -> List[Dict[str, str]]:
+    """Roster rows of one letter page, in page order"""
+    soup = BeautifulSoup(html, 'html.parser')
+    fighters = []
+    for row in soup.select('tr.b-statistics__table-row'):
+        cells = row.find_all('td')
+        if len(cells) < len(FIGHTER_COLUMNS):
+            continue  # The spacer row under the header
+        fighters.append({column: cell.get_text(strip=True) for column, cell in zip(FIGHTER_COLUMNS, cells)})
+    return fighters
@@ -0,0 +1,7 @@
+"""
+Test setup only, no fixtures: the repository root goes on sys.path so src and benchmarks import from any directory
+"""
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,26 @@
+"""
+Career stats: ID-keyed side rows agree with the name-keyed stream totals
+"""
+import numpy as np
+
+from src.config.settings import FIGHTERS_CSV, EVENTS_CSV
+from src.utils.career_stats import CareerStats, fighter_id_sides
+from src.utils.data_loader import load_fighters_data, load_events_data
+from src.utils.event_stream import fighter_sides
+from src.utils.fighter_index import FighterIndex
+
+OUTCOMES = ['Wins', 'Losses', 'Draws', 'No Contests']
+
+
+def test_id_and_name_sides_share_outcomes():
+    fighters_df = load_fighters_data(FIGHTERS_CSV, use_cache=False)
+    events_df = load_events_data(EVENTS_CSV, use_cache=False)
+    fighter_index = FighterIndex(fighters_df, events_df)
+    by_id = fighter_id_sides(events_df, fighter_index.fighter1_ids, fighter_index.fighter2_ids)
+    by_name = fighter_sides(events_df)
+    
+    # Both are the Fighter1 rows of every bout, then the Fighter2 rows
+    assert np.array_equal(by_id[OUTCOMES].to_numpy(dtype=np.int64), by_name[OUTCOMES].to_numpy())
+    assert (by_name[OUTCOMES].sum(axis=1) == 1).all()
+    table = CareerStats.build(fighter_index).table
+    assert table[OUTCOMES].to_numpy().sum() == len(by_id)
@@ -0,0 +1,72 @@
+"""
+Data loader: preprocessing helpers and the frame cache
+"""
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.config.settings import FIGHTERS_CSV, EVENTS_CSV
+from src.utils import data_loader
+from src.utils.data_loader import _build_events, _build_fighters, append_events, load_events_data, method_lookup
+
+N_LOADED = 500
+
+
+def raw_events():
+    """Raw events rows, oldest event first as a scraper appends them"""
+    raw = pd.read_csv(EVENTS_CSV)
+    raw['_date'] = pd.to_datetime(raw['Event Date'], format='%B %d, %Y')
+    return raw.iloc[::-1].sort_values('_date', kind='stable').drop(columns='_date')
+
+
+def as_csv_rows(frame):
+    """Rows as read_csv returns them from an appended file"""
+    return pd.read_csv(io.StringIO(frame.to_csv(index=False)))
+
+
+def test_method_lookup_matches_prefixes_per_category():
+    methods = pd.Series(['KO/TKO Punch', None, 'SUB Armbar', 'DQ', 'KO/TKO Punch'])
+    prefixes = {'KO/TKO': 2.0, 'SUB': 3.0}
+    expected = [2.0, 1.0, 3.0, 1.0, 2.0]
+    assert method_lookup(methods, prefixes, 1.0).tolist() == expected
+    assert method_lookup(methods.astype('category'), prefixes, 1.0).tolist() == expected
+    assert method_lookup(methods.iloc[:0], prefixes, 1.0).tolist() == []
+    assert method_lookup(methods, {'SUB': 1}, 0, dtype=np.int8).dtype == np.int8
+
+
+def test_cached_events_follow_round_seconds(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_loader, 'FRAME_CACHE_DIR', tmp_path)
+    cached = load_events_data(EVENTS_CSV)
+    monkeypatch.setattr(data_loader, 'ROUND_SECONDS', 240)
+    shorter = load_events_data(EVENTS_CSV)
+    pd.testing.assert_frame_equal(shorter, load_events_data(EVENTS_CSV, use_cache=False))
+    rounds = cached['Round'].to_numpy(dtype=np.int64) - 1
+    assert np.array_equal(cached['Fight Seconds'] - shorter['Fight Seconds'], rounds * 60)
+
+
+@pytest.mark.parametrize('build, csv_path', [(_build_fighters, FIGHTERS_CSV), (_build_events, EVENTS_CSV)])
+def test_compact_frame_keeps_values(build, csv_path):
+    compact, plain = build(csv_path), build(csv_path, compact=False)
+    assert len(compact.columns) and set(compact.columns) <= set(plain.columns)
+    for column in compact.columns:
+        pd.testing.assert_series_equal(compact[column], plain[column], check_dtype=False, check_categorical=False)
+
+
+def test_append_events_equals_full_reload(tmp_path):
+    raw = raw_events()
+    head_csv, full_csv = tmp_path / 'head.csv', tmp_path / 'full.csv'
+    raw.iloc[:N_LOADED].to_csv(head_csv, index=False)
+    raw.to_csv(full_csv, index=False)
+    
+    appended = append_events(_build_events(head_csv), as_csv_rows(raw.iloc[N_LOADED:]))
+    pd.testing.assert_frame_equal(appended, _build_events(full_csv))
+
+
+def test_back_dated_rows_need_a_full_reload(tmp_path):
+    raw = raw_events()
+    head_csv = tmp_path / 'head.csv'
+    raw.iloc[N_LOADED:].to_csv(head_csv, index=False)
+    
+    assert append_events(_build_events(head_csv), as_csv_rows(raw.iloc[:10])) is None
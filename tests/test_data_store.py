@@ -0,0 +1,95 @@
+"""
+DataStore: snapshots stay in step with the CSV files while they are written
+"""
+import shutil
+
+import pandas as pd
+import pytest
+
+from src.config.settings import FIGHTERS_CSV, EVENTS_CSV
+from src.utils import data_loader, data_store
+from src.utils.data_store import DataStore
+from src.utils.ratings import EloRatings
+
+N_LOADED = 300
+
+
+@pytest.fixture
+def data_files(tmp_path, monkeypatch):
+    """Roster copy, an events file holding the oldest N_LOADED bouts, and the raw lines of the rest"""
+    monkeypatch.setattr(data_loader, 'FRAME_CACHE_DIR', tmp_path / 'cache')
+    raw = pd.read_csv(EVENTS_CSV)
+    raw['_date'] = pd.to_datetime(raw['Event Date'], format='%B %d, %Y')
+    raw = raw.iloc[::-1].sort_values('_date', kind='stable').drop(columns='_date').iloc[:N_LOADED + 60]
+    fighters_csv, events_csv = tmp_path / 'fighters.csv', tmp_path / 'events.csv'
+    shutil.copy(FIGHTERS_CSV, fighters_csv)
+    raw.iloc[:N_LOADED].to_csv(events_csv, index=False)
+    later = raw.iloc[N_LOADED:].to_csv(index=False).split('\n', 1)[1].splitlines(keepends=True)
+    return fighters_csv, events_csv, later
+
+
+def open_store(fighters_csv, events_csv, tmp_path):
+    return DataStore(fighters_csv, events_csv, tmp_path / 'elo.npz', refresh_seconds=0)
+
+
+def assert_matches_file(store, events_csv):
+    expected = data_loader.load_events_data(events_csv, use_cache=False)
+    pd.testing.assert_frame_equal(store.snapshot.events_df.reset_index(drop=True), expected.reset_index(drop=True))
+
+
+def test_rows_appended_while_loading_are_applied_later(data_files, tmp_path, monkeypatch):
+    fighters_csv, events_csv, later = data_files
+    load = data_loader.load_events_data
+    chunks = iter([later[:20], later[20:40], later[40:]])
+    
+    def load_then_append(path, *args, **kwargs):
+        # A writer appends a few rows just after each parse
+        df = load(path, *args, **kwargs)
+        with open(path, 'a') as handle:
+            handle.writelines(next(chunks, []))
+        return df
+    
+    monkeypatch.setattr(data_store, 'load_events_data', load_then_append)
+    store = open_store(fighters_csv, events_csv, tmp_path)
+    store.refresh()
+    assert len(store.snapshot.events_df) > N_LOADED
+    assert_matches_file(store, events_csv)
+
+
+def test_partial_last_line_is_read_once_complete(data_files, tmp_path):
+    fighters_csv, events_csv, later = data_files
+    line = later[0]
+    with open(events_csv, 'a') as handle:
+        handle.write(line[:len(line) // 2])
+    
+    store = open_store(fighters_csv, events_csv, tmp_path)
+    assert len(store.snapshot.events_df) == N_LOADED
+    with open(events_csv, 'a') as handle:
+        handle.write(line[len(line) // 2:])
+    assert store.refresh()
+    assert len(store.snapshot.events_df) == N_LOADED + 1
+    assert_matches_file(store, events_csv)
+
+
+def test_failed_refresh_leaves_ratings_unchanged(data_files, tmp_path, monkeypatch):
+    fighters_csv, events_csv, later = data_files
+    store = open_store(fighters_csv, events_csv, tmp_path)
+    with open(events_csv, 'a') as handle:
+        handle.writelines(later)
+    
+    def fail(*args, **kwargs):
+        raise RuntimeError("build step failed")
+    
+    build = data_store.SimilarityIndex.build
+    monkeypatch.setattr(data_store.SimilarityIndex, 'build', fail)
+    with pytest.raises(RuntimeError):
+        store.refresh()
+    assert len(store.snapshot.events_df) == N_LOADED
+    assert store._elo.n_processed == N_LOADED
+    monkeypatch.setattr(data_store.SimilarityIndex, 'build', build)
+    assert store.refresh()
+    
+    snapshot = store.snapshot
+    expected = EloRatings()
+    expected.update_from_events(snapshot.events_df, snapshot.fighter_index)
+    pd.testing.assert_frame_equal(snapshot.elo_ratings, expected.for_fighters(snapshot.fighter_index))
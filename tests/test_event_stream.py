@@ -0,0 +1,43 @@
+"""
+Event stream: totals streamed at any chunk size equal the totals of the whole loaded frame
+"""
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from src.config.settings import EVENTS_CSV
+from src.utils.data_loader import load_events_data
+from src.utils.event_stream import EventAggregates, stream_event_aggregates
+
+
+@pytest.fixture(scope='module')
+def small_csv(tmp_path_factory):
+    """
+    The bouts of the three busiest fighters, few enough to stream a row at a time
+    
+    Each of them recurs across many chunks, and a few cards hold two of
+    their bouts, so both the fighter and the event totals are merged.
+    """
+    events = pd.read_csv(EVENTS_CSV)
+    busiest = pd.concat([events['Fighter1'], events['Fighter2']]).value_counts().index[:3]
+    path = tmp_path_factory.mktemp('events') / 'busiest.csv'
+    events[events['Fighter1'].isin(busiest) | events['Fighter2'].isin(busiest)].to_csv(path, index=False)
+    return path
+
+
+def assert_streams_like_frame(csv_path, chunksize):
+    streamed = stream_event_aggregates(csv_path, chunksize)
+    loaded = EventAggregates.from_frame(load_events_data(csv_path, use_cache=False))
+    assert streamed.n_rows == loaded.n_rows
+    assert streamed.n_chunks == -(-streamed.n_rows // chunksize)
+    assert_frame_equal(streamed.event_totals(), loaded.event_totals())
+    assert_frame_equal(streamed.fighter_totals(), loaded.fighter_totals())
+
+
+def test_one_row_chunks(small_csv):
+    assert_streams_like_frame(small_csv, 1)
+
+
+@pytest.mark.parametrize('chunksize', [997, 1_000_000])
+def test_chunk_sizes(chunksize):
+    assert_streams_like_frame(EVENTS_CSV, chunksize)
@@ -0,0 +1,97 @@
+"""
+Fight graph: bidirectional win chains and incremental appends against plain Python references
+"""
+from collections import deque
+
+import numpy as np
+import pytest
+
+from src.utils.fight_graph import FightGraph
+
+SCORES = np.array([1.0, 0.0, 0.5, np.nan])
+
+
+def random_bouts(rng, n_fighters, n_bouts):
+    """Bouts between distinct fighters, Fighter1 scores drawn from wins, losses, draws and no contests"""
+    fighter1 = rng.integers(n_fighters, size=n_bouts)
+    fighter2 = (fighter1 + rng.integers(1, n_fighters, size=n_bouts)) % n_fighters
+    return fighter1, fighter2, SCORES[rng.integers(len(SCORES), size=n_bouts)]
+
+
+def beaten_lists(fighter1, fighter2, score, n_fighters):
+    beaten = [set() for _ in range(n_fighters)]
+    for a, b, s in zip(fighter1.tolist(), fighter2.tolist(), score.tolist()):
+        if s == 1:
+            beaten[a].add(b)
+        elif s == 0:
+            beaten[b].add(a)
+    return beaten
+
+
+def bfs_distance(beaten, start, goal):
+    """Number of wins in the shortest chain from start to goal, or None"""
+    distance = {start: 0}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        if node == goal:
+            return distance[node]
+        for nxt in beaten[node]:
+            if nxt not in distance:
+                distance[nxt] = distance[node] + 1
+                queue.append(nxt)
+    return None
+
+
+def entries(offsets, columns, node):
+    """One node's CSR entries as a sorted list of tuples, so entry order within a node does not matter"""
+    span = slice(offsets[node], offsets[node + 1])
+    return sorted(zip(*(column[span].tolist() for column in columns)))
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_win_path_matches_plain_bfs(seed):
+    rng = np.random.default_rng(seed)
+    n_fighters = int(rng.integers(2, 60))
+    fighter1, fighter2, score = random_bouts(rng, n_fighters, int(rng.integers(0, 3 * n_fighters)))
+    graph = FightGraph(fighter1, fighter2, score, n_fighters)
+    beaten = beaten_lists(fighter1, fighter2, score, n_fighters)
+    
+    for a, b in rng.integers(n_fighters, size=(25, 2)).tolist():
+        rows = [row for row, (x, y) in enumerate(zip(fighter1.tolist(), fighter2.tolist())) if {x, y} == {a, b}]
+        assert graph.head_to_head(a, b).tolist() == rows
+        
+        path = graph.win_path(a, b)
+        expected = bfs_distance(beaten, a, b)
+        if expected is None:
+            assert path is None
+        else:
+            assert len(path) == expected + 1 and path[0] == a and path[-1] == b
+            assert all(loser in beaten[winner] for winner, loser in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_appended_equals_one_build(seed):
+    rng = np.random.default_rng(seed)
+    n_old = int(rng.integers(2, 40))
+    n_new = n_old + int(rng.integers(0, 10))
+    old = random_bouts(rng, n_old, int(rng.integers(0, 80)))
+    new = random_bouts(rng, n_new, int(rng.integers(0, 40)))
+    
+    appended = FightGraph(*old, n_old).appended(*new, n_new)
+    built = FightGraph(*(np.r_[a, b] for a, b in zip(old, new)), n_new)
+    
+    assert (appended.n_fighters, appended.n_fights) == (built.n_fighters, built.n_fights)
+    adjacencies = [('opponent_offsets', ['opponents', 'opponent_results', 'opponent_rows']),
+                   ('win_offsets', ['beaten', 'win_rows']), ('loss_offsets', ['beaten_by'])]
+    for offsets, columns in adjacencies:
+        assert np.array_equal(getattr(appended, offsets), getattr(built, offsets))
+        for node in range(n_new):
+            assert (entries(getattr(appended, offsets), [getattr(appended, c) for c in columns], node)
+                    == entries(getattr(built, offsets), [getattr(built, c) for c in columns], node))
+    for a, b in rng.integers(n_new, size=(25, 2)).tolist():
+        assert appended.head_to_head(a, b).tolist() == built.head_to_head(a, b).tolist()
+        path = appended.win_path(a, b)
+        assert (path is None) == (built.win_path(a, b) is None)
+        if path is not None:
+            assert len(path) == len(built.win_path(a, b))
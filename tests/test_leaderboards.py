@@ -0,0 +1,55 @@
+"""
+Leaderboards: every board matches DataFrame.nlargest over its slice, before and after record changes
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.config.settings import FIGHTERS_CSV, EVENTS_CSV, MIN_FIGHTS_FOR_WINRATE
+from src.utils.data_loader import load_fighters_data, load_events_data
+from src.utils.fighter_index import FighterIndex
+from src.utils.leaderboards import METRICS, Leaderboards, fighter_divisions
+
+
+@pytest.fixture(scope='module')
+def boards():
+    fighters_df = load_fighters_data(FIGHTERS_CSV, use_cache=False)
+    events_df = load_events_data(EVENTS_CSV, use_cache=False)
+    return Leaderboards(fighters_df, fighter_divisions(fighters_df, FighterIndex(fighters_df, events_df)))
+
+
+def assert_matches_nlargest(boards):
+    fighters_df = boards.fighters_df.reset_index(drop=True)
+    for weight_class in [None, *boards.weight_classes]:
+        for stance in [None, *boards.stance_names]:
+            members = fighters_df.iloc[boards.members(weight_class, stance)]
+            for metric in METRICS:
+                rows = members[members['Total Fights'] >= MIN_FIGHTS_FOR_WINRATE] if metric == 'Win Rate' else members
+                expected = rows.nlargest(boards.k, metric).index.tolist()
+                assert boards.top(metric, weight_class, stance) == expected, (metric, weight_class, stance)
+
+
+def test_boards_match_nlargest(boards):
+    assert_matches_nlargest(boards)
+
+
+def test_with_record_matches_nlargest_and_leaves_boards_unchanged(boards):
+    before = boards.fighters_df.copy()
+    tops = {metric: list(boards.top(metric)) for metric in METRICS}
+    rng = np.random.default_rng(0)
+    leaders = boards.top('Wins')
+    # Leaders falling back, outsiders climbing onto boards, and fighters dropping below the Win Rate minimum
+    changes = [(leaders[0], 0, 1, 0), (leaders[1], 5, 5, 0), (int(rng.integers(len(before))), 60, 0, 0)]
+    changes += [(int(position), *map(int, rng.integers(0, 40, size=3))) for position in
+                rng.integers(len(before), size=200)]
+    
+    updated = boards
+    for position, wins, losses, draws in changes:
+        updated = updated.with_record(position, wins, losses, draws)
+    assert_matches_nlargest(updated)
+    position, wins, losses, draws = changes[-1]
+    assert updated.fighters_df.iloc[position][['Wins', 'Losses', 'Draws']].tolist() == [wins, losses, draws]
+    
+    pd.testing.assert_frame_equal(boards.fighters_df, before)
+    assert {metric: boards.top(metric) for metric in METRICS} == tops
+    assert_matches_nlargest(boards)
@@ -0,0 +1,122 @@
+"""
+Elo ratings: namesake slots and persisted state
+"""
+import numpy as np
+import pandas as pd
+
+from src.utils.fighter_index import FighterIndex
+from src.utils.ratings import EloRatings, _prefix_hashes, load_ratings
+
+
+def roster():
+    return pd.DataFrame({
+        'Full Name': ['Mike Davis', 'Mike Davis', 'Ann Lee', 'Bo Kim'],
+        'Weight (lbs)': [155.0, 265.0, 155.0, 265.0],
+    })
+
+
+def events(rows):
+    """Events frame of (fighter1, fighter2, result, weight class) rows, one event per row"""
+    return pd.DataFrame({
+        'Event Name': [f'UFC {i}' for i in range(len(rows))],
+        'Event Date': pd.date_range('2020-01-01', periods=len(rows), freq='7D'),
+        'Fighter1': [row[0] for row in rows],
+        'Fighter2': [row[1] for row in rows],
+        'Result': [row[2] for row in rows],
+        'Weight Class': [row[3] for row in rows],
+        'Method': ['U-DEC'] * len(rows),
+    })
+
+
+def test_namesakes_are_rated_apart():
+    events_df = events([
+        ('Mike Davis', 'Ann Lee', 'Mike Davis', 'Lightweight'),
+        ('Mike Davis', 'Bo Kim', 'Bo Kim', 'Heavyweight'),
+        ('Mike Davis', 'Ann Lee', 'Mike Davis', 'Lightweight'),
+    ])
+    fighter_index = FighterIndex(roster(), events_df)
+    engine = EloRatings()
+    engine.update_from_events(events_df, fighter_index)
+    ratings = engine.for_fighters(fighter_index)
+    
+    lightweight, heavyweight = ratings.iloc[0], ratings.iloc[1]
+    assert (lightweight['UFC Bouts'], heavyweight['UFC Bouts']) == (2, 1)
+    assert lightweight['Elo'] > 1500 > heavyweight['Elo']
+    # The heavyweight's only bout is a loss to Bo Kim, rated as if it were their debut
+    assert ratings.iloc[3]['Elo'] == 1516.0
+
+
+def test_namesake_ratings_survive_save_and_load(tmp_path):
+    events_df = events([
+        ('Mike Davis', 'Ann Lee', 'Mike Davis', 'Lightweight'),
+        ('Bo Kim', 'Mike Davis', 'Mike Davis', 'Heavyweight'),
+    ])
+    fighter_index = FighterIndex(roster(), events_df)
+    engine = EloRatings()
+    engine.update_from_events(events_df, fighter_index)
+    engine.save(tmp_path / 'elo.npz')
+    
+    restored = EloRatings.load(tmp_path / 'elo.npz')
+    pd.testing.assert_frame_equal(restored.for_fighters(fighter_index), engine.for_fighters(fighter_index))
+    assert np.array_equal(restored.for_fighters(fighter_index)['UFC Bouts'], [1, 1, 1, 1])
+
+
+def fresh_ratings(events_df, fighter_index):
+    engine = EloRatings()
+    engine.update_from_events(events_df, fighter_index)
+    return engine.for_fighters(fighter_index)
+
+
+def test_edited_earlier_row_replays_saved_state(tmp_path):
+    events_df = events([
+        ('Mike Davis', 'Ann Lee', 'Mike Davis', 'Lightweight'),
+        ('Bo Kim', 'Mike Davis', 'Mike Davis', 'Heavyweight'),
+        ('Ann Lee', 'Mike Davis', 'Ann Lee', 'Lightweight'),
+    ])
+    state_path = tmp_path / 'elo.npz'
+    load_ratings(events_df, FighterIndex(roster(), events_df), state_path)
+    
+    # A corrected result in the first row, the last row unchanged
+    corrected = events_df.copy()
+    corrected.loc[0, 'Result'] = 'Ann Lee'
+    fighter_index = FighterIndex(roster(), corrected)
+    engine = load_ratings(corrected, fighter_index, state_path)
+    assert engine.n_processed == len(corrected)
+    pd.testing.assert_frame_equal(engine.for_fighters(fighter_index), fresh_ratings(corrected, fighter_index))
+
+
+def test_edited_method_replays():
+    events_df = events([
+        ('Mike Davis', 'Ann Lee', 'Mike Davis', 'Lightweight'),
+        ('Bo Kim', 'Mike Davis', 'Mike Davis', 'Heavyweight'),
+    ])
+    engine = EloRatings()
+    engine.update_from_events(events_df, FighterIndex(roster(), events_df))
+    
+    corrected = events_df.copy()
+    corrected.loc[0, 'Method'] = 'KO/TKO'
+    fighter_index = FighterIndex(roster(), corrected)
+    assert engine.update_from_events(corrected, fighter_index) == len(corrected)
+    pd.testing.assert_frame_equal(engine.for_fighters(fighter_index), fresh_ratings(corrected, fighter_index))
+
+
+def test_appended_rows_extend_without_replay():
+    events_df = events([
+        ('Mike Davis', 'Ann Lee', 'Mike Davis', 'Lightweight'),
+        ('Bo Kim', 'Mike Davis', 'Mike Davis', 'Heavyweight'),
+        ('Ann Lee', 'Mike Davis', 'Ann Lee', 'Lightweight'),
+    ])
+    head = events_df.iloc[:2]
+    engine = EloRatings()
+    engine.update_from_events(head, FighterIndex(roster(), head))
+    
+    fighter_index = FighterIndex(roster(), events_df)
+    assert engine.update_from_events(events_df, fighter_index) == 1
+    pd.testing.assert_frame_equal(engine.for_fighters(fighter_index), fresh_ratings(events_df, fighter_index))
+
+
+def test_prefix_hash_ignores_categorical_storage():
+    events_df = events([('Mike Davis', 'Ann Lee', 'Mike Davis', 'Lightweight')])
+    categorical = events_df.astype({column: 'category' for column in ['Event Name', 'Fighter1', 'Fighter2',
+                                                                      'Result', 'Method', 'Weight Class']})
+    assert _prefix_hashes(events_df, 1) == _prefix_hashes(categorical, 1)
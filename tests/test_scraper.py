@@ -0,0 +1,76 @@
+"""
+Scraper: cards scraped while their event is in progress are completed by later runs
+"""
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from benchmarks.scraper_fixtures import (
+    FixtureServer, event_path, page_file, render_event_card, render_site, write_site
+)
+from src.config.settings import FIGHTERS_CSV, EVENTS_CSV
+from src.utils.scraper import BOUT_KEY, Scraper
+from src.utils.ufcstats import card_is_final
+
+TODAY = date(2023, 4, 15)
+LIVE_EVENT, LIVE_DATE = 'UFC Fight Night: Stand-In', TODAY.strftime('%B %d, %Y')
+
+
+@pytest.fixture
+def site(tmp_path):
+    """Pages of one finished card and a live card dated TODAY, the events CSV holding only the finished one"""
+    events = pd.read_csv(EVENTS_CSV, dtype=str, keep_default_na=False)
+    finished = events[events['Event Name'] == events['Event Name'].iat[0]]
+    live = events[events['Event Name'] == 'UFC 286: Edwards vs. Usman 3'].copy()
+    live['Event Name'], live['Event Date'] = LIVE_EVENT, LIVE_DATE
+    fighters = pd.read_csv(FIGHTERS_CSV, dtype=str, keep_default_na=False).iloc[:40]
+    
+    fighters_csv, site_csv = tmp_path / 'site_fighters.csv', tmp_path / 'site_events.csv'
+    fighters.to_csv(fighters_csv, index=False)
+    pd.concat([live, finished]).to_csv(site_csv, index=False)
+    write_site(tmp_path / 'site', render_site(fighters_csv, site_csv))
+    finished.to_csv(tmp_path / 'events.csv', index=False)
+    return tmp_path, live
+
+
+def run(server, tmp_path, today):
+    scraper = Scraper(server.base_url, tmp_path / 'state.json', workers=2)
+    return scraper.run(tmp_path / 'fighters.csv', tmp_path / 'events.csv', today=today)
+
+
+def live_bouts(tmp_path):
+    events = pd.read_csv(tmp_path / 'events.csv', dtype=str, keep_default_na=False)
+    return events[events['Event Name'] == LIVE_EVENT]
+
+
+def test_card_is_final_after_its_date():
+    event = {'Event Date': LIVE_DATE, 'upcoming': False}
+    assert not card_is_final(event, TODAY)
+    assert not card_is_final(event, TODAY + timedelta(days=1))
+    assert card_is_final(event, TODAY + timedelta(days=2))
+    assert not card_is_final({**event, 'upcoming': True}, TODAY + timedelta(days=2))
+
+
+def test_partial_card_is_completed_by_a_later_run(site):
+    tmp_path, live = site
+    card_file = page_file(tmp_path / 'site', event_path(LIVE_EVENT, LIVE_DATE))
+    complete = card_file.read_text(encoding='utf-8')
+    # Mid-event the card lists the prelims fought so far, the bottom of the card
+    card_file.write_text(render_event_card(live.iloc[-5:]), encoding='utf-8')
+    
+    with FixtureServer(tmp_path / 'site') as server:
+        assert run(server, tmp_path, TODAY)['Bouts Written'] == 5
+        card_file.write_text(complete, encoding='utf-8')
+        assert run(server, tmp_path, TODAY)['Bouts Written'] == len(live) - 5
+        
+        written = live_bouts(tmp_path)
+        assert not written.duplicated(BOUT_KEY).any()
+        assert set(written.itertuples(index=False)) == set(live.itertuples(index=False))
+        
+        # Once past its date the card is fetched one last time, then never again
+        later = TODAY + timedelta(days=2)
+        final_run = run(server, tmp_path, later)
+        assert final_run['Bouts Written'] == 0 and final_run['Skipped'] == 1
+        assert run(server, tmp_path, later)['Skipped'] == 2
+    assert len(live_bouts(tmp_path)) == len(live)
@@ -0,0 +1,27 @@
+"""
+Fighter search: fuzzy candidate bounds never drop a name SequenceMatcher would accept
+"""
+from difflib import SequenceMatcher
+
+import numpy as np
+import pytest
+
+from src.config.settings import FIGHTERS_CSV
+from src.utils.data_loader import load_fighters_data
+from src.utils.search import FighterSearch
+
+
+@pytest.fixture(scope='module')
+def search():
+    return FighterSearch(load_fighters_data(FIGHTERS_CSV, use_cache=False))
+
+
+@pytest.mark.parametrize('query', ['jon', 'izzy', 'conor mcgreggor', 'khabib nurmagomedv', 'xyzq', 'a'])
+@pytest.mark.parametrize('threshold', [0.6, 0.4])
+def test_fuzzy_candidates_keep_every_match(search, query, threshold):
+    name_ids, bounds = search._fuzzy_candidates(query, threshold)
+    ratios = np.array([SequenceMatcher(None, query, name).ratio() for name in search._names])
+    
+    assert set(np.flatnonzero(ratios >= threshold)) <= set(name_ids.tolist())
+    assert (bounds >= ratios[name_ids] - 1e-12).all()
+    assert (np.diff(bounds) <= 0).all()
@@ -0,0 +1,49 @@
+"""
+Similarity index: blocked, pruned k-nearest search against a brute-force argsort
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils import similarity
+from src.utils.similarity import SimilarityIndex, _smallest
+
+
+def brute_force(index, position, k):
+    """k nearest by exact distance over the scaled matrix, equal distances in roster order"""
+    matrix = index.matrix.T.astype(np.float64)
+    distances = np.sqrt(((matrix - matrix[position]) ** 2).sum(axis=1))
+    distances[position] = np.inf
+    order = np.argsort(distances, kind='stable')[:k]
+    return order, distances[order]
+
+
+@pytest.fixture(scope='module')
+def tied_index():
+    """20,000 fighters, each a copy of one of 40 prototypes, so nearly every distance is tied"""
+    rng = np.random.default_rng(0)
+    prototypes = rng.standard_normal((40, 6))
+    rows = prototypes[rng.integers(len(prototypes), size=20_000)]
+    return SimilarityIndex(pd.DataFrame(rows, columns=[f'Feature {i}' for i in range(6)]))
+
+
+@pytest.mark.parametrize('block_elements', [64, 3_000, 50 * 15_000, 1 << 22])
+@pytest.mark.parametrize('k', [1, 3, 8])
+def test_nearest_matches_brute_force(tied_index, block_elements, k):
+    # 50 queries over 15,000-wide blocks are sampled and pruned; 64 and 3,000 leave blocks too narrow to
+    positions = np.concatenate([[0, 19_999], np.random.default_rng(2).choice(20_000, 48, replace=False)])
+    ids, distances = tied_index.nearest(positions, k, block_elements=block_elements)
+    for row, position in enumerate(positions.tolist()):
+        expected_ids, expected_distances = brute_force(tied_index, position, k)
+        assert ids[row].tolist() == expected_ids.tolist()
+        assert np.allclose(distances[row], expected_distances)
+
+
+def test_smallest_breaks_ties_by_column():
+    rng = np.random.default_rng(1)
+    k = 3
+    for width in (4 * similarity.SAMPLE_PER_NEIGHBOR * k, 100):  # Sampled bound, then exact
+        scores = rng.integers(0, 50, size=(4, width)).astype(np.float32)
+        chosen = _smallest(scores, k)
+        for row in range(len(scores)):
+            assert chosen[row].tolist() == np.argsort(scores[row], kind='stable')[:k].tolist()
@@ -0,0 +1,58 @@
+"""
+Trends: every slice matches a pandas filter and groupby on the period, including empty and one-year frames
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.bench_trends import groupby_trends
+from src.config.settings import EVENTS_CSV
+from src.utils.data_loader import load_events_data
+from src.utils.trends import PERIODS, TREND_COLUMNS, TrendIndex
+
+
+@pytest.fixture(scope='module')
+def events_df():
+    return load_events_data(EVENTS_CSV, use_cache=False)
+
+
+def assert_matches_groupby(trends, events_df, period, weight_class):
+    table = trends.trends(period, weight_class)
+    assert list(table.columns) == TREND_COLUMNS
+    expected = groupby_trends(events_df, period, weight_class)
+    table = table[table['Fights'] > 0]
+    assert table.index.tolist() == expected.index.to_timestamp().tolist()
+    assert np.array_equal(table['Fights'], expected['fights'])
+    assert np.array_equal(table['Events'], expected['events'])
+    assert np.allclose(table['Finish Rate'], expected['finish'])
+    assert np.allclose(table['Decision Rate'], expected['decision'])
+    assert np.allclose(table['Avg Rounds'], expected['rounds'])
+    assert np.allclose(table['Knockdowns per Fight'], expected['knockdowns'])
+    assert np.allclose(table['Fights per Event'], expected['fights'] / expected['events'])
+
+
+@pytest.mark.parametrize('period', PERIODS)
+def test_every_slice_matches_groupby(events_df, period):
+    trends = TrendIndex(events_df)
+    for weight_class in [None, *trends.weight_classes]:
+        assert_matches_groupby(trends, events_df, period, weight_class)
+
+
+@pytest.mark.parametrize('period', PERIODS)
+def test_single_year(events_df, period):
+    year = events_df[events_df['Event Date'].dt.year == 2019]
+    trends = TrendIndex(year)
+    for weight_class in [None, *trends.weight_classes]:
+        assert_matches_groupby(trends, year, period, weight_class)
+    assert len(trends.trends(period)) == (1 if period == 'Year' else 4)
+
+
+@pytest.mark.parametrize('period', PERIODS)
+def test_empty_slices(events_df, period):
+    # A weight class with no bouts keeps the frame's periods, with no fights and no rates
+    table = TrendIndex(events_df).trends(period, 'Not A Weight Class')
+    assert len(table) == len(TrendIndex(events_df).trends(period)) and not table['Fights'].any()
+    assert table['Finish Rate'].isna().all() and table['Fights per Event'].isna().all()
+    # A frame with no bouts has no periods at all
+    table = TrendIndex(events_df.iloc[:0]).trends(period)
+    assert list(table.columns) == TREND_COLUMNS and table.empty
@@ -0,0 +1,49 @@
+"""
+ufcstats.com parsers on pages in the site's own markup (tests/fixtures/ufcstats), not rendered from the CSVs
+"""
+from pathlib import Path
+
+from src.utils.ufcstats import EVENT_COLUMNS, FIGHTER_COLUMNS, parse_event_card, parse_events_list, parse_fighters_list
+
+PAGES = Path(__file__).parent / 'fixtures' / 'ufcstats'
+
+
+def page(name):
+    return (PAGES / name).read_text(encoding='utf-8')
+
+
+def test_events_list():
+    events = parse_events_list(page('events_completed.html'))
+    # The upcoming event heads the list (next.png); its card holds only the bouts fought so far
+    assert events == [
+        {'Event Name': 'UFC Fight Night: Holloway vs. The Korean Zombie', 'Event Date': 'April 15, 2023',
+         'path': '/event-details/a9df5ae20a97b090', 'upcoming': True},
+        {'Event Name': 'UFC Fight Night: Vera vs. Sandhagen', 'Event Date': 'March 25, 2023',
+         'path': '/event-details/dc2e3e5ba6e0e2e5', 'upcoming': False},
+        {'Event Name': 'UFC 286: Edwards vs. Usman 3', 'Event Date': 'March 18, 2023',
+         'path': '/event-details/3c6976f8182d9527', 'upcoming': False},
+    ]
+
+
+def test_event_card():
+    bouts = parse_event_card(page('event_details.html'))
+    rows = [[bout[column] for column in EVENT_COLUMNS[2:]] for bout in bouts]
+    assert all(set(bout) == set(EVENT_COLUMNS[2:]) for bout in bouts)
+    assert rows == [
+        ['Leon Edwards', 'Leon Edwards', 'Kamaru Usman', '0-0', '120-87', '0-4', '0-0', 'Welterweight', 'M-DEC',
+         '5', '5:00'],
+        ['Gunnar Nelson', 'Gunnar Nelson', 'Bryan Barberena', '0-0', '10-7', '1-0', '1-0', 'Welterweight',
+         'SUB-Armbar', '1', '4:51'],
+        ['Yanal Ashmouz', 'Yanal Ashmouz', 'Sam Patterson', '0-0', '15-2', '1-0', '0-0', 'Lightweight',
+         'KO/TKO-Punches', '1', '1:15'],
+        ['Draw', 'Jai Herbert', 'Ludovit Klein', '0-0', '43-47', '1-2', '0-0', 'Lightweight', 'M-DEC', '3', '5:00'],
+    ]
+
+
+def test_fighters_list():
+    fighters = parse_fighters_list(page('fighters_a.html'))
+    assert [[fighter[column] for column in FIGHTER_COLUMNS] for fighter in fighters] == [
+        ['Tom', 'Aaron', '', '--', '155 lbs.', '--', '', '5', '3', '0'],
+        ['Danny', 'Abbadi', 'The Assassin', '5\' 11"', '155 lbs.', '--', 'Orthodox', '4', '6', '0'],
+        ['Nariman', 'Abbasov', 'Bayraktar', '5\' 8"', '155 lbs.', '66.0"', 'Orthodox', '28', '4', '0'],
+    ]